@@ -3,29 +3,181 @@ This component provides support for EdgeOS based devices.
 For more details about this component, please refer to the documentation at
 https://github.com/elad-bar/ha-EdgeOS
 """
+from __future__ import annotations
+
+from ipaddress import ip_network
 import logging
 import sys
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_START
-from homeassistant.core import HomeAssistant
-
-from .common.consts import DEFAULT_NAME, DOMAIN
-from .common.entity_descriptions import PLATFORMS
-from .managers.config_manager import ConfigManager
-from .managers.coordinator import Coordinator
-from .managers.password_manager import PasswordManager
+from homeassistant.core import HomeAssistant, ServiceCall
+import homeassistant.helpers.config_validation as cv
+
+from .common.consts import (
+    DEFAULT_NAME,
+    DOMAIN,
+    SERVICE_ATTR_CONFIG_ENTRY_ID,
+    SERVICE_ATTR_DEADBAND,
+    SERVICE_ATTR_DEADBAND_PERCENTAGE,
+    SERVICE_ATTR_ENABLED,
+    SERVICE_ATTR_ENTITY_KEY,
+    SERVICE_ATTR_HOSTNAME_PATTERN,
+    SERVICE_ATTR_INTERFACES,
+    SERVICE_ATTR_MAC_ADDRESSES,
+    SERVICE_ATTR_MIN_PUBLISH_INTERVAL,
+    SERVICE_ATTR_SUBNET,
+    SERVICE_SET_INTERFACES_STATE,
+    SERVICE_SET_MONITORED_DEVICES,
+    SERVICE_SET_PUBLISH_POLICY,
+)
+from .common.enums import EntityKeys
 from .models.exceptions import LoginError
 
+if TYPE_CHECKING:
+    from .managers.coordinator import Coordinator
+
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+SERVICE_SET_MONITORED_DEVICES_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(SERVICE_ATTR_ENABLED): cv.boolean,
+            vol.Optional(SERVICE_ATTR_MAC_ADDRESSES): vol.All(
+                cv.ensure_list, [cv.string]
+            ),
+            vol.Optional(SERVICE_ATTR_HOSTNAME_PATTERN): cv.string,
+            vol.Optional(SERVICE_ATTR_SUBNET): vol.All(
+                cv.string, lambda subnet: ip_network(subnet, strict=False)
+            ),
+            vol.Optional(SERVICE_ATTR_CONFIG_ENTRY_ID): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key(
+        SERVICE_ATTR_MAC_ADDRESSES, SERVICE_ATTR_HOSTNAME_PATTERN, SERVICE_ATTR_SUBNET
+    ),
+)
+
+SERVICE_SET_INTERFACES_STATE_SCHEMA = vol.Schema(
+    {
+        vol.Required(SERVICE_ATTR_ENABLED): cv.boolean,
+        vol.Required(SERVICE_ATTR_INTERFACES): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(SERVICE_ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+SERVICE_SET_PUBLISH_POLICY_SCHEMA = vol.Schema(
+    {
+        vol.Required(SERVICE_ATTR_ENTITY_KEY): vol.In(
+            [entity_key.value for entity_key in EntityKeys]
+        ),
+        vol.Optional(SERVICE_ATTR_DEADBAND): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(SERVICE_ATTR_DEADBAND_PERCENTAGE): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=100)
+        ),
+        vol.Optional(SERVICE_ATTR_MIN_PUBLISH_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        vol.Optional(SERVICE_ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+
+async def async_setup(hass: HomeAssistant, _config):
+    async def _async_set_monitored_devices(service_call: ServiceCall):
+        data = service_call.data
+        entry_id = data.get(SERVICE_ATTR_CONFIG_ENTRY_ID)
+
+        coordinators: dict[str, Coordinator] = hass.data.get(DOMAIN, {})
+
+        for coordinator_entry_id in coordinators:
+            if entry_id is not None and entry_id != coordinator_entry_id:
+                continue
+
+            coordinator = coordinators[coordinator_entry_id]
+
+            await coordinator.set_monitored_devices(
+                data.get(SERVICE_ATTR_ENABLED),
+                data.get(SERVICE_ATTR_MAC_ADDRESSES),
+                data.get(SERVICE_ATTR_HOSTNAME_PATTERN),
+                data.get(SERVICE_ATTR_SUBNET),
+            )
+
+    async def _async_set_interfaces_state(service_call: ServiceCall):
+        data = service_call.data
+        entry_id = data.get(SERVICE_ATTR_CONFIG_ENTRY_ID)
+
+        coordinators: dict[str, Coordinator] = hass.data.get(DOMAIN, {})
+
+        for coordinator_entry_id in coordinators:
+            if entry_id is not None and entry_id != coordinator_entry_id:
+                continue
+
+            coordinator = coordinators[coordinator_entry_id]
+
+            await coordinator.set_interfaces_state(
+                data.get(SERVICE_ATTR_ENABLED),
+                data.get(SERVICE_ATTR_INTERFACES),
+            )
+
+    async def _async_set_publish_policy(service_call: ServiceCall):
+        data = service_call.data
+        entry_id = data.get(SERVICE_ATTR_CONFIG_ENTRY_ID)
+
+        coordinators: dict[str, Coordinator] = hass.data.get(DOMAIN, {})
+
+        for coordinator_entry_id in coordinators:
+            if entry_id is not None and entry_id != coordinator_entry_id:
+                continue
+
+            coordinator = coordinators[coordinator_entry_id]
+
+            await coordinator.set_publish_policy(
+                data.get(SERVICE_ATTR_ENTITY_KEY),
+                data.get(SERVICE_ATTR_DEADBAND),
+                data.get(SERVICE_ATTR_DEADBAND_PERCENTAGE),
+                data.get(SERVICE_ATTR_MIN_PUBLISH_INTERVAL),
+            )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_MONITORED_DEVICES,
+        _async_set_monitored_devices,
+        schema=SERVICE_SET_MONITORED_DEVICES_SCHEMA,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_INTERFACES_STATE,
+        _async_set_interfaces_state,
+        schema=SERVICE_SET_INTERFACES_STATE_SCHEMA,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_PUBLISH_POLICY,
+        _async_set_publish_policy,
+        schema=SERVICE_SET_PUBLISH_POLICY_SCHEMA,
+    )
 
-async def async_setup(_hass, _config):
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up a EdgeOS component."""
+    # Heavy modules are imported on first use, platforms are forwarded by the
+    # coordinator once the first entity of each platform is discovered
+    from .managers.config_manager import ConfigManager
+    from .managers.coordinator import Coordinator
+    from .managers.password_manager import PasswordManager
+
     initialized = False
 
     try:
@@ -85,8 +237,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     await coordinator.terminate()
 
-    for platform in PLATFORMS:
-        await hass.config_entries.async_forward_entry_unload(entry, platform)
+    await hass.config_entries.async_unload_platforms(
+        entry, coordinator.loaded_platforms
+    )
 
     del hass.data[DOMAIN][entry.entry_id]
 
@@ -94,15 +247,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
 
 
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
-    """Unload a config entry."""
+    """Remove the stored data of a config entry."""
+    from .managers.config_manager import ConfigManager
+    from .managers.snapshot_manager import SnapshotManager
+
     _LOGGER.info(f"Removing {DOMAIN} integration, Entry ID: {entry.entry_id}")
 
     entry_id = entry.entry_id
 
-    coordinator: Coordinator = hass.data[DOMAIN][entry_id]
-
-    await coordinator.config_manager.remove(entry_id)
-
-    result = await async_unload_entry(hass, entry)
+    # Entry is already unloaded, its coordinator is gone and the snapshot saved
+    await ConfigManager(hass, None).remove(entry_id)
 
-    return result
+    await SnapshotManager(hass, entry_id).async_remove()
@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
@@ -9,7 +12,9 @@ from .common.base_entity import IntegrationBaseEntity, async_setup_base_entry
 from .common.consts import ATTR_ATTRIBUTES, ATTR_IS_ON
 from .common.entity_descriptions import IntegrationBinarySensorEntityDescription
 from .common.enums import DeviceTypes
-from .managers.coordinator import Coordinator
+
+if TYPE_CHECKING:
+    from .managers.coordinator import Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -1,19 +1,29 @@
+from __future__ import annotations
+
+from datetime import datetime
 import logging
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import ATTR_STATE, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import slugify
 
-from ..managers.coordinator import Coordinator
-from .consts import ADD_COMPONENT_SIGNALS, DOMAIN
+from .consts import (
+    ADD_COMPONENT_SIGNALS,
+    DOMAIN,
+    STATE_SUPPRESSED_DEADBAND,
+    STATE_SUPPRESSED_MIN_PUBLISH_INTERVAL,
+)
 from .entity_descriptions import IntegrationEntityDescription, get_entity_descriptions
 from .enums import DeviceTypes
 
+if TYPE_CHECKING:
+    from ..managers.coordinator import Coordinator
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -25,12 +35,7 @@ async def async_setup_base_entry(
     async_add_entities,
 ):
     @callback
-    def _async_handle_device(
-        entry_id: str, device_type: DeviceTypes, item_id: str | None = None
-    ):
-        if entry.entry_id != entry_id:
-            return
-
+    def _async_handle_device(device_type: DeviceTypes, item_id: str | None = None):
         try:
             coordinator = hass.data[DOMAIN][entry.entry_id]
 
@@ -58,7 +63,9 @@ async def async_setup_base_entry(
 
     for add_component_signal in ADD_COMPONENT_SIGNALS:
         entry.async_on_unload(
-            async_dispatcher_connect(hass, add_component_signal, _async_handle_device)
+            async_dispatcher_connect(
+                hass, add_component_signal.format(entry.entry_id), _async_handle_device
+            )
         )
 
 
@@ -109,6 +116,7 @@ class IntegrationBaseEntity(CoordinatorEntity):
             self._attr_unique_id = unique_id
 
             self._data = {}
+            self._last_published: float = 0
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -126,6 +134,10 @@ class IntegrationBaseEntity(CoordinatorEntity):
     def data(self) -> dict | None:
         return self._data
 
+    @property
+    def available(self) -> bool:
+        return super().available and self._local_coordinator.is_live
+
     @property
     def _is_allowed_for_monitoring(self) -> bool:
         is_allowed_for_monitoring = False
@@ -158,19 +170,42 @@ class IntegrationBaseEntity(CoordinatorEntity):
     def update_component(self, data):
         pass
 
+    def _is_refresh_required(self) -> bool:
+        return False
+
     def _handle_coordinator_update(self) -> None:
         """Fetch new state parameters for the sensor."""
         try:
+            # Restored from snapshot, keep the entity unavailable until live data arrives
+            if not self._local_coordinator.is_live:
+                return
+
             new_data = self._local_coordinator.get_data(
                 self._entity_description, self._item_id
             )
 
-            if self._data != new_data:
-                self.update_component(new_data)
+            is_refresh_required = self._is_refresh_required()
+
+            if self._data != new_data or is_refresh_required:
+                now = datetime.now().timestamp()
+                suppress_reason = (
+                    None
+                    if is_refresh_required
+                    else self._get_suppress_reason(new_data, now)
+                )
+
+                if suppress_reason is None:
+                    self.update_component(new_data)
+
+                    self._data = new_data
+                    self._last_published = now
 
-                self._data = new_data
+                    self.async_write_ha_state()
 
-                self.async_write_ha_state()
+                else:
+                    self._local_coordinator.on_state_update_suppressed(
+                        self._entity_description.key, suppress_reason
+                    )
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -179,3 +214,43 @@ class IntegrationBaseEntity(CoordinatorEntity):
             _LOGGER.error(
                 f"Failed to update {self.unique_id}, Error: {ex}, Line: {line_number}"
             )
+
+    def _get_suppress_reason(self, new_data: dict | None, now: float) -> str | None:
+        """Check deadband / min publish interval policies of the entity key."""
+        previous_state = None if self._data is None else self._data.get(ATTR_STATE)
+        state = None if new_data is None else new_data.get(ATTR_STATE)
+
+        # Policies apply to numeric states only, any change from / to unknown is published
+        if not self._is_numeric(previous_state) or not self._is_numeric(state):
+            return None
+
+        config_manager = self._local_coordinator.config_manager
+
+        (
+            deadband,
+            deadband_percentage,
+            min_publish_interval,
+        ) = config_manager.get_publish_policy(self._entity_description)
+
+        if min_publish_interval is not None:
+            elapsed = now - self._last_published
+
+            if elapsed < min_publish_interval.total_seconds():
+                return STATE_SUPPRESSED_MIN_PUBLISH_INTERVAL
+
+        change = abs(state - previous_state)
+
+        if deadband is not None and change < deadband:
+            return STATE_SUPPRESSED_DEADBAND
+
+        if deadband_percentage is not None and previous_state != 0:
+            if change < abs(previous_state) * deadband_percentage / 100:
+                return STATE_SUPPRESSED_DEADBAND
+
+        return None
+
+    @staticmethod
+    def _is_numeric(value) -> bool:
+        is_numeric = isinstance(value, (int, float)) and not isinstance(value, bool)
+
+        return is_numeric
@@ -7,6 +7,7 @@ import aiohttp
 
 from homeassistant.const import UnitOfDataRate, UnitOfInformation
 
+from .connectivity_status import ConnectivityStatus
 from .enums import (
     DeviceTypes,
     DynamicInterfaceTypes,
@@ -25,13 +26,13 @@ MANUFACTURER = "Ubiquiti"
 
 STORAGE_DATA_KEY = "key"
 
-SIGNAL_INTERFACE_ADDED = f"{DOMAIN}_INTERFACE_ADDED_SIGNAL"
-SIGNAL_DEVICE_ADDED = f"{DOMAIN}_DEVICE_ADDED_SIGNAL"
-SIGNAL_SYSTEM_ADDED = f"{DOMAIN}_SYSTEM_ADDED_SIGNAL"
-SIGNAL_DATA_CHANGED = f"{DOMAIN}_DATA_CHANGED_SIGNAL"
-
-SIGNAL_WS_STATUS = f"{DOMAIN}_WS_STATUS_SIGNAL"
-SIGNAL_API_STATUS = f"{DOMAIN}_API_STATUS_SIGNAL"
+# Entry scoped, formatted with the config entry ID
+SIGNAL_INTERFACE_ADDED = f"{DOMAIN}_INTERFACE_ADDED_SIGNAL_{{}}"
+SIGNAL_DEVICE_ADDED = f"{DOMAIN}_DEVICE_ADDED_SIGNAL_{{}}"
+SIGNAL_SYSTEM_ADDED = f"{DOMAIN}_SYSTEM_ADDED_SIGNAL_{{}}"
+SIGNAL_DATA_CHANGED = f"{DOMAIN}_DATA_CHANGED_SIGNAL_{{}}"
+SIGNAL_WS_STATUS = f"{DOMAIN}_WS_STATUS_SIGNAL_{{}}"
+SIGNAL_API_STATUS = f"{DOMAIN}_API_STATUS_SIGNAL_{{}}"
 
 ADD_COMPONENT_SIGNALS = [
     SIGNAL_INTERFACE_ADDED,
@@ -41,6 +42,36 @@ ADD_COMPONENT_SIGNALS = [
 
 MAXIMUM_RECONNECT = 3
 CONFIGURATION_FILE = f"{DOMAIN}.config.json"
+CONFIGURATION_SAVE_DELAY = 10
+DATA_STORAGE_MANAGER = f"{DOMAIN}_storage_manager"
+DATA_HUB = f"{DOMAIN}_hub"
+HUB_POLL_STAGGER_INTERVAL = timedelta(seconds=3)
+
+SNAPSHOT_FILE = f"{DOMAIN}.{{}}.snapshot.json"
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_INTERVAL = timedelta(minutes=5)
+
+CAPTURE_DIRECTORY = DOMAIN
+CAPTURE_FILE = "{}.capture.gz"
+CAPTURE_FLUSH_INTERVAL = timedelta(seconds=10)
+CAPTURE_MAX_BUFFER_SIZE = 1024 * 1024
+CAPTURE_MAX_FILE_SIZE = 10 * 1024 * 1024
+CAPTURE_MAX_FILES = 5
+# Timestamp, source, name length, payload length
+CAPTURE_RECORD_HEADER = "<dBHI"
+
+# Interface state changes requested within the interval are committed together
+INTERFACE_STATE_BATCH_INTERVAL = timedelta(milliseconds=500)
+
+TASK_API_HEARTBEAT = "api heartbeat"
+TASK_API_UPDATE = "api update"
+TASK_CAPTURE_FLUSH = "capture flush"
+TASK_CONNECT = "connect"
+TASK_DATA_CHANGED = "data changed"
+TASK_INTERFACE_STATE = "interface state"
+TASK_WEBSOCKETS_READER = "websockets reader"
+TASK_WS_CONSUMER = "websockets consumer"
+TASK_WS_HEARTBEAT = "websockets heartbeat"
 
 INVALID_TOKEN_SECTION = "https://github.com/elad-bar/ha-edgeos#invalid-token"
 
@@ -61,15 +92,42 @@ ATTR_IS_ON = "is_on"
 ATTR_LAST_ACTIVITY = "last activity"
 ATTR_HOSTNAME = "hostname"
 
+SERVICE_SET_MONITORED_DEVICES = "set_monitored_devices"
+SERVICE_SET_INTERFACES_STATE = "set_interfaces_state"
+SERVICE_SET_PUBLISH_POLICY = "set_publish_policy"
+
+SERVICE_ATTR_ENABLED = "enabled"
+SERVICE_ATTR_MAC_ADDRESSES = "mac_addresses"
+SERVICE_ATTR_HOSTNAME_PATTERN = "hostname_pattern"
+SERVICE_ATTR_SUBNET = "subnet"
+SERVICE_ATTR_INTERFACES = "interfaces"
+SERVICE_ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+SERVICE_ATTR_ENTITY_KEY = "entity_key"
+SERVICE_ATTR_DEADBAND = "deadband"
+SERVICE_ATTR_DEADBAND_PERCENTAGE = "deadband_percentage"
+SERVICE_ATTR_MIN_PUBLISH_INTERVAL = "min_publish_interval"
+
 ACTION_ENTITY_TURN_ON = "turn_on"
 ACTION_ENTITY_TURN_OFF = "turn_off"
 ACTION_ENTITY_SET_NATIVE_VALUE = "set_native_value"
 ACTION_ENTITY_SELECT_OPTION = "select_option"
 
+STATE_SUPPRESSED_DEADBAND = "deadband"
+STATE_SUPPRESSED_MIN_PUBLISH_INTERVAL = "min_publish_interval"
+
+RATE_PUBLISH_DEADBAND_PERCENTAGE = 5.0
+RATE_PUBLISH_MIN_INTERVAL = timedelta(seconds=10)
+TRAFFIC_PUBLISH_MIN_INTERVAL = timedelta(seconds=30)
+USAGE_PUBLISH_DEADBAND = 1.0
+
 WS_MAX_MSG_SIZE = 0
 DISCONNECT_INTERVAL = 5
 
 WS_RECONNECT_INTERVAL = timedelta(seconds=30)
+WS_RECONNECT_STATUSES = [ConnectivityStatus.Failed, ConnectivityStatus.NotConnected]
+WS_FAST_RECONNECT_INTERVAL = timedelta(milliseconds=500)
+# Handshake statuses of a WS session rejected by the router
+WS_SESSION_REJECTED_STATUSES = [401, 403]
 WS_TIMEOUT = timedelta(minutes=1)
 
 WS_COMPRESSION_DEFLATE = 15
@@ -77,16 +135,34 @@ WS_COMPRESSION_DEFLATE = 15
 DEFAULT_UPDATE_API_INTERVAL = timedelta(minutes=1)
 DEFAULT_UPDATE_ENTITIES_INTERVAL = timedelta(seconds=1)
 DEFAULT_CONSIDER_AWAY_INTERVAL = timedelta(minutes=3)
+DEFAULT_REMOVE_STALE_INTERVAL = timedelta(hours=1)
+MINIMUM_UPDATE_INTERVAL = timedelta(seconds=1)
 API_RECONNECT_INTERVAL = timedelta(seconds=30)
-HEARTBEAT_INTERVAL = timedelta(seconds=25)
+API_VALIDATION_TIMEOUT = timedelta(seconds=15)
+API_REACHABILITY_TIMEOUT = timedelta(seconds=3)
+API_RECONNECT_MAX_INTERVAL = timedelta(minutes=5)
+API_RECONNECT_STATUSES = [
+    ConnectivityStatus.Failed,
+    ConnectivityStatus.Disconnected,
+    ConnectivityStatus.NotFound,
+]
+WS_HEARTBEAT_INTERVAL = timedelta(seconds=25)
+API_HEARTBEAT_INTERVAL = timedelta(seconds=30)
 
 STORAGE_DATA_MONITORED_INTERFACES = "monitored-interfaces"
 STORAGE_DATA_MONITORED_DEVICES = "monitored-devices"
 STORAGE_DATA_LOG_INCOMING_MESSAGES = "log-incoming-messages"
+STORAGE_DATA_CAPTURE_DATA = "capture-data"
 STORAGE_DATA_CONSIDER_AWAY_INTERVAL = "consider-away-interval"
 STORAGE_DATA_UPDATE_ENTITIES_INTERVAL = "update-entities-interval"
 STORAGE_DATA_UPDATE_API_INTERVAL = "update-api-interval"
 STORAGE_DATA_UNIT = "unit"
+STORAGE_DATA_REMOVE_STALE_INTERVAL = "remove-stale-interval"
+STORAGE_DATA_PUBLISH_POLICIES = "publish-policies"
+
+PUBLISH_POLICY_DEADBAND = "deadband"
+PUBLISH_POLICY_DEADBAND_PERCENTAGE = "deadband-percentage"
+PUBLISH_POLICY_MIN_PUBLISH_INTERVAL = "min-publish-interval"
 
 API_DATA_LAST_UPDATE = "lastUpdate"
 
@@ -95,6 +171,7 @@ API_DATA_SYSTEM = "system"
 API_DATA_INTERFACES = "interfaces"
 API_DATA_SESSION_ID = "session-id"
 API_DATA_COOKIES = "cookies"
+API_DATA_PAYLOAD_SIZES = "payload-sizes"
 
 API_DATA_SAVE = "SAVE"
 
@@ -112,6 +189,8 @@ API_URL_HEARTBEAT = "{base_url}?_={timestamp}"
 API_URL_DATA = "{base_url}/api/edge/{action}.json"
 API_URL_DATA_SUBSET = f"{API_URL_DATA}?data={{subset}}"
 
+API_STREAM_CHUNK_SIZE = 64 * 1024
+
 TRUE_STR = "true"
 FALSE_STR = "false"
 
@@ -126,6 +205,13 @@ DATA_SYSTEM_SYSTEM = "system"
 DATA_SYSTEM_SERVICE = "service"
 DATA_SYSTEM_SERVICE_DHCP_SERVER = "dhcp-server"
 
+# Sub trees of the configuration (get.json) used by the processors
+API_DATA_SYSTEM_PATHS = [
+    [DATA_SYSTEM_SYSTEM],
+    [API_DATA_INTERFACES],
+    [DATA_SYSTEM_SERVICE, DATA_SYSTEM_SERVICE_DHCP_SERVER],
+]
+
 DHCP_SERVER_LEASES = "dhcp-server-leases"
 DHCP_SERVER_STATS = "dhcp-server-stats"
 DHCP_SERVER_LEASED = "leased"
@@ -143,6 +229,24 @@ WS_DISCOVER_KEY = "discover"
 
 WS_RECEIVED_MESSAGES = "received-messages"
 WS_IGNORED_MESSAGES = "ignored-messages"
+WS_DROPPED_MESSAGES = "dropped-messages"
+WS_MAILBOX_DEPTH = "mailbox-depth"
+WS_MAILBOX_MAX_DEPTH = "mailbox-max-depth"
+
+# Topics handled message by message, other topics keep only the latest message
+WS_LOSSLESS_TOPICS = [WS_DISCOVER_KEY]
+
+# Longest expected gap between frames of a topic before the WS is considered stalled
+WS_STALL_TIMEOUTS = {
+    WS_SYSTEM_STATS_KEY: timedelta(seconds=30),
+    WS_INTERFACES_KEY: timedelta(seconds=30),
+    WS_EXPORT_KEY: timedelta(seconds=90),
+}
+
+# Topics sent only for some router configurations (DPI), watched once received
+WS_OPTIONAL_TOPICS = [WS_EXPORT_KEY]
+
+WS_WATCHDOG_INTERVAL = timedelta(seconds=10)
 
 UPDATE_DATE_ENDPOINTS = [API_DATA_SYS_INFO, API_DATA_DHCP_STATS, API_DATA_DHCP_LEASES]
 
@@ -163,7 +267,15 @@ RESPONSE_ERROR_KEY = "error"
 RESPONSE_OUTPUT = "output"
 RESPONSE_FAILURE_CODE = "0"
 
+# Paths of the configuration response (get.json) parsed from the stream
+API_DATA_SYSTEM_RESPONSE_PATHS = [
+    [RESPONSE_SUCCESS_KEY],
+    [RESPONSE_ERROR_KEY],
+    *[[API_GET.upper(), *path] for path in API_DATA_SYSTEM_PATHS],
+]
+
 HEARTBEAT_MAX_AGE = 15
+HEARTBEAT_SESSION_LOST_STATUSES = [401, 403]
 
 WS_TOPIC_NAME = "name"
 WS_TOPIC_UNSUBSCRIBE = "UNSUBSCRIBE"
@@ -243,6 +355,12 @@ TRAFFIC_DATA_PACKETS = "packets"
 TRAFFIC_DATA_DROPPED = "dropped"
 TRAFFIC_DATA_LAST_ACTIVITY = "last_activity"
 TRAFFIC_DATA_LAST_ACTIVITY_IN_SECONDS = "last_activity_in_seconds"
+TRAFFIC_DATA_SMOOTHED_RATE = "smoothed_rate"
+TRAFFIC_DATA_AVERAGE_RATE = "average_rate"
+TRAFFIC_DATA_PEAK_RATE = "peak_rate"
+
+TRAFFIC_RATE_HISTORY_SIZE = 60
+TRAFFIC_RATE_SMOOTHING_FACTOR = 0.2
 
 TRAFFIC_STATS_BPS_KEY = "bps"
 TRAFFIC_STATS_BYTES = "bytes"
@@ -1,7 +1,15 @@
 from copy import copy
 from dataclasses import dataclass
+from datetime import timedelta
 
-from custom_components.edgeos.common.consts import ENTITY_VALIDATIONS, UNIT_MAPPING
+from custom_components.edgeos.common.consts import (
+    ENTITY_VALIDATIONS,
+    RATE_PUBLISH_DEADBAND_PERCENTAGE,
+    RATE_PUBLISH_MIN_INTERVAL,
+    TRAFFIC_PUBLISH_MIN_INTERVAL,
+    UNIT_MAPPING,
+    USAGE_PUBLISH_DEADBAND,
+)
 from custom_components.edgeos.common.enums import (
     DeviceTypes,
     EntityKeys,
@@ -29,6 +37,9 @@ class IntegrationEntityDescription(EntityDescription):
     platform: Platform | None = None
     device_type: DeviceTypes | None = None
     entity_validation: EntityValidation | None = None
+    deadband: float | None = None
+    deadband_percentage: float | None = None
+    min_publish_interval: timedelta | None = None
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -82,6 +93,7 @@ ENTITY_DESCRIPTIONS: list[IntegrationEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:chip",
         device_type=DeviceTypes.SYSTEM,
+        deadband=USAGE_PUBLISH_DEADBAND,
     ),
     IntegrationSensorEntityDescription(
         key=EntityKeys.RAM_USAGE,
@@ -89,6 +101,7 @@ ENTITY_DESCRIPTIONS: list[IntegrationEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:memory",
         device_type=DeviceTypes.SYSTEM,
+        deadband=USAGE_PUBLISH_DEADBAND,
     ),
     IntegrationBinarySensorEntityDescription(
         key=EntityKeys.FIRMWARE,
@@ -113,6 +126,12 @@ ENTITY_DESCRIPTIONS: list[IntegrationEntityDescription] = [
         icon="mdi:math-log",
         device_type=DeviceTypes.SYSTEM,
     ),
+    IntegrationSwitchEntityDescription(
+        key=EntityKeys.CAPTURE_DATA,
+        entity_category=EntityCategory.CONFIG,
+        icon="mdi:record-rec",
+        device_type=DeviceTypes.SYSTEM,
+    ),
     IntegrationNumberEntityDescription(
         key=EntityKeys.CONSIDER_AWAY_INTERVAL,
         native_max_value=600,
@@ -137,6 +156,14 @@ ENTITY_DESCRIPTIONS: list[IntegrationEntityDescription] = [
         entity_category=EntityCategory.CONFIG,
         device_type=DeviceTypes.SYSTEM,
     ),
+    IntegrationNumberEntityDescription(
+        key=EntityKeys.REMOVE_STALE_INTERVAL,
+        native_max_value=86400,
+        native_min_value=0,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_category=EntityCategory.CONFIG,
+        device_type=DeviceTypes.SYSTEM,
+    ),
     IntegrationSelectEntityDescription(
         key=EntityKeys.UNIT,
         options=list(UNIT_MAPPING.keys()),
@@ -203,6 +230,8 @@ ENTITY_DESCRIPTIONS: list[IntegrationEntityDescription] = [
         icon="mdi:download-network-outline",
         device_type=DeviceTypes.INTERFACE,
         entity_validation=EntityValidation.MONITORED,
+        deadband_percentage=RATE_PUBLISH_DEADBAND_PERCENTAGE,
+        min_publish_interval=RATE_PUBLISH_MIN_INTERVAL,
     ),
     IntegrationSensorEntityDescription(
         key=EntityKeys.INTERFACE_SENT_RATE,
@@ -211,6 +240,30 @@ ENTITY_DESCRIPTIONS: list[IntegrationEntityDescription] = [
         icon="mdi:upload-network-outline",
         device_type=DeviceTypes.INTERFACE,
         entity_validation=EntityValidation.MONITORED,
+        deadband_percentage=RATE_PUBLISH_DEADBAND_PERCENTAGE,
+        min_publish_interval=RATE_PUBLISH_MIN_INTERVAL,
+    ),
+    IntegrationSensorEntityDescription(
+        key=EntityKeys.INTERFACE_RECEIVED_SMOOTHED_RATE,
+        device_class=SensorDeviceClass.DATA_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:download-network-outline",
+        device_type=DeviceTypes.INTERFACE,
+        entity_validation=EntityValidation.MONITORED,
+        deadband_percentage=RATE_PUBLISH_DEADBAND_PERCENTAGE,
+        min_publish_interval=RATE_PUBLISH_MIN_INTERVAL,
+        entity_registry_enabled_default=False,
+    ),
+    IntegrationSensorEntityDescription(
+        key=EntityKeys.INTERFACE_SENT_SMOOTHED_RATE,
+        device_class=SensorDeviceClass.DATA_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:upload-network-outline",
+        device_type=DeviceTypes.INTERFACE,
+        entity_validation=EntityValidation.MONITORED,
+        deadband_percentage=RATE_PUBLISH_DEADBAND_PERCENTAGE,
+        min_publish_interval=RATE_PUBLISH_MIN_INTERVAL,
+        entity_registry_enabled_default=False,
     ),
     IntegrationSensorEntityDescription(
         key=EntityKeys.INTERFACE_RECEIVED_TRAFFIC,
@@ -219,6 +272,7 @@ ENTITY_DESCRIPTIONS: list[IntegrationEntityDescription] = [
         icon="mdi:download-network-outline",
         device_type=DeviceTypes.INTERFACE,
         entity_validation=EntityValidation.MONITORED,
+        min_publish_interval=TRAFFIC_PUBLISH_MIN_INTERVAL,
     ),
     IntegrationSensorEntityDescription(
         key=EntityKeys.INTERFACE_SENT_TRAFFIC,
@@ -227,6 +281,7 @@ ENTITY_DESCRIPTIONS: list[IntegrationEntityDescription] = [
         icon="mdi:upload-network-outline",
         device_type=DeviceTypes.INTERFACE,
         entity_validation=EntityValidation.MONITORED,
+        min_publish_interval=TRAFFIC_PUBLISH_MIN_INTERVAL,
     ),
     IntegrationSwitchEntityDescription(
         key=EntityKeys.INTERFACE_MONITORED,
@@ -253,6 +308,8 @@ ENTITY_DESCRIPTIONS: list[IntegrationEntityDescription] = [
         icon="mdi:download-network-outline",
         device_type=DeviceTypes.DEVICE,
         entity_validation=EntityValidation.MONITORED,
+        deadband_percentage=RATE_PUBLISH_DEADBAND_PERCENTAGE,
+        min_publish_interval=RATE_PUBLISH_MIN_INTERVAL,
     ),
     IntegrationSensorEntityDescription(
         key=EntityKeys.DEVICE_SENT_RATE,
@@ -261,6 +318,30 @@ ENTITY_DESCRIPTIONS: list[IntegrationEntityDescription] = [
         icon="mdi:upload-network-outline",
         device_type=DeviceTypes.DEVICE,
         entity_validation=EntityValidation.MONITORED,
+        deadband_percentage=RATE_PUBLISH_DEADBAND_PERCENTAGE,
+        min_publish_interval=RATE_PUBLISH_MIN_INTERVAL,
+    ),
+    IntegrationSensorEntityDescription(
+        key=EntityKeys.DEVICE_RECEIVED_SMOOTHED_RATE,
+        device_class=SensorDeviceClass.DATA_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:download-network-outline",
+        device_type=DeviceTypes.DEVICE,
+        entity_validation=EntityValidation.MONITORED,
+        deadband_percentage=RATE_PUBLISH_DEADBAND_PERCENTAGE,
+        min_publish_interval=RATE_PUBLISH_MIN_INTERVAL,
+        entity_registry_enabled_default=False,
+    ),
+    IntegrationSensorEntityDescription(
+        key=EntityKeys.DEVICE_SENT_SMOOTHED_RATE,
+        device_class=SensorDeviceClass.DATA_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:upload-network-outline",
+        device_type=DeviceTypes.DEVICE,
+        entity_validation=EntityValidation.MONITORED,
+        deadband_percentage=RATE_PUBLISH_DEADBAND_PERCENTAGE,
+        min_publish_interval=RATE_PUBLISH_MIN_INTERVAL,
+        entity_registry_enabled_default=False,
     ),
     IntegrationSensorEntityDescription(
         key=EntityKeys.DEVICE_RECEIVED_TRAFFIC,
@@ -269,6 +350,7 @@ ENTITY_DESCRIPTIONS: list[IntegrationEntityDescription] = [
         icon="mdi:download-network-outline",
         device_type=DeviceTypes.DEVICE,
         entity_validation=EntityValidation.MONITORED,
+        min_publish_interval=TRAFFIC_PUBLISH_MIN_INTERVAL,
     ),
     IntegrationSensorEntityDescription(
         key=EntityKeys.DEVICE_SENT_TRAFFIC,
@@ -277,6 +359,7 @@ ENTITY_DESCRIPTIONS: list[IntegrationEntityDescription] = [
         icon="mdi:upload-network-outline",
         device_type=DeviceTypes.DEVICE,
         entity_validation=EntityValidation.MONITORED,
+        min_publish_interval=TRAFFIC_PUBLISH_MIN_INTERVAL,
     ),
     IntegrationDeviceTrackerEntityDescription(
         key=EntityKeys.DEVICE_TRACKER,
@@ -1,4 +1,4 @@
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 
 
 class DeviceTypes(StrEnum):
@@ -33,10 +33,12 @@ class EntityKeys(StrEnum):
     LAST_RESTART = "last_restart"
     UNKNOWN_DEVICES = "unknown_devices"
     LOG_INCOMING_MESSAGES = "log_incoming_messages"
+    CAPTURE_DATA = "capture_data"
     CONSIDER_AWAY_INTERVAL = "consider_away_interval"
     UPDATE_ENTITIES_INTERVAL = "update_entities_interval"
     UPDATE_API_INTERVAL = "update_api_interval"
     UNIT = "unit"
+    REMOVE_STALE_INTERVAL = "remove_stale_interval"
 
     INTERFACE_CONNECTED = "interface_connected"
     INTERFACE_RECEIVED_DROPPED = "interface_received_dropped"
@@ -47,6 +49,8 @@ class EntityKeys(StrEnum):
     INTERFACE_SENT_PACKETS = "interface_sent_packets"
     INTERFACE_RECEIVED_RATE = "interface_received_rate"
     INTERFACE_SENT_RATE = "interface_sent_rate"
+    INTERFACE_RECEIVED_SMOOTHED_RATE = "interface_received_smoothed_rate"
+    INTERFACE_SENT_SMOOTHED_RATE = "interface_sent_smoothed_rate"
     INTERFACE_RECEIVED_TRAFFIC = "interface_received_traffic"
     INTERFACE_SENT_TRAFFIC = "interface_sent_traffic"
     INTERFACE_MONITORED = "interface_monitored"
@@ -54,6 +58,8 @@ class EntityKeys(StrEnum):
 
     DEVICE_RECEIVED_RATE = "device_received_rate"
     DEVICE_SENT_RATE = "device_sent_rate"
+    DEVICE_RECEIVED_SMOOTHED_RATE = "device_received_smoothed_rate"
+    DEVICE_SENT_SMOOTHED_RATE = "device_sent_smoothed_rate"
     DEVICE_RECEIVED_TRAFFIC = "device_received_traffic"
     DEVICE_SENT_TRAFFIC = "device_sent_traffic"
     DEVICE_TRACKER = "device_tracker"
@@ -71,3 +77,13 @@ class EntityValidation(StrEnum):
     MONITORED = "monitored"
     ADMIN_ONLY = "admin-only"
     NON_ADMIN_ONLY = "non-admin-only"
+
+
+class DataSources(StrEnum):
+    API = "api"
+    WEBSOCKETS = "websockets"
+
+
+class CaptureSources(IntEnum):
+    API = 1
+    WEBSOCKETS = 2
@@ -0,0 +1,214 @@
+import codecs
+import json
+import re
+
+JSON_STRING = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+
+# Token of the parsed part of the document (objects along the requested paths)
+JSON_TOKEN = re.compile(rf"\s*({JSON_STRING}|[{{}}\[\],:]|[^\s{{}}\[\],:\"]+)")
+
+# Token of a skipped or captured container, everything between brackets is one token
+JSON_CONTAINER_TOKEN = re.compile(rf"(?:[^\"{{}}\[\]]+|{JSON_STRING})+|[{{}}\[\]]")
+
+JSON_STRUCTURAL_CHARS = '"{}[],:'
+
+EXPECT_KEY = "key"
+EXPECT_COLON = "colon"
+EXPECT_VALUE = "value"
+EXPECT_COMMA = "comma"
+
+
+def extract_paths(data: dict, paths: list[list[str]]) -> dict:
+    """Copies only the sub trees of the given paths, missing or null paths are skipped."""
+    result = {}
+
+    for path in paths:
+        source = data
+
+        for key in path:
+            source = source.get(key) if isinstance(source, dict) else None
+
+            if source is None:
+                break
+
+        if source is None:
+            continue
+
+        _set_path(result, path, source)
+
+    return result
+
+
+def _set_path(data: dict, path: list[str] | tuple[str, ...], value):
+    target = data
+
+    for key in path[:-1]:
+        target = target.setdefault(key, {})
+
+    target[path[-1]] = value
+
+
+class JsonPathExtractor:
+    """Incremental JSON parser building only the sub trees of the given paths.
+
+    Objects along the paths are tokenized, any other value is scanned by
+    bracket depth without being materialized. Memory is bounded by the kept
+    sub trees and a single chunk rather than by the size of the document.
+    Null values of the paths are skipped, same as extract_paths.
+    """
+
+    _frames: list[list]
+    _captured: list[str] | None
+
+    def __init__(self, paths: list[list[str]]):
+        self._paths = {tuple(path) for path in paths}
+        self._prefixes = {
+            tuple(path[:index]) for path in paths for index in range(len(path))
+        }
+
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+
+        # Open objects along the paths as [path, current key, expected token]
+        self._frames = []
+        self._depth = 0
+        self._captured = None
+        self._captured_path = None
+
+        self._is_completed = False
+        self._result = {}
+
+        self.size = 0
+
+    def feed(self, chunk: bytes):
+        self.size += len(chunk)
+        self._buffer += self._decoder.decode(chunk)
+
+        self._parse(False)
+
+    def close(self) -> dict:
+        self._buffer += self._decoder.decode(b"", final=True)
+
+        self._parse(True)
+
+        if not self._is_completed:
+            raise ValueError("Incomplete JSON document")
+
+        return self._result
+
+    def _parse(self, is_final: bool):
+        buffer = self._buffer
+        length = len(buffer)
+        position = 0
+
+        while position < length and not self._is_completed:
+            if self._depth > 0:
+                match = JSON_CONTAINER_TOKEN.match(buffer, position)
+
+                if match is None:
+                    break
+
+                token = match.group()
+                position = match.end()
+
+                if self._captured is not None:
+                    self._captured.append(token)
+
+                if token[0] in "{[":
+                    self._depth += 1
+
+                elif token[0] in "}]":
+                    self._depth -= 1
+
+                    if self._depth == 0:
+                        self._on_value_completed()
+
+                continue
+
+            match = JSON_TOKEN.match(buffer, position)
+
+            if match is None:
+                break
+
+            token = match.group(1)
+
+            # Numbers and literals may continue in the next chunk
+            is_literal = token[0] not in JSON_STRUCTURAL_CHARS
+
+            if is_literal and match.end() == length and not is_final:
+                break
+
+            position = match.end()
+
+            self._handle_token(token)
+
+        self._buffer = buffer[position:]
+
+    def _handle_token(self, token: str):
+        if len(self._frames) == 0:
+            self._handle_value(tuple(), token)
+            return
+
+        frame = self._frames[-1]
+        path, key, expected = frame
+
+        if expected == EXPECT_KEY and token != "}":
+            frame[1] = json.loads(token)
+            frame[2] = EXPECT_COLON
+
+        elif expected == EXPECT_COLON and token == ":":
+            frame[2] = EXPECT_VALUE
+
+        elif expected == EXPECT_VALUE:
+            frame[2] = EXPECT_COMMA
+
+            self._handle_value((*path, key), token)
+
+        elif expected == EXPECT_COMMA and token == ",":
+            frame[2] = EXPECT_KEY
+
+        elif token == "}" and expected in [EXPECT_KEY, EXPECT_COMMA]:
+            self._frames.pop()
+
+            self._on_value_completed()
+
+        else:
+            raise ValueError(f"Unexpected token '{token}' at {list(path)}")
+
+    def _handle_value(self, path: tuple[str, ...], token: str):
+        is_container = token in ["{", "["]
+
+        if path in self._paths:
+            if is_container:
+                self._captured = [token]
+                self._captured_path = path
+                self._depth = 1
+
+            else:
+                value = json.loads(token)
+
+                if value is not None:
+                    _set_path(self._result, path, value)
+
+                self._on_value_completed()
+
+        elif path in self._prefixes and token == "{":
+            self._frames.append([path, None, EXPECT_KEY])
+
+        elif is_container:
+            self._depth = 1
+
+        else:
+            self._on_value_completed()
+
+    def _on_value_completed(self):
+        if self._captured is not None:
+            value = json.loads("".join(self._captured))
+
+            _set_path(self._result, self._captured_path, value)
+
+            self._captured = None
+            self._captured_path = None
+
+        if len(self._frames) == 0:
+            self._is_completed = True
@@ -1,3 +1,4 @@
+from datetime import datetime
 import logging
 
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -7,6 +8,7 @@ from ..common.consts import (
     API_DATA_SYSTEM,
     DATA_SYSTEM_SYSTEM,
     DEFAULT_NAME,
+    DEFAULT_REMOVE_STALE_INTERVAL,
     SYSTEM_DATA_HOSTNAME,
 )
 from ..common.enums import DeviceTypes
@@ -22,6 +24,10 @@ class BaseProcessor:
     _unique_messages: list[str] | None = None
     processor_type: DeviceTypes | None = None
     _hostname: str | None = None
+    _remove_stale_interval: float
+    _last_seen: dict[str, float] | None = None
+    _removed_items: list[str] | None = None
+    _last_stats: dict[str, dict] | None = None
 
     def __init__(self, config_data: ConfigData):
         self._config_data = config_data
@@ -33,12 +39,41 @@ class BaseProcessor:
 
         self._unique_messages = []
 
-    def update(self, api_data: dict, ws_data: dict):
+        self._remove_stale_interval = DEFAULT_REMOVE_STALE_INTERVAL.total_seconds()
+        self._last_seen = {}
+        self._removed_items = []
+        self._last_stats = {}
+
+    def set_remove_stale_interval(self, interval: float):
+        self._remove_stale_interval = interval
+
+    def pop_removed_items(self) -> list[str]:
+        removed_items = self._removed_items
+        self._removed_items = []
+
+        return removed_items
+
+    def get_snapshot(self) -> dict:
+        return {}
+
+    def restore(self, hostname: str, snapshot: dict | None):
+        self._hostname = hostname.upper()
+
+        if snapshot is not None:
+            self._restore(snapshot)
+
+    def _restore(self, snapshot: dict):
+        pass
+
+    def update(self, api_data: dict, ws_data: dict | None):
         self._api_data = api_data
         self._ws_data = ws_data
 
         self._process_api_data()
-        self._process_ws_data()
+
+        # REST only mode, live statistics are filled once WS is connected
+        if ws_data is not None:
+            self._process_ws_data()
 
     def _process_api_data(self):
         system_section = self._api_data.get(API_DATA_SYSTEM, {})
@@ -49,6 +84,46 @@ class BaseProcessor:
     def _process_ws_data(self):
         pass
 
+    def _remove_item(self, item_id: str):
+        pass
+
+    def _is_new_stats(self, item_id: str, stats: dict | None) -> bool:
+        # WS handlers build a new stats object per message, processors run on
+        # every API / WS change, rate history should get one sample per message
+        is_new_stats = self._last_stats.get(item_id) is not stats
+
+        if is_new_stats:
+            self._last_stats[item_id] = stats
+
+        return is_new_stats
+
+    def _set_last_seen(self, item_id: str, now: float):
+        self._last_seen[item_id] = now
+
+    def _remove_stale_items(self):
+        if self._remove_stale_interval <= 0:
+            return
+
+        now = datetime.now().timestamp()
+
+        stale_items = [
+            item_id
+            for item_id in self._last_seen
+            if now - self._last_seen[item_id] > self._remove_stale_interval
+        ]
+
+        for item_id in stale_items:
+            _LOGGER.debug(
+                f"Removing stale {self.processor_type} {item_id}, "
+                f"Last seen: {datetime.fromtimestamp(self._last_seen[item_id])}"
+            )
+
+            self._last_seen.pop(item_id)
+            self._last_stats.pop(item_id, None)
+            self._remove_item(item_id)
+
+            self._removed_items.append(item_id)
+
     def _unique_log(self, log_level: int, message: str):
         if message not in self._unique_messages:
             self._unique_messages.append(message)
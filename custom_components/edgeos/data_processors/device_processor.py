@@ -1,7 +1,10 @@
+from datetime import datetime
+from fnmatch import fnmatch
+from ipaddress import IPv4Network, IPv6Network, ip_address
 import logging
 import sys
 
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.device_registry import DeviceInfo, format_mac
 
 from ..common.consts import (
     API_DATA_DHCP_LEASES,
@@ -9,7 +12,10 @@ from ..common.consts import (
     DATA_SYSTEM_SERVICE,
     DATA_SYSTEM_SERVICE_DHCP_SERVER,
     DEFAULT_NAME,
+    DEVICE_DATA_DOMAIN,
+    DEVICE_DATA_IP,
     DEVICE_DATA_MAC,
+    DEVICE_DATA_NAME,
     DHCP_SERVER_IP_ADDRESS,
     DHCP_SERVER_LEASES,
     DHCP_SERVER_LEASES_CLIENT_HOSTNAME,
@@ -32,6 +38,9 @@ _LOGGER = logging.getLogger(__name__)
 class DeviceProcessor(BaseProcessor):
     _devices: dict[str, EdgeOSDeviceData]
     _devices_ip_mapping: dict[str, str]
+    _leased_devices: dict[str, str]
+    _leases: dict
+    _leases_ip_mapping: dict[str, str]
 
     def __init__(self, config_data: ConfigData):
         super().__init__(config_data)
@@ -41,6 +50,8 @@ class DeviceProcessor(BaseProcessor):
         self._devices = {}
         self._devices_ip_mapping = {}
         self._leased_devices = {}
+        self._leases = {}
+        self._leases_ip_mapping = {}
 
     def get_devices(self) -> list[str]:
         return list(self._devices.keys())
@@ -86,6 +97,86 @@ class DeviceProcessor(BaseProcessor):
     def get_leased_devices(self) -> dict:
         return self._leased_devices
 
+    def find_devices(
+        self,
+        mac_addresses: list[str] | None = None,
+        hostname_pattern: str | None = None,
+        network: IPv4Network | IPv6Network | None = None,
+    ) -> list[str]:
+        formatted_mac_addresses = (
+            set()
+            if mac_addresses is None
+            else {format_mac(mac_address) for mac_address in mac_addresses}
+        )
+
+        pattern = None if hostname_pattern is None else hostname_pattern.lower()
+
+        devices = [
+            device.unique_id
+            for device in self._devices.values()
+            if not device.is_leased
+            and (
+                format_mac(device.mac) in formatted_mac_addresses
+                or self._is_hostname_match(device.hostname, pattern)
+                or self._is_network_match(device.ip, network)
+            )
+        ]
+
+        return devices
+
+    @staticmethod
+    def _is_hostname_match(hostname: str | None, pattern: str | None) -> bool:
+        if pattern is None or hostname is None:
+            return False
+
+        is_match = fnmatch(hostname.lower(), pattern)
+
+        return is_match
+
+    @staticmethod
+    def _is_network_match(
+        ip: str | None, network: IPv4Network | IPv6Network | None
+    ) -> bool:
+        if network is None or ip is None:
+            return False
+
+        try:
+            is_match = ip_address(ip) in network
+
+        except ValueError:
+            is_match = False
+
+        return is_match
+
+    def get_snapshot(self) -> dict:
+        snapshot = {
+            device.unique_id: {
+                DEVICE_DATA_NAME: device.hostname,
+                DEVICE_DATA_IP: device.ip,
+                DEVICE_DATA_DOMAIN: device.domain,
+            }
+            for device in self._devices.values()
+            if not device.is_leased
+        }
+
+        return snapshot
+
+    def _restore(self, snapshot: dict):
+        for device_mac in snapshot:
+            device_snapshot = snapshot.get(device_mac, {})
+
+            static_mapping_data = {
+                DHCP_SERVER_IP_ADDRESS: device_snapshot.get(DEVICE_DATA_IP),
+                DHCP_SERVER_MAC_ADDRESS: device_mac,
+            }
+
+            self._set_device(
+                device_snapshot.get(DEVICE_DATA_NAME),
+                device_snapshot.get(DEVICE_DATA_DOMAIN),
+                static_mapping_data,
+                False,
+            )
+
     def _process_api_data(self):
         super()._process_api_data()
 
@@ -115,7 +206,7 @@ class DeviceProcessor(BaseProcessor):
                             hostname, domain_name, static_mapping_data, False
                         )
 
-                self._update_leased_devices()
+            self._update_leased_devices()
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
@@ -133,7 +224,9 @@ class DeviceProcessor(BaseProcessor):
                 stats = device_data.get(device_ip)
 
                 if device_item is not None:
-                    self._update_device_stats(device_item, stats)
+                    is_new_sample = self._is_new_stats(device_item.unique_id, stats)
+
+                    self._update_device_stats(device_item, stats, is_new_sample)
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -148,32 +241,19 @@ class DeviceProcessor(BaseProcessor):
             data_leases = self._api_data.get(API_DATA_DHCP_LEASES, {})
             data_server_leases = data_leases.get(DHCP_SERVER_LEASES, {})
 
-            for subnet in data_server_leases:
-                subnet_data = data_server_leases.get(subnet, {})
+            # REST API replaces the leases section on every update,
+            # same object means nothing changed since the last pass
+            if data_server_leases is self._leases:
+                return
 
-                for ip in subnet_data:
-                    device_data = subnet_data.get(ip)
+            added_leases, removed_leases = self._get_leases_diff(data_server_leases)
 
-                    hostname = device_data.get(DHCP_SERVER_LEASES_CLIENT_HOSTNAME)
+            self._leases = data_server_leases
 
-                    static_mapping_data = {
-                        DHCP_SERVER_IP_ADDRESS: ip,
-                        DHCP_SERVER_MAC_ADDRESS: device_data.get(DEVICE_DATA_MAC),
-                    }
-
-                    self._set_device(hostname, None, static_mapping_data, True)
-
-            self._leased_devices.clear()
-
-            for device_mac in self._devices:
-                device = self._devices.get(device_mac)
-                if device.is_leased:
-                    device_name = device.mac
-
-                    if device.hostname not in ["", "?"]:
-                        device_name = f"{device.mac} ({device.hostname})"
+            if len(added_leases) > 0 or len(removed_leases) > 0:
+                self._apply_leases_diff(added_leases, removed_leases)
 
-                    self._leased_devices[device.ip] = device_name
+            self._remove_stale_items()
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -183,13 +263,121 @@ class DeviceProcessor(BaseProcessor):
                 f"Failed to extract Unknown Devices data, Error: {ex}, Line: {line_number}"
             )
 
+    def _get_leases_diff(self, data_server_leases: dict) -> tuple[dict, dict]:
+        added_leases = {}
+        removed_leases = {}
+
+        for subnet in data_server_leases:
+            subnet_data = data_server_leases.get(subnet, {})
+            previous_subnet_data = self._leases.get(subnet, {})
+
+            if subnet_data == previous_subnet_data:
+                continue
+
+            get_previous_lease = previous_subnet_data.get
+
+            added_leases.update(
+                {
+                    ip: lease_data
+                    for ip, lease_data in subnet_data.items()
+                    if get_previous_lease(ip) != lease_data
+                }
+            )
+
+            removed_leases.update(
+                {
+                    ip: previous_subnet_data.get(ip)
+                    for ip in previous_subnet_data.keys() - subnet_data.keys()
+                }
+            )
+
+        for subnet in self._leases:
+            if subnet not in data_server_leases:
+                removed_leases.update(self._leases.get(subnet, {}))
+
+        return added_leases, removed_leases
+
+    def _apply_leases_diff(self, added_leases: dict, removed_leases: dict):
+        _LOGGER.debug(
+            f"Updating leases, Added / Changed: {len(added_leases)}, Removed: {len(removed_leases)}"
+        )
+
+        # Copy on write, entities compare the previous state by reference
+        leased_devices = dict(self._leased_devices)
+        vanished_devices = []
+
+        for ip in removed_leases:
+            leased_devices.pop(ip, None)
+
+            mac_address = self._leases_ip_mapping.pop(ip, None)
+
+            if mac_address is not None:
+                vanished_devices.append(mac_address)
+
+        for ip in added_leases:
+            lease_data = added_leases.get(ip)
+            mac_address = lease_data.get(DEVICE_DATA_MAC)
+            previous_mac_address = self._leases_ip_mapping.get(ip)
+
+            if previous_mac_address is not None and previous_mac_address != mac_address:
+                vanished_devices.append(previous_mac_address)
+
+            static_mapping_data = {
+                DHCP_SERVER_IP_ADDRESS: ip,
+                DHCP_SERVER_MAC_ADDRESS: mac_address,
+            }
+
+            device = self._set_device(
+                lease_data.get(DHCP_SERVER_LEASES_CLIENT_HOSTNAME),
+                None,
+                static_mapping_data,
+                True,
+            )
+
+            self._leases_ip_mapping[ip] = device.unique_id
+            self._last_seen.pop(device.unique_id, None)
+
+            if device.is_leased:
+                leased_devices[ip] = self._get_leased_device_name(device)
+
+            else:
+                leased_devices.pop(ip, None)
+
+        now = datetime.now().timestamp()
+        active_devices = (
+            set(self._leases_ip_mapping.values())
+            if len(vanished_devices) > 0
+            else set()
+        )
+
+        for mac_address in vanished_devices:
+            device = self._devices.get(mac_address)
+
+            if (
+                device is not None
+                and device.is_leased
+                and mac_address not in active_devices
+            ):
+                self._set_last_seen(mac_address, now)
+
+        self._leased_devices = leased_devices
+
+    @staticmethod
+    def _get_leased_device_name(device: EdgeOSDeviceData) -> str:
+        device_name = device.mac
+
+        if device.hostname not in ["", "?"]:
+            device_name = f"{device.mac} ({device.hostname})"
+
+        return device_name
+
     def _set_device(
         self,
         hostname: str,
         domain_name: str | None,
         static_mapping_data: dict,
         is_leased: bool,
-    ):
+    ) -> EdgeOSDeviceData:
         ip_address = static_mapping_data.get(DHCP_SERVER_IP_ADDRESS)
         mac_address = static_mapping_data.get(DHCP_SERVER_MAC_ADDRESS)
 
@@ -203,9 +391,44 @@ class DeviceProcessor(BaseProcessor):
         else:
             device_data = existing_device_data
 
+            if device_data.is_leased and not is_leased:
+                # Device got a static mapping, stop tracking it as a lease
+                device_data.is_leased = False
+                self._last_seen.pop(device_data.unique_id, None)
+
+                if device_data.ip in self._leased_devices:
+                    # Copy on write, entities compare the previous state by reference
+                    self._leased_devices = {
+                        ip: device_name
+                        for ip, device_name in self._leased_devices.items()
+                        if ip != device_data.ip
+                    }
+
+            if device_data.is_leased == is_leased and device_data.ip != ip_address:
+                self._remove_ip_mapping(device_data)
+
+                device_data.ip = ip_address
+
+            if device_data.is_leased and is_leased:
+                device_data.hostname = hostname
+
         self._devices[device_data.unique_id] = device_data
         self._devices_ip_mapping[device_data.ip] = device_data.unique_id
 
+        return device_data
+
+    def _remove_item(self, item_id: str):
+        device_data = self._devices.pop(item_id, None)
+
+        if device_data is not None:
+            self._remove_ip_mapping(device_data)
+
+    def _remove_ip_mapping(self, device_data: EdgeOSDeviceData):
+        mapped_unique_id = self._devices_ip_mapping.get(device_data.ip)
+
+        if mapped_unique_id == device_data.unique_id:
+            self._devices_ip_mapping.pop(device_data.ip)
+
     def _get_device(self, unique_id: str) -> EdgeOSDeviceData | None:
         device = self._devices.get(unique_id)
 
@@ -219,7 +442,9 @@ class DeviceProcessor(BaseProcessor):
         return device
 
     @staticmethod
-    def _update_device_stats(device_data: EdgeOSDeviceData, stats: dict):
+    def _update_device_stats(
+        device_data: EdgeOSDeviceData, stats: dict, is_new_sample: bool
+    ):
         try:
             if not device_data.is_leased:
                 directions = [device_data.received, device_data.sent]
@@ -232,7 +457,7 @@ class DeviceProcessor(BaseProcessor):
 
                         stat_data[stat_data_item] = stats.get(key)
 
-                    direction.update(stat_data)
+                    direction.update(stat_data, is_new_sample)
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -1,3 +1,4 @@
+from datetime import datetime
 import logging
 import sys
 
@@ -24,6 +25,7 @@ from ..common.consts import (
     INTERFACE_DATA_PROMISCUOUS,
     INTERFACE_DATA_SPEED,
     INTERFACE_DATA_STP,
+    INTERFACE_DATA_TYPE,
     INTERFACE_DATA_UP,
     TRAFFIC_DATA_INTERFACE_ITEMS,
     TRUE_STR,
@@ -90,6 +92,32 @@ class InterfaceProcessor(BaseProcessor):
 
         return device_info
 
+    def get_snapshot(self) -> dict:
+        snapshot = {
+            interface.unique_id: {
+                INTERFACE_DATA_TYPE: interface.interface_type,
+                INTERFACE_DATA_DESCRIPTION: interface.description,
+            }
+            for interface in self._interfaces.values()
+        }
+
+        return snapshot
+
+    def _restore(self, snapshot: dict):
+        now = datetime.now().timestamp()
+
+        for interface_name in snapshot:
+            interface_snapshot = snapshot.get(interface_name, {})
+            interface_type = InterfaceTypes(interface_snapshot.get(INTERFACE_DATA_TYPE))
+
+            interface = EdgeOSInterfaceData(interface_name, interface_type)
+            interface.description = interface_snapshot.get(INTERFACE_DATA_DESCRIPTION)
+
+            self._interfaces[interface.unique_id] = interface
+
+            # Restored interfaces that will not show up again get removed as stale
+            self._set_last_seen(interface.unique_id, now)
+
     def _process_api_data(self):
         super()._process_api_data()
 
@@ -97,6 +125,8 @@ class InterfaceProcessor(BaseProcessor):
             system_section = self._api_data.get(API_DATA_SYSTEM, {})
             interface_types = system_section.get(API_DATA_INTERFACES, {})
 
+            now = datetime.now().timestamp()
+
             for interface_type in interface_types:
                 interfaces = interface_types.get(interface_type)
 
@@ -107,9 +137,13 @@ class InterfaceProcessor(BaseProcessor):
                         if interface_type in self._supported_interface_types:
                             int_type = InterfaceTypes(interface_type)
 
-                            self._extract_interface(
+                            interface = self._extract_interface(
                                 interface_name, interface_data, int_type
                             )
+
+                            if interface is not None:
+                                self._set_last_seen(interface.unique_id, now)
+
                         else:
                             _LOGGER.info(
                                 f"Skip loading interface {interface_name}, Type: {interface_type} is not supported"
@@ -127,6 +161,8 @@ class InterfaceProcessor(BaseProcessor):
         try:
             interfaces_data = self._ws_data.get(WS_INTERFACES_KEY, {})
 
+            now = datetime.now().timestamp()
+
             for name in interfaces_data:
                 interface_item = self._interfaces.get(name)
                 stats = interfaces_data.get(name)
@@ -138,7 +174,13 @@ class InterfaceProcessor(BaseProcessor):
                     )
 
                 if interface_item is not None:
-                    self._update_interface_stats(interface_item, stats)
+                    self._set_last_seen(interface_item.unique_id, now)
+
+                    is_new_sample = self._is_new_stats(interface_item.unique_id, stats)
+
+                    self._update_interface_stats(interface_item, stats, is_new_sample)
+
+            self._remove_stale_items()
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -195,8 +237,13 @@ class InterfaceProcessor(BaseProcessor):
 
         return interface
 
+    def _remove_item(self, item_id: str):
+        self._interfaces.pop(item_id, None)
+
     @staticmethod
-    def _update_interface_stats(interface: EdgeOSInterfaceData, stats: dict):
+    def _update_interface_stats(
+        interface: EdgeOSInterfaceData, stats: dict, is_new_sample: bool
+    ):
         try:
             if stats is not None:
                 interface.up = (
@@ -219,7 +266,7 @@ class InterfaceProcessor(BaseProcessor):
 
                         stat_data[stat_data_item] = float(stats.get(key))
 
-                    direction.update(stat_data)
+                    direction.update(stat_data, is_new_sample)
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -74,6 +74,33 @@ class SystemProcessor(BaseProcessor):
 
         return device_info
 
+    def get_snapshot(self) -> dict:
+        system_data = self._system
+
+        if system_data is None:
+            return {}
+
+        snapshot = {
+            SYSTEM_DATA_HOSTNAME: system_data.hostname,
+            DISCOVER_DATA_PRODUCT: system_data.product,
+            DISCOVER_DATA_FW_VERSION: system_data.fw_version,
+            SYSTEM_INFO_DATA_SW_VER: system_data.sw_version,
+            SYSTEM_DATA_LOGIN_USER_LEVEL: system_data.user_level,
+        }
+
+        return snapshot
+
+    def _restore(self, snapshot: dict):
+        system_data = EdgeOSSystemData()
+
+        system_data.hostname = snapshot.get(SYSTEM_DATA_HOSTNAME)
+        system_data.product = snapshot.get(DISCOVER_DATA_PRODUCT)
+        system_data.fw_version = snapshot.get(DISCOVER_DATA_FW_VERSION)
+        system_data.sw_version = snapshot.get(SYSTEM_INFO_DATA_SW_VER)
+        system_data.user_level = snapshot.get(SYSTEM_DATA_LOGIN_USER_LEVEL)
+
+        self._system = system_data
+
     def _process_api_data(self):
         super()._process_api_data()
 
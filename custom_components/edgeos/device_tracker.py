@@ -3,7 +3,10 @@ Support for Ubiquiti EdgeOS routers.
 For more details about this platform, please refer to the documentation at
 https://home-assistant.io/components/device_tracker.edgeos/
 """
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING
 
 from homeassistant.components.device_tracker import (
     ATTR_IP,
@@ -18,7 +21,9 @@ from .common.base_entity import IntegrationBaseEntity, async_setup_base_entry
 from .common.consts import ATTR_ATTRIBUTES, ATTR_HOSTNAME, ATTR_IS_ON
 from .common.entity_descriptions import IntegrationDeviceTrackerEntityDescription
 from .common.enums import DeviceTypes
-from .managers.coordinator import Coordinator
+
+if TYPE_CHECKING:
+    from .managers.coordinator import Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
@@ -11,7 +11,9 @@ from homeassistant.helpers.device_registry import DeviceEntry
 
 from .common.consts import DEVICE_DATA_MAC, DOMAIN, INTERFACE_DATA_NAME
 from .common.enums import DeviceTypes
-from .managers.coordinator import Coordinator
+
+if TYPE_CHECKING:
+    from .managers.coordinator import Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,6 +59,9 @@ def _async_get_diagnostics(
         data["config"] = debug_data["config"]
         data["data"] = debug_data["data"]
         data["processors"] = debug_data["processors"]
+        data["sources"] = debug_data["sources"]
+        data["hub"] = debug_data["hub"]
+        data["statistics"] = debug_data["statistics"]
 
         device_data = coordinator.get_device_data(device.model, device.identifiers)
 
@@ -73,6 +78,9 @@ def _async_get_diagnostics(
             "config": debug_data["config"],
             "data": debug_data["data"],
             "processors": debug_data["processors"],
+            "sources": debug_data["sources"],
+            "hub": debug_data["hub"],
+            "statistics": debug_data["statistics"],
         }
 
         processor_data = debug_data["processors"]
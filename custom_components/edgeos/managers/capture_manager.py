@@ -0,0 +1,208 @@
+from asyncio import Lock
+from datetime import datetime
+import gzip
+import logging
+import os
+import struct
+import sys
+from typing import Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from ..common.consts import (
+    CAPTURE_DIRECTORY,
+    CAPTURE_FILE,
+    CAPTURE_FLUSH_INTERVAL,
+    CAPTURE_MAX_BUFFER_SIZE,
+    CAPTURE_MAX_FILE_SIZE,
+    CAPTURE_MAX_FILES,
+    CAPTURE_RECORD_HEADER,
+    DOMAIN,
+    TASK_CAPTURE_FLUSH,
+)
+from ..common.enums import CaptureSources
+from .task_manager import TaskManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CaptureManager:
+    """Append only capture of raw WS frames and REST responses for offline replay.
+
+    Each record is a header (timestamp, source, name length, payload length)
+    followed by the UTF-8 encoded name and payload, records are written in
+    batches as gzip members to a rotating file by the executor.
+    """
+
+    _buffer: list[bytes]
+    _buffer_size: int
+    _unsub_flush: Callable | None
+    _statistics: dict[str, int]
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, task_manager: TaskManager):
+        self._hass = hass
+        self._task_manager = task_manager
+
+        self._file_path = hass.config.path(
+            CAPTURE_DIRECTORY, CAPTURE_FILE.format(entry_id)
+        )
+
+        self._buffer = []
+        self._buffer_size = 0
+        self._unsub_flush = None
+        self._lock = Lock()
+
+        self._statistics = {
+            "records": 0,
+            "written_records": 0,
+            "written_bytes": 0,
+            "rotations": 0,
+        }
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._unsub_flush is not None
+
+    def get_debug_data(self) -> dict:
+        data = {
+            "enabled": self.is_enabled,
+            "file": self._file_path,
+            "buffered_records": len(self._buffer),
+            **self._statistics,
+        }
+
+        return data
+
+    def start(self):
+        if self.is_enabled:
+            return
+
+        _LOGGER.info(f"Start capturing to {self._file_path}")
+
+        self._unsub_flush = async_track_time_interval(
+            self._hass,
+            self._on_flush_timer,
+            CAPTURE_FLUSH_INTERVAL,
+            name=f"{DOMAIN} capture flush",
+        )
+
+    async def async_stop(self):
+        if not self.is_enabled:
+            return
+
+        _LOGGER.info(f"Stop capturing to {self._file_path}")
+
+        self._unsub_flush()
+        self._unsub_flush = None
+
+        await self._async_flush()
+
+    def record(self, source: CaptureSources, name: str | None, payload: str):
+        if not self.is_enabled:
+            return
+
+        name_data = b"" if name is None else name.encode()
+        payload_data = payload.encode()
+
+        header = struct.pack(
+            CAPTURE_RECORD_HEADER,
+            datetime.now().timestamp(),
+            source,
+            len(name_data),
+            len(payload_data),
+        )
+
+        record = b"".join([header, name_data, payload_data])
+
+        self._buffer.append(record)
+        self._buffer_size += len(record)
+        self._statistics["records"] += 1
+
+        if self._buffer_size >= CAPTURE_MAX_BUFFER_SIZE:
+            self._task_manager.create_task(self._async_flush(), TASK_CAPTURE_FLUSH)
+
+    @callback
+    def _on_flush_timer(self, _now: datetime):
+        self._task_manager.create_task(self._async_flush(), TASK_CAPTURE_FLUSH)
+
+    async def _async_flush(self):
+        if len(self._buffer) == 0:
+            return
+
+        records = self._buffer
+
+        self._buffer = []
+        self._buffer_size = 0
+
+        # Executor jobs run in parallel, lock keeps the records ordered
+        async with self._lock:
+            try:
+                written_bytes, is_rotated = await self._hass.async_add_executor_job(
+                    self._write, records
+                )
+
+                # Statistics are updated on the event loop only
+                self._statistics["written_records"] += len(records)
+                self._statistics["written_bytes"] += written_bytes
+
+                if is_rotated:
+                    self._statistics["rotations"] += 1
+
+            except Exception as ex:
+                exc_type, exc_obj, tb = sys.exc_info()
+                line_number = tb.tb_lineno
+
+                _LOGGER.error(
+                    f"Failed to write capture, Error: {ex}, Line: {line_number}"
+                )
+
+    def _write(self, records: list[bytes]) -> tuple[int, bool]:
+        os.makedirs(os.path.dirname(self._file_path), exist_ok=True)
+
+        is_rotated = self._rotate()
+
+        data = b"".join(records)
+
+        with gzip.open(self._file_path, "ab") as file:
+            file.write(data)
+
+        return len(data), is_rotated
+
+    def _rotate(self) -> bool:
+        is_full = (
+            os.path.exists(self._file_path)
+            and os.path.getsize(self._file_path) >= CAPTURE_MAX_FILE_SIZE
+        )
+
+        if not is_full:
+            return False
+
+        for index in range(CAPTURE_MAX_FILES - 1, 0, -1):
+            source = self._file_path if index == 1 else f"{self._file_path}.{index - 1}"
+
+            if os.path.exists(source):
+                os.replace(source, f"{self._file_path}.{index}")
+
+        return True
+
+
+def read_capture(file_path: str):
+    """Yields the records of a capture file as (timestamp, source, name, payload)."""
+    header_size = struct.calcsize(CAPTURE_RECORD_HEADER)
+
+    with gzip.open(file_path, "rb") as file:
+        while True:
+            header = file.read(header_size)
+
+            if len(header) < header_size:
+                break
+
+            timestamp, source, name_size, payload_size = struct.unpack(
+                CAPTURE_RECORD_HEADER, header
+            )
+
+            name = file.read(name_size).decode()
+            payload = file.read(payload_size).decode()
+
+            yield timestamp, CaptureSources(source), name or None, payload
@@ -1,30 +1,34 @@
-import json
+from datetime import timedelta
 import logging
 import sys
 
 from cryptography.fernet import InvalidToken
 
-from homeassistant.config_entries import STORAGE_VERSION, ConfigEntry
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import translation
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.json import JSONEncoder
-from homeassistant.helpers.storage import Store
 
 from ..common.consts import (
-    CONFIGURATION_FILE,
     DEFAULT_CONSIDER_AWAY_INTERVAL,
     DEFAULT_NAME,
+    DEFAULT_REMOVE_STALE_INTERVAL,
     DEFAULT_UNIT,
     DEFAULT_UPDATE_API_INTERVAL,
     DEFAULT_UPDATE_ENTITIES_INTERVAL,
     DOMAIN,
     INVALID_TOKEN_SECTION,
+    PUBLISH_POLICY_DEADBAND,
+    PUBLISH_POLICY_DEADBAND_PERCENTAGE,
+    PUBLISH_POLICY_MIN_PUBLISH_INTERVAL,
+    STORAGE_DATA_CAPTURE_DATA,
     STORAGE_DATA_CONSIDER_AWAY_INTERVAL,
     STORAGE_DATA_LOG_INCOMING_MESSAGES,
     STORAGE_DATA_MONITORED_DEVICES,
     STORAGE_DATA_MONITORED_INTERFACES,
+    STORAGE_DATA_PUBLISH_POLICIES,
+    STORAGE_DATA_REMOVE_STALE_INTERVAL,
     STORAGE_DATA_UNIT,
     STORAGE_DATA_UPDATE_API_INTERVAL,
     STORAGE_DATA_UPDATE_ENTITIES_INTERVAL,
@@ -32,6 +36,7 @@ from ..common.consts import (
 from ..common.entity_descriptions import IntegrationEntityDescription
 from ..common.enums import DeviceTypes
 from ..models.config_data import ConfigData
+from .storage_manager import StorageManager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,7 +45,7 @@ class ConfigManager:
     _data: dict | None
     _config_data: ConfigData
 
-    _store: Store | None
+    _storage_manager: StorageManager | None
     _translations: dict | None
     _password: str | None
     _entry_title: str
@@ -59,17 +64,12 @@ class ConfigManager:
 
         self._data = None
 
-        self._store = None
+        self._storage_manager = StorageManager.get_instance(hass)
         self._translations = None
 
         self._is_set_up_mode = entry is None
         self._is_initialized = False
 
-        if hass is not None:
-            self._store = Store(
-                hass, STORAGE_VERSION, CONFIGURATION_FILE, encoder=JSONEncoder
-            )
-
     @property
     def is_initialized(self) -> bool:
         is_initialized = self._is_initialized
@@ -112,6 +112,12 @@ class ConfigManager:
 
         return result
 
+    @property
+    def capture_data(self):
+        result = self._data.get(STORAGE_DATA_CAPTURE_DATA, False)
+
+        return result
+
     @property
     def consider_away_interval(self):
         result = self._data.get(
@@ -139,6 +145,21 @@ class ConfigManager:
 
         return result
 
+    @property
+    def remove_stale_interval(self):
+        result = self._data.get(
+            STORAGE_DATA_REMOVE_STALE_INTERVAL,
+            DEFAULT_REMOVE_STALE_INTERVAL.total_seconds(),
+        )
+
+        return result
+
+    @property
+    def publish_policies(self):
+        result = self._data.get(STORAGE_DATA_PUBLISH_POLICIES, {})
+
+        return result
+
     @property
     def unit(self):
         result = self._data.get(STORAGE_DATA_UNIT, DEFAULT_UNIT)
@@ -239,6 +260,32 @@ class ConfigManager:
 
         return is_enabled
 
+    def get_publish_policy(
+        self, entity_description: IntegrationEntityDescription
+    ) -> tuple[float | None, float | None, timedelta | None]:
+        """Deadband, deadband percentage and min publish interval of the entity key.
+
+        Values that were not set for the entity key default to its description.
+        """
+        publish_policy = self.publish_policies.get(entity_description.key, {})
+
+        deadband = publish_policy.get(
+            PUBLISH_POLICY_DEADBAND, entity_description.deadband
+        )
+
+        deadband_percentage = publish_policy.get(
+            PUBLISH_POLICY_DEADBAND_PERCENTAGE, entity_description.deadband_percentage
+        )
+
+        min_publish_interval = entity_description.min_publish_interval
+
+        if PUBLISH_POLICY_MIN_PUBLISH_INTERVAL in publish_policy:
+            min_publish_interval = timedelta(
+                seconds=publish_policy[PUBLISH_POLICY_MIN_PUBLISH_INTERVAL]
+            )
+
+        return deadband, deadband_percentage, min_publish_interval
+
     def is_monitored(
         self, device_type: DeviceTypes, item_id: str | None = None
     ) -> bool:
@@ -275,9 +322,14 @@ class ConfigManager:
                 should_save = True
                 self._data[key] = value
 
+        for key in [CONF_PASSWORD, CONF_USERNAME]:
+            if key in self._data:
+                should_save = True
+                self._data.pop(key)
+
         if should_save:
             _LOGGER.info("updated")
-            await self._save()
+            self._save()
 
     @staticmethod
     def _get_defaults() -> dict:
@@ -285,71 +337,44 @@ class ConfigManager:
             STORAGE_DATA_MONITORED_INTERFACES: {},
             STORAGE_DATA_MONITORED_DEVICES: {},
             STORAGE_DATA_LOG_INCOMING_MESSAGES: False,
+            STORAGE_DATA_CAPTURE_DATA: False,
             STORAGE_DATA_CONSIDER_AWAY_INTERVAL: DEFAULT_CONSIDER_AWAY_INTERVAL.total_seconds(),
             STORAGE_DATA_UPDATE_ENTITIES_INTERVAL: DEFAULT_UPDATE_ENTITIES_INTERVAL.total_seconds(),
             STORAGE_DATA_UPDATE_API_INTERVAL: DEFAULT_UPDATE_API_INTERVAL.total_seconds(),
             STORAGE_DATA_UNIT: DEFAULT_UNIT,
+            STORAGE_DATA_REMOVE_STALE_INTERVAL: DEFAULT_REMOVE_STALE_INTERVAL.total_seconds(),
+            STORAGE_DATA_PUBLISH_POLICIES: {},
         }
 
         return data
 
     async def _load_config_from_file(self):
-        if self._store is not None:
-            store_data = await self._store.async_load()
+        if self._storage_manager is not None:
+            store_data = await self._storage_manager.async_get_data()
 
-            if store_data is not None:
-                self._data = store_data.get(self._entry_id)
+            self._data = store_data.get(self._entry_id)
 
     async def remove(self, entry_id: str):
-        if self._store is None:
+        if self._storage_manager is None:
             return
 
-        store_data = await self._store.async_load()
+        store_data = await self._storage_manager.async_get_data()
 
-        if store_data is not None and entry_id in store_data:
-            data = {key: store_data[key] for key in store_data}
-            data.pop(entry_id)
+        if entry_id in store_data:
+            store_data.pop(entry_id)
 
-            await self._store.async_save(data)
+            self._storage_manager.async_delay_save()
 
-    async def _save(self):
-        if self._store is None:
+    def _save(self):
+        if self._storage_manager is None or self._entry_id is None:
             return
 
-        should_save = False
-        store_data = await self._store.async_load()
+        _LOGGER.debug(f"Storing config data: {self._data}")
 
-        if store_data is None:
-            store_data = {}
+        store_data = self._storage_manager.data
+        store_data[self._entry_id] = self._data
 
-        entry_data = store_data.get(self._entry_id, {})
-
-        _LOGGER.debug(
-            f"Storing config data: {json.dumps(self._data)}, "
-            f"Exiting: {json.dumps(entry_data)}"
-        )
-
-        for key in self._data:
-            stored_value = entry_data.get(key)
-
-            if key in [CONF_PASSWORD, CONF_USERNAME]:
-                entry_data.pop(key)
-
-                if stored_value is not None:
-                    should_save = True
-
-            else:
-                current_value = self._data.get(key)
-
-                if stored_value != current_value:
-                    should_save = True
-
-                    entry_data[key] = self._data[key]
-
-        if should_save and self._entry_id is not None:
-            store_data[self._entry_id] = entry_data
-
-            await self._store.async_save(store_data)
+        self._storage_manager.async_delay_save()
 
     async def set_monitored_interface(self, interface_name: str, is_enabled: bool):
         await self._set_storage_sub_parameter(
@@ -361,9 +386,22 @@ class ConfigManager:
             STORAGE_DATA_MONITORED_DEVICES, device_mac, is_enabled
         )
 
+    async def set_monitored_interfaces(self, monitored_interfaces: dict[str, bool]):
+        await self._set_storage_sub_parameters(
+            STORAGE_DATA_MONITORED_INTERFACES, monitored_interfaces
+        )
+
+    async def set_monitored_devices(self, monitored_devices: dict[str, bool]):
+        await self._set_storage_sub_parameters(
+            STORAGE_DATA_MONITORED_DEVICES, monitored_devices
+        )
+
     async def set_log_incoming_messages(self, enabled: bool):
         await self._set_storage_parameter(STORAGE_DATA_LOG_INCOMING_MESSAGES, enabled)
 
+    async def set_capture_data(self, enabled: bool):
+        await self._set_storage_parameter(STORAGE_DATA_CAPTURE_DATA, enabled)
+
     async def set_consider_away_interval(self, interval: int):
         await self._set_storage_parameter(STORAGE_DATA_CONSIDER_AWAY_INTERVAL, interval)
 
@@ -378,18 +416,45 @@ class ConfigManager:
     async def set_unit(self, unit: str):
         await self._set_storage_parameter(STORAGE_DATA_UNIT, unit)
 
+    async def set_remove_stale_interval(self, interval: int):
+        await self._set_storage_parameter(STORAGE_DATA_REMOVE_STALE_INTERVAL, interval)
+
+    async def set_publish_policy(self, entity_key: str, publish_policy: dict):
+        await self._set_storage_sub_parameter(
+            STORAGE_DATA_PUBLISH_POLICIES, entity_key, publish_policy
+        )
+
     async def _set_storage_parameter(self, storage_key: str, value: int | str | bool):
+        if self._data.get(storage_key) == value:
+            return
+
         _LOGGER.debug(f"Changing {storage_key}: {value}")
 
         self._data[storage_key] = value
 
-        await self._save()
+        self._save()
 
     async def _set_storage_sub_parameter(
         self, storage_key: str, storage_item_id, value: int | str | bool
     ):
-        _LOGGER.debug(f"Set {storage_key}, {storage_item_id}: {value}")
+        await self._set_storage_sub_parameters(storage_key, {storage_item_id: value})
+
+    async def _set_storage_sub_parameters(
+        self, storage_key: str, values: dict[str, int | str | bool]
+    ):
+        storage_data = self._data[storage_key]
+
+        changed_values = {
+            storage_item_id: values[storage_item_id]
+            for storage_item_id in values
+            if storage_data.get(storage_item_id) != values[storage_item_id]
+        }
+
+        if len(changed_values) == 0:
+            return
+
+        _LOGGER.debug(f"Set {storage_key}: {changed_values}")
 
-        self._data[storage_key][storage_item_id] = value
+        storage_data.update(changed_values)
 
-        await self._save()
+        self._save()
@@ -0,0 +1,183 @@
+from asyncio import CancelledError, Task, sleep
+from datetime import timedelta
+import logging
+import sys
+from typing import Callable
+
+from homeassistant.core import HomeAssistant
+
+from ..common.connectivity_status import ConnectivityStatus
+from ..common.consts import TASK_CONNECT, TASK_WEBSOCKETS_READER
+from .rest_api import RestAPI
+from .task_manager import TaskManager
+from .websockets import WebSockets
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConnectionSupervisor:
+    """Single flight owner of the login -> REST refresh -> WS connect lifecycle.
+
+    Reconnect requests received while a cycle is running are coalesced into a
+    single additional cycle, the WS reader runs as a task owned by the supervisor.
+    WS only reconnects reuse the REST session, unless a login was requested too.
+    """
+
+    _task: Task | None
+    _ws_task: Task | None
+    _is_pending: bool
+    _is_login_required: bool
+    _delay: timedelta
+    _statistics: dict[str, int]
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: RestAPI,
+        websockets: WebSockets,
+        task_manager: TaskManager,
+        get_can_log_messages: Callable[[], bool],
+    ):
+        self._hass = hass
+        self._task_manager = task_manager
+        self._api = api
+        self._websockets = websockets
+        self._get_can_log_messages = get_can_log_messages
+
+        self._task = None
+        self._ws_task = None
+        self._is_pending = False
+        self._is_login_required = False
+        self._delay = timedelta(0)
+
+        self._statistics = {
+            "requests": 0,
+            "coalesced_requests": 0,
+            "cycles": 0,
+            "logins": 0,
+            "ws_connects": 0,
+            "ws_reconnects": 0,
+        }
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def get_debug_data(self) -> dict:
+        data = {
+            "running": self.is_running,
+            "pending": self._is_pending,
+            "ws_reader_running": self._ws_task is not None and not self._ws_task.done(),
+            **self._statistics,
+        }
+
+        return data
+
+    def request_connect(self, delay: timedelta = timedelta(0)):
+        self._request(delay, True)
+
+    def request_ws_reconnect(self, delay: timedelta = timedelta(0)):
+        self._request(delay, False)
+
+    def _request(self, delay: timedelta, is_login_required: bool):
+        self._statistics["requests"] += 1
+
+        if self._is_pending or self.is_running:
+            self._statistics["coalesced_requests"] += 1
+
+        if self._is_pending:
+            self._delay = max(self._delay, delay)
+            self._is_login_required = self._is_login_required or is_login_required
+
+        else:
+            self._delay = delay
+            self._is_login_required = is_login_required
+
+        self._is_pending = True
+
+        if not self.is_running:
+            self._task = self._task_manager.create_task(self._async_run(), TASK_CONNECT)
+
+    async def async_stop(self):
+        self._is_pending = False
+
+        await self._async_cancel(self._task)
+        self._task = None
+
+        await self._async_stop_websockets()
+
+    async def _async_run(self):
+        while self._is_pending:
+            self._is_pending = False
+            self._statistics["cycles"] += 1
+
+            try:
+                await self._async_connect(self._delay, self._is_login_required)
+
+            except Exception as ex:
+                exc_type, exc_obj, tb = sys.exc_info()
+                line_number = tb.tb_lineno
+
+                _LOGGER.error(f"Failed to connect, Error: {ex}, Line: {line_number}")
+
+    async def _async_connect(self, delay: timedelta, is_login_required: bool):
+        await self._async_stop_websockets()
+
+        if delay.total_seconds() > 0:
+            _LOGGER.debug(f"Connecting in {delay.total_seconds()} seconds")
+
+            await sleep(delay.total_seconds())
+
+        if not is_login_required and self._api.status == ConnectivityStatus.Connected:
+            _LOGGER.debug("Reconnecting WS using the existing REST session")
+
+            self._statistics["ws_reconnects"] += 1
+
+            self._start_websockets()
+
+            return
+
+        self._statistics["logins"] += 1
+
+        await self._api.initialize()
+
+        # Failures are reported by the status signal, which requests the next cycle
+        if self._api.status != ConnectivityStatus.Connected:
+            return
+
+        await self._api.update()
+
+        # REST refresh failed, its status signal requests the next cycle
+        if self._api.status != ConnectivityStatus.Connected:
+            return
+
+        self._websockets.update_api_data(self._api.data, self._get_can_log_messages())
+
+        self._statistics["ws_connects"] += 1
+
+        self._start_websockets()
+
+    def _start_websockets(self):
+        self._ws_task = self._task_manager.create_task(
+            self._websockets.initialize(), TASK_WEBSOCKETS_READER, is_background=True
+        )
+
+    async def _async_stop_websockets(self):
+        await self._async_cancel(self._ws_task)
+        self._ws_task = None
+
+        if self._websockets.status is not None:
+            await self._websockets.terminate()
+
+    @staticmethod
+    async def _async_cancel(task: Task | None):
+        if task is None or task.done():
+            return
+
+        task.cancel()
+
+        try:
+            await task
+
+        except CancelledError:
+            pass
@@ -1,13 +1,13 @@
-from asyncio import sleep
+from asyncio import Lock, Task
 from copy import copy
 from datetime import datetime, timedelta
+from ipaddress import IPv4Network, IPv6Network
 import logging
 import sys
 from typing import Callable
 
 from homeassistant.components.device_tracker import ATTR_IP, ATTR_MAC
-from homeassistant.components.homeassistant import SERVICE_RELOAD_CONFIG_ENTRY
-from homeassistant.const import ATTR_STATE
+from homeassistant.const import ATTR_STATE, EVENT_HOMEASSISTANT_STOP, Platform
 from homeassistant.core import Event, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -15,6 +15,7 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from ..common.connectivity_status import ConnectivityStatus
@@ -23,16 +24,20 @@ from ..common.consts import (
     ACTION_ENTITY_SET_NATIVE_VALUE,
     ACTION_ENTITY_TURN_OFF,
     ACTION_ENTITY_TURN_ON,
+    API_DATA_LAST_UPDATE,
     API_RECONNECT_INTERVAL,
+    API_RECONNECT_MAX_INTERVAL,
+    API_RECONNECT_STATUSES,
     ATTR_ACTIONS,
     ATTR_ATTRIBUTES,
     ATTR_HOSTNAME,
     ATTR_IS_ON,
     ATTR_LAST_ACTIVITY,
     DOMAIN,
-    ENTITY_CONFIG_ENTRY_ID,
-    HA_NAME,
-    HEARTBEAT_INTERVAL,
+    MINIMUM_UPDATE_INTERVAL,
+    PUBLISH_POLICY_DEADBAND,
+    PUBLISH_POLICY_DEADBAND_PERCENTAGE,
+    PUBLISH_POLICY_MIN_PUBLISH_INTERVAL,
     SIGNAL_API_STATUS,
     SIGNAL_DATA_CHANGED,
     SIGNAL_DEVICE_ADDED,
@@ -40,19 +45,39 @@ from ..common.consts import (
     SIGNAL_SYSTEM_ADDED,
     SIGNAL_WS_STATUS,
     SUPPORTED_REMOVED_ENTITIES_DEVICE_TYPES,
+    SYSTEM_DATA_HOSTNAME,
     SYSTEM_INFO_DATA_FW_LATEST_URL,
     SYSTEM_INFO_DATA_FW_LATEST_VERSION,
+    TASK_API_UPDATE,
+    TASK_DATA_CHANGED,
+    TRAFFIC_DATA_AVERAGE_RATE,
+    TRAFFIC_DATA_PEAK_RATE,
+    WS_FAST_RECONNECT_INTERVAL,
     WS_RECONNECT_INTERVAL,
+    WS_RECONNECT_STATUSES,
 )
-from ..common.entity_descriptions import PLATFORMS, IntegrationEntityDescription
-from ..common.enums import DeviceTypes, EntityKeys
+from ..common.entity_descriptions import (
+    PLATFORMS,
+    IntegrationEntityDescription,
+    get_entity_descriptions,
+)
+from ..common.enums import DataSources, DeviceTypes, EntityKeys
 from ..data_processors.base_processor import BaseProcessor
 from ..data_processors.device_processor import DeviceProcessor
 from ..data_processors.interface_processor import InterfaceProcessor
 from ..data_processors.system_processor import SystemProcessor
 from ..models.edge_os_system_data import EdgeOSSystemData
+from ..models.edge_os_traffic_data import EdgeOSTrafficData
+from ..models.unit_context import UnitContext
+from .capture_manager import CaptureManager
 from .config_manager import ConfigManager
+from .connection_supervisor import ConnectionSupervisor
+from .hub import Hub
+from .interface_state_manager import InterfaceStateManager
+from .keep_alive_manager import KeepAliveManager
 from .rest_api import RestAPI
+from .snapshot_manager import SnapshotManager
+from .task_manager import TaskManager
 from .websockets import WebSockets
 
 _LOGGER = logging.getLogger(__name__)
@@ -72,8 +97,21 @@ class Coordinator(DataUpdateCoordinator):
     ] | None
     _system_status_details: dict | None
 
-    _last_update: float
-    _last_heartbeat: float
+    _unsub_api_update: Callable | None
+    _api_reconnect_attempts: int
+    _ws_reconnect_attempts: int
+    _is_ws_session_rejected: bool
+    _is_live: bool
+    _created_at: float
+    _discovered_at: float | None
+    _suppressed_state_updates: dict[str, dict[str, int]]
+    _data_changed_pending: bool
+    _data_changed_task: Task | None
+    _data_changed_counters: dict[str, int]
+    _loaded_platforms: set[Platform]
+    _source_updated_at: dict[DataSources, float]
+    _is_degraded: bool | None
+    _platforms_lock: Lock
 
     def __init__(self, hass, config_manager: ConfigManager):
         """Initialize my coordinator."""
@@ -81,7 +119,9 @@ class Coordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name=config_manager.entry_title,
-            update_interval=timedelta(seconds=config_manager.update_entities_interval),
+            update_interval=self._get_update_interval(
+                config_manager.update_entities_interval
+            ),
             update_method=self._async_update_data,
         )
 
@@ -92,14 +132,40 @@ class Coordinator(DataUpdateCoordinator):
 
         self._api = RestAPI(self.hass, config_data, entry_id)
 
-        self._websockets = WebSockets(self.hass, config_data, entry_id)
+        self._task_manager = TaskManager(self.hass, entry_id)
+
+        self._websockets = WebSockets(
+            self.hass, config_data, entry_id, self._task_manager
+        )
+
+        self._connection_supervisor = ConnectionSupervisor(
+            self.hass,
+            self._api,
+            self._websockets,
+            self._task_manager,
+            lambda: self._config_manager.log_incoming_messages,
+        )
+
+        self._interface_state_manager = InterfaceStateManager(
+            self.hass, self._api, self._task_manager, self._async_update_api
+        )
+
+        self._keep_alive_manager = KeepAliveManager(
+            self.hass,
+            self._api,
+            self._websockets,
+            self._task_manager,
+            self._on_websockets_stalled,
+        )
 
         self._config_manager = config_manager
 
         self._data_mapping = None
 
-        self._last_update = 0
-        self._last_heartbeat = 0
+        self._unsub_api_update = None
+        self._api_reconnect_attempts = 0
+        self._ws_reconnect_attempts = 0
+        self._is_ws_session_rejected = False
 
         self._can_load_components: bool = False
 
@@ -108,6 +174,29 @@ class Coordinator(DataUpdateCoordinator):
         self._interface_processor = InterfaceProcessor(config_manager.config_data)
 
         self._discovered_objects = []
+        self._suppressed_state_updates = {}
+
+        self._data_changed_pending = False
+        self._data_changed_task = None
+        self._data_changed_counters = {"received": 0, "processed": 0}
+
+        self._loaded_platforms = set()
+
+        self._source_updated_at = {}
+        self._is_degraded = None
+        self._platforms_lock = Lock()
+
+        self._unit_context = UnitContext(config_manager.unit)
+
+        self._snapshot_manager = SnapshotManager(self.hass, entry_id)
+        self._capture_manager = CaptureManager(self.hass, entry_id, self._task_manager)
+
+        self._hub = Hub.get_instance(self.hass)
+        self._hub.register(entry_id)
+
+        self._is_live = False
+        self._created_at = datetime.now().timestamp()
+        self._discovered_at = None
 
         self._processors = {
             DeviceTypes.SYSTEM: self._system_processor,
@@ -115,10 +204,24 @@ class Coordinator(DataUpdateCoordinator):
             DeviceTypes.INTERFACE: self._interface_processor,
         }
 
+        self._update_remove_stale_interval()
+
         self._load_signal_handlers()
 
         _LOGGER.debug("Initializing done")
 
+    @property
+    def is_live(self) -> bool:
+        return self._is_live
+
+    @property
+    def loaded_platforms(self) -> list[Platform]:
+        return list(self._loaded_platforms)
+
+    @property
+    def unit_context(self) -> UnitContext:
+        return self._unit_context
+
     @property
     def system(self) -> EdgeOSSystemData | None:
         system = self._system_processor.get()
@@ -147,49 +250,103 @@ class Coordinator(DataUpdateCoordinator):
         await self.initialize()
 
     def _load_signal_handlers(self):
-        loop = self.hass.loop
-
-        @callback
-        def on_api_status_changed(entry_id: str, status: ConnectivityStatus):
-            loop.create_task(self._on_api_status_changed(entry_id, status)).__await__()
-
-        @callback
-        def on_ws_status_changed(entry_id: str, status: ConnectivityStatus):
-            loop.create_task(self._on_ws_status_changed(entry_id, status)).__await__()
-
-        @callback
-        def on_data_changed(entry_id: str):
-            loop.create_task(self._on_data_changed(entry_id)).__await__()
-
         signal_handlers = {
-            SIGNAL_API_STATUS: on_api_status_changed,
-            SIGNAL_WS_STATUS: on_ws_status_changed,
-            SIGNAL_DATA_CHANGED: on_data_changed,
+            SIGNAL_API_STATUS: self._on_api_status_changed,
+            SIGNAL_WS_STATUS: self._on_ws_status_changed,
+            SIGNAL_DATA_CHANGED: self._on_data_changed_signal,
         }
 
         _LOGGER.debug(f"Registering signals for {signal_handlers.keys()}")
 
+        entry_id = self._config_manager.entry_id
+
         for signal in signal_handlers:
             handler = signal_handlers[signal]
 
             self._config_manager.entry.async_on_unload(
-                async_dispatcher_connect(self.hass, signal, handler)
+                async_dispatcher_connect(self.hass, signal.format(entry_id), handler)
             )
 
     async def initialize(self):
         self._build_data_mapping()
 
         entry = self.config_manager.entry
-        await self.hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
         _LOGGER.info(f"Start loading {DOMAIN} integration, Entry ID: {entry.entry_id}")
 
+        entry.async_on_unload(
+            self.hass.bus.async_listen(
+                EVENT_HOMEASSISTANT_STOP, self._on_home_assistant_stop
+            )
+        )
+
+        await self._restore_snapshot()
+
         await self.async_request_refresh()
 
-        await self._api.initialize()
+        self._schedule_api_update()
+
+        self._update_capture()
+
+        self._keep_alive_manager.start()
+
+        self._connection_supervisor.request_connect()
 
     async def terminate(self):
-        await self._websockets.terminate()
+        # Stopped first, a login completing later would resume the API polling
+        await self._connection_supervisor.async_stop()
+
+        self._unschedule_api_update()
+
+        self._keep_alive_manager.stop()
+
+        await self._interface_state_manager.async_stop()
+
+        await self._capture_manager.async_stop()
+
+        await self._save_snapshot()
+
+        await self._task_manager.async_cancel_all()
+
+        self._hub.unregister(self._config_manager.entry_id)
+
+    async def _on_home_assistant_stop(self, _event_data: Event):
+        await self._save_snapshot()
+
+    async def _restore_snapshot(self):
+        snapshot = await self._snapshot_manager.async_load()
+
+        if snapshot is None:
+            return
+
+        system_snapshot = snapshot.get(DeviceTypes.SYSTEM, {})
+        hostname = system_snapshot.get(SYSTEM_DATA_HOSTNAME)
+
+        if hostname is None:
+            return
+
+        _LOGGER.debug(f"Restoring snapshot of {hostname}")
+
+        for processor_type in self._processors:
+            processor = self._processors[processor_type]
+            processor.restore(hostname, snapshot.get(processor_type))
+
+        # Entities are created unavailable until live data arrives
+        await self._discover_items()
+
+    async def _save_snapshot(self):
+        if self._discovered_at is None:
+            return
+
+        await self._snapshot_manager.async_save(self._get_snapshot())
+
+    def _get_snapshot(self) -> dict:
+        snapshot = {
+            processor_type: self._processors[processor_type].get_snapshot()
+            for processor_type in self._processors
+        }
+
+        return snapshot
 
     def get_debug_data(self) -> dict:
         config_data = self._config_manager.get_debug_data()
@@ -197,7 +354,7 @@ class Coordinator(DataUpdateCoordinator):
         data = {
             "config": config_data,
             "data": {
-                "api": self._api.data,
+                "api": self._api.get_debug_data(),
                 "websockets": self._websockets.data,
             },
             "processors": {
@@ -205,120 +362,310 @@ class Coordinator(DataUpdateCoordinator):
                 DeviceTypes.INTERFACE: self._interface_processor.get_all(),
                 DeviceTypes.SYSTEM: self._system_processor.get().to_dict(),
             },
+            "sources": self._get_sources_debug_data(),
+            "hub": self._hub.get_debug_data(),
+            "statistics": {
+                "suppressed_state_updates": self._suppressed_state_updates,
+                "data_changed": self._data_changed_counters,
+                "capture": self._capture_manager.get_debug_data(),
+                "connection": self._connection_supervisor.get_debug_data(),
+                "keep_alive": self._keep_alive_manager.get_debug_data(),
+                "interface_state": self._interface_state_manager.get_debug_data(),
+                "tasks": self._task_manager.get_debug_data(),
+                "unit_context": self._unit_context.to_dict(),
+            },
         }
 
         return data
 
-    async def _on_api_status_changed(self, entry_id: str, status: ConnectivityStatus):
-        if entry_id != self._config_manager.entry_id:
-            return
+    def _get_sources_debug_data(self) -> dict:
+        now = datetime.now().timestamp()
 
+        statuses = {
+            DataSources.API: self._api.status,
+            DataSources.WEBSOCKETS: self._websockets.status,
+        }
+
+        data = {
+            "degraded": self._is_degraded,
+        }
+
+        for source in statuses:
+            updated_at = self._source_updated_at.get(source)
+
+            data[source] = {
+                ATTR_STATE: statuses[source],
+                "last_update": None
+                if updated_at is None
+                else datetime.fromtimestamp(updated_at).isoformat(),
+                "age": None if updated_at is None else round(now - updated_at, 3),
+            }
+
+        return data
+
+    def on_state_update_suppressed(self, entity_key: str, reason: str):
+        key_counters = self._suppressed_state_updates.setdefault(entity_key, {})
+
+        key_counters[reason] = key_counters.get(reason, 0) + 1
+
+    @callback
+    def _on_api_status_changed(self, status: ConnectivityStatus):
         if status == ConnectivityStatus.Connected:
-            await self._api.update()
+            self._api_reconnect_attempts = 0
 
-            self._websockets.update_api_data(
-                self._api.data, self._config_manager.log_incoming_messages
-            )
+            # Polling is stopped on invalid credentials, resume it after a new login
+            if self._unsub_api_update is None:
+                self.update_interval = self._get_update_interval(
+                    self._config_manager.update_entities_interval
+                )
 
-            await self._websockets.initialize()
+                self._schedule_api_update()
 
-        elif status in [ConnectivityStatus.Failed]:
-            await self._websockets.terminate()
+        elif status in API_RECONNECT_STATUSES:
+            # Unreachable routers are retried with a growing delay
+            delay = min(
+                API_RECONNECT_INTERVAL * (2**self._api_reconnect_attempts),
+                API_RECONNECT_MAX_INTERVAL,
+            )
 
-            await sleep(API_RECONNECT_INTERVAL.total_seconds())
+            self._api_reconnect_attempts += 1
 
-            await self._api.initialize()
+            self._connection_supervisor.request_connect(delay)
 
         elif status == ConnectivityStatus.InvalidCredentials:
             self.update_interval = None
 
-    async def _on_ws_status_changed(self, entry_id: str, status: ConnectivityStatus):
-        if entry_id != self._config_manager.entry_id:
-            return
+            self._unschedule_api_update()
+
+    @callback
+    def _on_ws_status_changed(self, status: ConnectivityStatus):
+        if status == ConnectivityStatus.Connected:
+            self._ws_reconnect_attempts = 0
+            self._is_ws_session_rejected = False
+
+        elif status in WS_RECONNECT_STATUSES:
+            # Re-open the WS with the existing session, backing off up to the full interval
+            delay = min(
+                WS_FAST_RECONNECT_INTERVAL * (2**self._ws_reconnect_attempts),
+                WS_RECONNECT_INTERVAL,
+            )
+
+            self._ws_reconnect_attempts += 1
+
+            self._connection_supervisor.request_ws_reconnect(delay)
 
-        if status in [ConnectivityStatus.Failed, ConnectivityStatus.NotConnected]:
-            await self._websockets.terminate()
+        elif status == ConnectivityStatus.InvalidCredentials:
+            # Rejected again right after a new login, do not hammer the router
+            delay = (
+                WS_RECONNECT_INTERVAL if self._is_ws_session_rejected else timedelta(0)
+            )
 
-            await sleep(WS_RECONNECT_INTERVAL.total_seconds())
+            _LOGGER.info(f"WS session rejected, logging in again in {delay}")
 
-            await self._api.initialize()
+            self._is_ws_session_rejected = True
 
-    def _on_system_discovered(self) -> None:
+            self._connection_supervisor.request_connect(delay)
+
+    @callback
+    def _on_websockets_stalled(self, _topics: list[str]):
+        self._connection_supervisor.request_ws_reconnect()
+
+    async def _on_system_discovered(self) -> None:
         key = DeviceTypes.SYSTEM
 
         if key not in self._discovered_objects:
             self._discovered_objects.append(key)
 
+            await self._async_ensure_platforms(DeviceTypes.SYSTEM)
+
             async_dispatcher_send(
                 self.hass,
-                SIGNAL_SYSTEM_ADDED,
-                self._config_manager.entry_id,
+                SIGNAL_SYSTEM_ADDED.format(self._config_manager.entry_id),
                 DeviceTypes.SYSTEM,
             )
 
-    def _on_device_discovered(self, device_mac: str) -> None:
+    async def _on_device_discovered(self, device_mac: str) -> None:
         key = f"{DeviceTypes.DEVICE} {device_mac}"
 
         if key not in self._discovered_objects:
             self._discovered_objects.append(key)
 
+            await self._async_ensure_platforms(DeviceTypes.DEVICE, device_mac)
+
             async_dispatcher_send(
                 self.hass,
-                SIGNAL_DEVICE_ADDED,
-                self._config_manager.entry_id,
+                SIGNAL_DEVICE_ADDED.format(self._config_manager.entry_id),
                 DeviceTypes.DEVICE,
                 device_mac,
             )
 
-    def _on_interface_discovered(self, interface_name: str) -> None:
+    async def _on_interface_discovered(self, interface_name: str) -> None:
         key = f"{DeviceTypes.INTERFACE} {interface_name}"
 
         if key not in self._discovered_objects:
             self._discovered_objects.append(key)
 
+            await self._async_ensure_platforms(DeviceTypes.INTERFACE, interface_name)
+
             async_dispatcher_send(
                 self.hass,
-                SIGNAL_INTERFACE_ADDED,
-                self._config_manager.entry_id,
+                SIGNAL_INTERFACE_ADDED.format(self._config_manager.entry_id),
                 DeviceTypes.INTERFACE,
                 interface_name,
             )
 
-    async def _on_data_changed(self, entry_id: str):
-        if entry_id != self._config_manager.entry_id:
+    async def _async_ensure_platforms(
+        self, device_type: DeviceTypes, item_id: str | None = None
+    ):
+        is_admin = self.system.is_admin
+        is_monitored = self._config_manager.is_monitored(device_type, item_id)
+
+        required_platforms = [
+            platform
+            for platform in PLATFORMS
+            if platform not in self._loaded_platforms
+            and len(
+                get_entity_descriptions(platform, device_type, is_monitored, is_admin)
+            )
+            > 0
+        ]
+
+        if len(required_platforms) == 0:
             return
 
+        async with self._platforms_lock:
+            platforms = [
+                platform
+                for platform in required_platforms
+                if platform not in self._loaded_platforms
+            ]
+
+            if len(platforms) == 0:
+                return
+
+            _LOGGER.debug(f"Loading platforms: {', '.join(platforms)}")
+
+            await self.hass.config_entries.async_forward_entry_setups(
+                self._config_manager.entry, platforms
+            )
+
+            self._loaded_platforms.update(platforms)
+
+    @callback
+    def _on_data_changed_signal(self):
+        # Runs in the event loop as part of the dispatch, changes received while
+        # processing are coalesced into a single pass, passes never overlap
+        self._data_changed_counters["received"] += 1
+        self._data_changed_pending = True
+
+        if self._data_changed_task is None or self._data_changed_task.done():
+            self._data_changed_task = self._task_manager.create_task(
+                self._async_process_data_changes(), TASK_DATA_CHANGED
+            )
+
+    async def _async_process_data_changes(self):
+        while self._data_changed_pending:
+            self._data_changed_pending = False
+            self._data_changed_counters["processed"] += 1
+
+            await self._on_data_changed()
+
+    async def _on_data_changed(self):
         api_connected = self._api.status == ConnectivityStatus.Connected
         ws_client_connected = self._websockets.status == ConnectivityStatus.Connected
 
-        is_ready = api_connected and ws_client_connected
+        if api_connected:
+            self._hub.on_data_changed(self._config_manager.entry_id)
+
+            self._set_degraded(not ws_client_connected)
+
+            ws_data = self._websockets.data if ws_client_connected else None
 
-        if is_ready:
             for processor_type in self._processors:
                 processor = self._processors[processor_type]
-                processor.update(self._api.data, self._websockets.data)
+                processor.update(self._api.data, ws_data)
+
+            self._update_sources_freshness(ws_client_connected)
 
             system = self._system_processor.get()
 
             if system.hostname is None:
                 return
 
-            self._on_system_discovered()
+            self._is_live = True
+
+            await self._discover_items()
+
+            self._on_items_removed()
+
+            self._snapshot_manager.async_schedule_save(self._get_snapshot)
+
+    def _set_degraded(self, is_degraded: bool):
+        if is_degraded == self._is_degraded:
+            return
+
+        self._is_degraded = is_degraded
 
-            devices = self._device_processor.get_devices()
-            interfaces = self._interface_processor.get_interfaces()
+        if is_degraded:
+            _LOGGER.info(
+                "WebSockets is not connected, running in REST only mode, "
+                "live statistics will be updated once it is connected"
+            )
+
+        else:
+            _LOGGER.info("WebSockets is connected, live statistics are available")
+
+    def _update_sources_freshness(self, ws_client_connected: bool):
+        sources = {DataSources.API: self._api.data}
+
+        if ws_client_connected:
+            sources[DataSources.WEBSOCKETS] = self._websockets.data
 
-            for interface_name in interfaces:
-                interface = self._interface_processor.get_data(interface_name)
+        for source in sources:
+            last_update = sources[source].get(API_DATA_LAST_UPDATE)
 
-                if interface.is_supported:
-                    self._on_interface_discovered(interface_name)
+            if last_update is not None:
+                updated_at = datetime.fromisoformat(last_update).timestamp()
 
-            for device_mac in devices:
-                device = self._device_processor.get_data(device_mac)
+                self._source_updated_at[source] = updated_at
+
+    async def _discover_items(self):
+        if self._discovered_at is None:
+            self._discovered_at = datetime.now().timestamp()
+
+            elapsed = self._discovered_at - self._created_at
+            source = "live data" if self._is_live else "snapshot"
+
+            _LOGGER.info(
+                f"Discovering entities {elapsed:.3f} seconds after startup, "
+                f"Source: {source}"
+            )
 
-                if not device.is_leased:
-                    self._on_device_discovered(device_mac)
+        await self._on_system_discovered()
+
+        devices = self._device_processor.get_devices()
+        interfaces = self._interface_processor.get_interfaces()
+
+        for interface_name in interfaces:
+            interface = self._interface_processor.get_data(interface_name)
+
+            if interface.is_supported:
+                await self._on_interface_discovered(interface_name)
+
+        for device_mac in devices:
+            device = self._device_processor.get_data(device_mac)
+
+            if not device.is_leased:
+                await self._on_device_discovered(device_mac)
+
+    def _on_items_removed(self):
+        removed_interfaces = self._interface_processor.pop_removed_items()
+
+        for interface_name in removed_interfaces:
+            self._remove_device_entities(DeviceTypes.INTERFACE, interface_name)
+
+        # Only leased devices are removed, those never get entities
+        self._device_processor.pop_removed_items()
 
     async def _async_update_data(self):
         """Fetch parameters from API endpoint.
@@ -329,32 +676,73 @@ class Coordinator(DataUpdateCoordinator):
         try:
             _LOGGER.debug("Updating data")
 
+            return {}
+
+        except Exception as err:
+            raise UpdateFailed(f"Error communicating with API: {err}")
+
+    @callback
+    def _on_api_update_timer(self, _now: datetime):
+        # Skip the poll while the previous one is still running
+        if self._task_manager.is_running(TASK_API_UPDATE):
+            return
+
+        self._task_manager.create_task(self._async_update_api(), TASK_API_UPDATE)
+
+    async def _async_update_api(self):
+        try:
             api_connected = self._api.status == ConnectivityStatus.Connected
-            ws_client_connected = (
-                self._websockets.status == ConnectivityStatus.Connected
+
+            if api_connected:
+                _LOGGER.debug("Updating API data")
+
+                started_at = datetime.now().timestamp()
+
+                await self._api.update()
+
+                duration = datetime.now().timestamp() - started_at
+                self._hub.on_api_updated(self.config_manager.entry_id, duration)
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(
+                f"Failed to update API data, Error: {ex}, Line: {line_number}"
             )
 
-            is_ready = api_connected and ws_client_connected
+    def _schedule_api_update(self):
+        self._unschedule_api_update()
 
-            if is_ready:
-                now = datetime.now().timestamp()
+        interval = self._get_update_interval(self.config_manager.update_api_interval)
+        offset = self._hub.get_poll_offset(self.config_manager.entry_id, interval)
 
-                if now - self._last_heartbeat >= HEARTBEAT_INTERVAL.total_seconds():
-                    await self._websockets.send_heartbeat()
+        @callback
+        def _start_api_update_timer(_now: datetime):
+            self._unsub_api_update = async_track_time_interval(
+                self.hass,
+                self._on_api_update_timer,
+                interval,
+                name=f"{DOMAIN} {self.config_manager.entry_title} API update",
+            )
 
-                    self._last_heartbeat = now
+        _LOGGER.debug(f"Scheduling API update every {interval}, Offset: {offset}s")
 
-                if now - self._last_update >= self.config_manager.update_api_interval:
-                    await self._api.update()
+        self._unsub_api_update = async_call_later(
+            self.hass, offset, _start_api_update_timer
+        )
 
-                    self._last_update = now
+    def _unschedule_api_update(self):
+        if self._unsub_api_update is not None:
+            self._unsub_api_update()
 
-                    await self._on_data_changed(self.config_manager.entry_id)
+            self._unsub_api_update = None
 
-            return {}
+    @staticmethod
+    def _get_update_interval(interval: float) -> timedelta:
+        update_interval = max(timedelta(seconds=interval), MINIMUM_UPDATE_INTERVAL)
 
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with API: {err}")
+        return update_interval
 
     def _build_data_mapping(self):
         _LOGGER.debug("Building data mappers")
@@ -366,10 +754,12 @@ class Coordinator(DataUpdateCoordinator):
             EntityKeys.LAST_RESTART: self._get_last_restart_data,
             EntityKeys.UNKNOWN_DEVICES: self._get_unknown_devices_data,
             EntityKeys.LOG_INCOMING_MESSAGES: self._get_log_incoming_messages_data,
+            EntityKeys.CAPTURE_DATA: self._get_capture_data_data,
             EntityKeys.CONSIDER_AWAY_INTERVAL: self._get_consider_away_interval_data,
             EntityKeys.UPDATE_ENTITIES_INTERVAL: self._get_update_entities_interval_data,
             EntityKeys.UPDATE_API_INTERVAL: self._get_update_api_interval_data,
             EntityKeys.UNIT: self._get_unit_data,
+            EntityKeys.REMOVE_STALE_INTERVAL: self._get_remove_stale_interval_data,
             EntityKeys.INTERFACE_CONNECTED: self._get_interface_connected_data,
             EntityKeys.INTERFACE_RECEIVED_DROPPED: self._get_interface_received_dropped_data,
             EntityKeys.INTERFACE_SENT_DROPPED: self._get_interface_sent_dropped_data,
@@ -379,12 +769,16 @@ class Coordinator(DataUpdateCoordinator):
             EntityKeys.INTERFACE_SENT_PACKETS: self._get_interface_sent_packets_data,
             EntityKeys.INTERFACE_RECEIVED_RATE: self._get_interface_received_rate_data,
             EntityKeys.INTERFACE_SENT_RATE: self._get_interface_sent_rate_data,
+            EntityKeys.INTERFACE_RECEIVED_SMOOTHED_RATE: self._get_interface_received_smoothed_rate_data,
+            EntityKeys.INTERFACE_SENT_SMOOTHED_RATE: self._get_interface_sent_smoothed_rate_data,
             EntityKeys.INTERFACE_RECEIVED_TRAFFIC: self._get_interface_received_traffic_data,
             EntityKeys.INTERFACE_SENT_TRAFFIC: self._get_interface_sent_traffic_data,
             EntityKeys.INTERFACE_MONITORED: self._get_interface_monitored_data,
             EntityKeys.INTERFACE_STATUS: self._get_interface_status_data,
             EntityKeys.DEVICE_RECEIVED_RATE: self._get_device_received_rate_data,
             EntityKeys.DEVICE_SENT_RATE: self._get_device_sent_rate_data,
+            EntityKeys.DEVICE_RECEIVED_SMOOTHED_RATE: self._get_device_received_smoothed_rate_data,
+            EntityKeys.DEVICE_SENT_SMOOTHED_RATE: self._get_device_sent_smoothed_rate_data,
             EntityKeys.DEVICE_RECEIVED_TRAFFIC: self._get_device_received_traffic_data,
             EntityKeys.DEVICE_SENT_TRAFFIC: self._get_device_sent_traffic_data,
             EntityKeys.DEVICE_TRACKER: self._get_device_tracker_data,
@@ -483,6 +877,15 @@ class Coordinator(DataUpdateCoordinator):
 
         return result
 
+    @staticmethod
+    def _get_rate_history_attributes(traffic_data: EdgeOSTrafficData) -> dict:
+        result = {
+            TRAFFIC_DATA_AVERAGE_RATE: traffic_data.average_rate,
+            TRAFFIC_DATA_PEAK_RATE: traffic_data.peak_rate,
+        }
+
+        return result
+
     def _get_cpu_usage_data(self, _entity_description) -> dict | None:
         data = self._system_processor.get()
 
@@ -534,6 +937,17 @@ class Coordinator(DataUpdateCoordinator):
 
         return result
 
+    def _get_capture_data_data(self, _entity_description) -> dict | None:
+        result = {
+            ATTR_IS_ON: self.config_manager.capture_data,
+            ATTR_ACTIONS: {
+                ACTION_ENTITY_TURN_ON: self._set_capture_data_enabled,
+                ACTION_ENTITY_TURN_OFF: self._set_capture_data_disabled,
+            },
+        }
+
+        return result
+
     def _get_log_incoming_messages_data(self, _entity_description) -> dict | None:
         result = {
             ATTR_IS_ON: self.config_manager.log_incoming_messages,
@@ -585,6 +999,16 @@ class Coordinator(DataUpdateCoordinator):
 
         return result
 
+    def _get_remove_stale_interval_data(self, _entity_description) -> dict | None:
+        result = {
+            ATTR_STATE: self.config_manager.remove_stale_interval,
+            ATTR_ACTIONS: {
+                ACTION_ENTITY_SET_NATIVE_VALUE: self._set_remove_stale_interval,
+            },
+        }
+
+        return result
+
     def _get_interface_connected_data(
         self, _entity_description, interface_name: str
     ) -> dict | None:
@@ -666,6 +1090,30 @@ class Coordinator(DataUpdateCoordinator):
 
         return result
 
+    def _get_interface_received_smoothed_rate_data(
+        self, _entity_description, interface_name: str
+    ) -> dict | None:
+        interface = self._interface_processor.get_data(interface_name)
+
+        result = {
+            ATTR_STATE: interface.received.smoothed_rate,
+            ATTR_ATTRIBUTES: self._get_rate_history_attributes(interface.received),
+        }
+
+        return result
+
+    def _get_interface_sent_smoothed_rate_data(
+        self, _entity_description, interface_name: str
+    ) -> dict | None:
+        interface = self._interface_processor.get_data(interface_name)
+
+        result = {
+            ATTR_STATE: interface.sent.smoothed_rate,
+            ATTR_ATTRIBUTES: self._get_rate_history_attributes(interface.sent),
+        }
+
+        return result
+
     def _get_interface_received_traffic_data(
         self, _entity_description, interface_name: str
     ) -> dict | None:
@@ -734,6 +1182,30 @@ class Coordinator(DataUpdateCoordinator):
 
         return result
 
+    def _get_device_received_smoothed_rate_data(
+        self, _entity_description, device_mac: str
+    ) -> dict | None:
+        device = self._device_processor.get_data(device_mac)
+
+        result = {
+            ATTR_STATE: device.received.smoothed_rate,
+            ATTR_ATTRIBUTES: self._get_rate_history_attributes(device.received),
+        }
+
+        return result
+
+    def _get_device_sent_smoothed_rate_data(
+        self, _entity_description, device_mac: str
+    ) -> dict | None:
+        device = self._device_processor.get_data(device_mac)
+
+        result = {
+            ATTR_STATE: device.sent.smoothed_rate,
+            ATTR_ATTRIBUTES: self._get_rate_history_attributes(device.sent),
+        }
+
+        return result
+
     def _get_device_received_traffic_data(
         self, _entity_description, device_mac: str
     ) -> dict | None:
@@ -794,13 +1266,13 @@ class Coordinator(DataUpdateCoordinator):
         _LOGGER.debug(f"Enable interface {interface_name}")
         interface = self._interface_processor.get_data(interface_name)
 
-        await self._api.set_interface_state(interface, True)
+        await self._interface_state_manager.async_set_state([interface], True)
 
     async def _set_interface_disabled(self, _entity_description, interface_name: str):
         _LOGGER.debug(f"Disable interface {interface_name}")
         interface = self._interface_processor.get_data(interface_name)
 
-        await self._api.set_interface_state(interface, False)
+        await self._interface_state_manager.async_set_state([interface], False)
 
     async def _set_interface_monitor_enabled(
         self, _entity_description, interface_name: str
@@ -834,6 +1306,92 @@ class Coordinator(DataUpdateCoordinator):
 
         await self._remove_entities_of_device(DeviceTypes.DEVICE, device_mac)
 
+    async def set_monitored_devices(
+        self,
+        is_enabled: bool,
+        mac_addresses: list[str] | None = None,
+        hostname_pattern: str | None = None,
+        network: IPv4Network | IPv6Network | None = None,
+    ) -> list[str]:
+        devices = self._device_processor.find_devices(
+            mac_addresses, hostname_pattern, network
+        )
+
+        changed_devices = [
+            device_mac
+            for device_mac in devices
+            if self._config_manager.get_monitored_device(device_mac) != is_enabled
+        ]
+
+        _LOGGER.info(
+            f"Set monitoring {is_enabled} for devices, "
+            f"Matched: {len(devices)}, "
+            f"Changed: {len(changed_devices)}"
+        )
+
+        if len(changed_devices) > 0:
+            await self._config_manager.set_monitored_devices(
+                {device_mac: is_enabled for device_mac in changed_devices}
+            )
+
+            for device_mac in changed_devices:
+                self._remove_device_entities(DeviceTypes.DEVICE, device_mac)
+
+            await self.async_refresh()
+
+        return changed_devices
+
+    async def set_interfaces_state(
+        self, is_enabled: bool, interface_names: list[str]
+    ) -> list[str]:
+        interfaces = []
+
+        for interface_name in interface_names:
+            interface = self._interface_processor.get_data(interface_name)
+
+            if interface is None or not interface.is_supported:
+                _LOGGER.warning(f"Interface {interface_name} cannot be changed")
+
+                continue
+
+            interfaces.append(interface)
+
+        _LOGGER.info(
+            f"Set state {is_enabled} for interfaces, "
+            f"Requested: {len(interface_names)}, "
+            f"Changed: {len(interfaces)}"
+        )
+
+        await self._interface_state_manager.async_set_state(interfaces, is_enabled)
+
+        changed_interfaces = [interface.name for interface in interfaces]
+
+        return changed_interfaces
+
+    async def set_publish_policy(
+        self,
+        entity_key: str,
+        deadband: float | None = None,
+        deadband_percentage: float | None = None,
+        min_publish_interval: int | None = None,
+    ):
+        # Values that are not set fall back to the entity description
+        policy_values = {
+            PUBLISH_POLICY_DEADBAND: deadband,
+            PUBLISH_POLICY_DEADBAND_PERCENTAGE: deadband_percentage,
+            PUBLISH_POLICY_MIN_PUBLISH_INTERVAL: min_publish_interval,
+        }
+
+        publish_policy = {
+            policy_key: value
+            for policy_key, value in policy_values.items()
+            if value is not None
+        }
+
+        _LOGGER.info(f"Set publish policy of {entity_key}: {publish_policy}")
+
+        await self._config_manager.set_publish_policy(entity_key, publish_policy)
+
     async def _set_log_incoming_messages_enabled(self, _entity_description):
         _LOGGER.debug("Enable log incoming messages")
 
@@ -852,6 +1410,33 @@ class Coordinator(DataUpdateCoordinator):
             self._api.data, self.config_manager.log_incoming_messages
         )
 
+    async def _set_capture_data_enabled(self, _entity_description):
+        _LOGGER.debug("Enable capture data")
+
+        await self._config_manager.set_capture_data(True)
+
+        self._update_capture()
+
+    async def _set_capture_data_disabled(self, _entity_description):
+        _LOGGER.debug("Disable capture data")
+
+        await self._config_manager.set_capture_data(False)
+
+        await self._capture_manager.async_stop()
+
+        self._update_capture()
+
+    def _update_capture(self):
+        capture_callback = None
+
+        if self._config_manager.capture_data:
+            self._capture_manager.start()
+
+            capture_callback = self._capture_manager.record
+
+        self._api.set_capture_callback(capture_callback)
+        self._websockets.set_capture_callback(capture_callback)
+
     async def _set_consider_away_interval(self, _entity_description, value: int):
         _LOGGER.debug("Disable log incoming messages")
 
@@ -862,28 +1447,49 @@ class Coordinator(DataUpdateCoordinator):
 
         await self._config_manager.set_update_entities_interval(value)
 
-        await self._reload_integration()
+        self.update_interval = self._get_update_interval(
+            self._config_manager.update_entities_interval
+        )
+
+        # Reschedule the next refresh using the new interval, only while listening
+        if self._listeners:
+            self._schedule_refresh()
 
     async def _set_update_api_interval(self, _entity_description, value: int):
         _LOGGER.debug("Change update API interval")
 
         await self._config_manager.set_update_api_interval(value)
 
-        await self._reload_integration()
+        if self._unsub_api_update is not None:
+            self._schedule_api_update()
 
     async def _set_unit(self, _entity_description, option: str):
         _LOGGER.debug("Change unit settings")
 
         await self._config_manager.set_unit(option)
 
-        await self._remove_entities_of_device()
+        self._unit_context.update(self._config_manager.unit)
+
+        # Sensors apply the new unit in place on the next update
+        self.async_update_listeners()
+
+    async def _set_remove_stale_interval(self, _entity_description, value: int):
+        _LOGGER.debug("Change remove stale items interval")
+
+        await self._config_manager.set_remove_stale_interval(value)
+
+        self._update_remove_stale_interval()
+
+    def _update_remove_stale_interval(self):
+        interval = self._config_manager.remove_stale_interval
+
+        for processor_type in self._processors:
+            processor = self._processors[processor_type]
+            processor.set_remove_stale_interval(interval)
 
     async def _remove_entities_of_device(
         self, device_type: DeviceTypes | None = None, item_id: str | None = None
     ):
-        entity_registry = er.async_get(self.hass)
-        device_registry = dr.async_get(self.hass)
-
         handle_device_types = (
             SUPPORTED_REMOVED_ENTITIES_DEVICE_TYPES
             if device_type is None
@@ -913,33 +1519,38 @@ class Coordinator(DataUpdateCoordinator):
                 ]
 
             for item_id in handle_items:
-                key = f"{device_type_item} {item_id}"
+                self._remove_device_entities(device_type_item, item_id)
 
-                if is_device:
-                    device_info = self._device_processor.get_device_info(item_id)
+            handle_items = None
 
-                else:
-                    device_info = self._interface_processor.get_device_info(item_id)
+        await self.async_refresh()
 
-                _LOGGER.debug(f"Refreshing {device_type_item} {key}: {device_info}")
+    def _remove_device_entities(self, device_type: DeviceTypes, item_id: str):
+        entity_registry = er.async_get(self.hass)
+        device_registry = dr.async_get(self.hass)
 
-                device_info_identifier = device_info.get("identifiers")
-                device_data = device_registry.async_get_device(
-                    identifiers=device_info_identifier
-                )
-                device_id = device_data.id
+        key = f"{device_type} {item_id}"
 
-                entities = entity_registry.entities.get_entries_for_device_id(device_id)
-                for entity in entities:
-                    entity_registry.async_remove(entity.entity_id)
+        if device_type == DeviceTypes.DEVICE:
+            device_info = self._device_processor.get_device_info(item_id)
 
-                self._discovered_objects.remove(key)
+        else:
+            device_info = self._interface_processor.get_device_info(item_id)
 
-            handle_items = None
+        _LOGGER.debug(f"Refreshing {device_type} {key}: {device_info}")
 
-        await self.async_refresh()
+        device_info_identifier = device_info.get("identifiers")
+        device_data = device_registry.async_get_device(
+            identifiers=device_info_identifier
+        )
+
+        if device_data is not None:
+            entities = entity_registry.entities.get_entries_for_device_id(
+                device_data.id
+            )
 
-    async def _reload_integration(self):
-        data = {ENTITY_CONFIG_ENTRY_ID: self.config_manager.entry_id}
+            for entity in entities:
+                entity_registry.async_remove(entity.entity_id)
 
-        await self.hass.services.async_call(HA_NAME, SERVICE_RELOAD_CONFIG_ENTRY, data)
+        if key in self._discovered_objects:
+            self._discovered_objects.remove(key)
@@ -0,0 +1,126 @@
+from datetime import timedelta
+import logging
+
+from aiohttp import ClientSession
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+
+from ..common.consts import DATA_HUB, HUB_POLL_STAGGER_INTERVAL
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Hub:
+    """Shared state of all config entries, multiplexes the monitored routers."""
+
+    _slots: dict[str, int]
+    _metrics: dict[str, dict[str, float]]
+    _websockets_session: ClientSession | None
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass = hass
+
+        self._slots = {}
+        self._metrics = {}
+        self._websockets_session = None
+
+    @staticmethod
+    def get_instance(hass: HomeAssistant | None) -> "Hub | None":
+        if hass is None:
+            return None
+
+        hub = hass.data.get(DATA_HUB)
+
+        if hub is None:
+            hub = Hub(hass)
+
+            hass.data[DATA_HUB] = hub
+
+        return hub
+
+    def register(self, entry_id: str):
+        if entry_id in self._slots:
+            return
+
+        used_slots = self._slots.values()
+        slot = next(
+            slot for slot in range(len(self._slots) + 1) if slot not in used_slots
+        )
+
+        self._slots[entry_id] = slot
+        self._metrics[entry_id] = {
+            "api_updates": 0,
+            "api_update_duration": 0,
+            "data_changes": 0,
+        }
+
+        _LOGGER.debug(f"Registered entry {entry_id}, Slot: {slot}")
+
+    def unregister(self, entry_id: str):
+        self._slots.pop(entry_id, None)
+        self._metrics.pop(entry_id, None)
+
+        _LOGGER.debug(f"Unregistered entry {entry_id}")
+
+    def get_poll_offset(self, entry_id: str, interval: timedelta) -> float:
+        """Delay of the first poll, so REST bursts of the routers don't align."""
+        slot = self._slots.get(entry_id, 0)
+
+        offset = (
+            slot * HUB_POLL_STAGGER_INTERVAL.total_seconds()
+        ) % interval.total_seconds()
+
+        return offset
+
+    def get_websockets_session(self) -> ClientSession:
+        # WS connections are authenticated by the session ID within the
+        # subscription payload, no cookies, a single session serves all routers,
+        # it is kept across reloads and closed by Home Assistant on stop
+        session = self._websockets_session
+
+        if session is None or session.closed:
+            session = async_create_clientsession(hass=self._hass)
+
+            self._websockets_session = session
+
+        return session
+
+    def on_api_updated(self, entry_id: str, duration: float):
+        metrics = self._metrics.get(entry_id)
+
+        if metrics is not None:
+            metrics["api_updates"] += 1
+            metrics["api_update_duration"] += duration
+
+    def on_data_changed(self, entry_id: str):
+        metrics = self._metrics.get(entry_id)
+
+        if metrics is not None:
+            metrics["data_changes"] += 1
+
+    def get_debug_data(self) -> dict:
+        api_updates = 0
+        api_update_duration = 0
+        data_changes = 0
+
+        for entry_id in self._metrics:
+            metrics = self._metrics[entry_id]
+
+            api_updates += metrics["api_updates"]
+            api_update_duration += metrics["api_update_duration"]
+            data_changes += metrics["data_changes"]
+
+        average_api_update_duration = (
+            None if api_updates == 0 else round(api_update_duration / api_updates, 3)
+        )
+
+        data = {
+            "entries": len(self._slots),
+            "slots": self._slots,
+            "api_updates": api_updates,
+            "average_api_update_duration": average_api_update_duration,
+            "data_changes": data_changes,
+        }
+
+        return data
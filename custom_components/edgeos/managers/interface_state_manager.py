@@ -0,0 +1,137 @@
+from asyncio import Future
+from collections.abc import Awaitable
+from datetime import datetime
+import logging
+import sys
+from typing import Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from ..common.consts import INTERFACE_STATE_BATCH_INTERVAL, TASK_INTERFACE_STATE
+from ..models.edge_os_interface_data import EdgeOSInterfaceData
+from .rest_api import RestAPI
+from .task_manager import TaskManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class InterfaceStateManager:
+    """Collects interface state changes into a single router commit.
+
+    Changes requested within the batch interval are sent together (one
+    set.json and one delete.json at most), data is refreshed once afterwards.
+    """
+
+    _changes: dict[str, tuple[EdgeOSInterfaceData, bool]]
+    _future: Future | None
+    _unsub_flush: Callable | None
+    _statistics: dict[str, int]
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: RestAPI,
+        task_manager: TaskManager,
+        on_committed: Callable[[], Awaitable[None]],
+    ):
+        self._hass = hass
+        self._api = api
+        self._task_manager = task_manager
+        self._on_committed = on_committed
+
+        self._changes = {}
+        self._future = None
+        self._unsub_flush = None
+
+        self._statistics = {
+            "requested_changes": 0,
+            "committed_changes": 0,
+            "batches": 0,
+            "failed_batches": 0,
+        }
+
+    def get_debug_data(self) -> dict:
+        data = {
+            "pending_changes": len(self._changes),
+            **self._statistics,
+        }
+
+        return data
+
+    async def async_set_state(
+        self, interfaces: list[EdgeOSInterfaceData], is_enabled: bool
+    ) -> bool:
+        """Queues the changes and waits for the commit of their batch."""
+        if len(interfaces) == 0:
+            return True
+
+        for interface in interfaces:
+            # Latest request of an interface wins within a batch
+            self._changes[interface.name] = (interface, is_enabled)
+
+        self._statistics["requested_changes"] += len(interfaces)
+
+        if self._future is None:
+            self._future = self._hass.loop.create_future()
+
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self._hass, INTERFACE_STATE_BATCH_INTERVAL, self._on_flush_timer
+            )
+
+        return await self._future
+
+    async def async_stop(self):
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+        self._changes = {}
+
+        if self._future is not None and not self._future.done():
+            self._future.set_result(False)
+
+        self._future = None
+
+    @callback
+    def _on_flush_timer(self, _now: datetime):
+        self._unsub_flush = None
+
+        self._task_manager.create_task(self._async_flush(), TASK_INTERFACE_STATE)
+
+    async def _async_flush(self):
+        changes = self._changes
+        future = self._future
+
+        self._changes = {}
+        self._future = None
+
+        is_modified = False
+
+        try:
+            self._statistics["batches"] += 1
+
+            is_modified = await self._api.set_interfaces_state(
+                {interface: is_enabled for interface, is_enabled in changes.values()}
+            )
+
+            if is_modified:
+                self._statistics["committed_changes"] += len(changes)
+
+            else:
+                self._statistics["failed_batches"] += 1
+
+            await self._on_committed()
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(
+                f"Failed to commit interface state changes, Error: {ex}, Line: {line_number}"
+            )
+
+        finally:
+            if future is not None and not future.done():
+                future.set_result(is_modified)
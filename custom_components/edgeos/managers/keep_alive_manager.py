@@ -0,0 +1,125 @@
+from datetime import datetime
+import logging
+from typing import Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from ..common.connectivity_status import ConnectivityStatus
+from ..common.consts import (
+    API_HEARTBEAT_INTERVAL,
+    DOMAIN,
+    TASK_API_HEARTBEAT,
+    TASK_WS_HEARTBEAT,
+    WS_HEARTBEAT_INTERVAL,
+    WS_WATCHDOG_INTERVAL,
+)
+from .rest_api import RestAPI
+from .task_manager import TaskManager
+from .websockets import WebSockets
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class KeepAliveManager:
+    """Dedicated timers keeping the WS and REST sessions alive.
+
+    The WS watchdog reports topics without frames for longer than their
+    expected cadence, a silent router leaves the socket open but idle.
+    """
+
+    _unsubscribers: list[Callable]
+    _last_sent: dict[str, str]
+    _stalls: dict[str, int]
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: RestAPI,
+        websockets: WebSockets,
+        task_manager: TaskManager,
+        on_websockets_stalled: Callable[[list[str]], None],
+    ):
+        self._hass = hass
+        self._api = api
+        self._websockets = websockets
+        self._task_manager = task_manager
+        self._on_websockets_stalled = on_websockets_stalled
+
+        self._unsubscribers = []
+        self._last_sent = {}
+        self._stalls = {}
+
+    def get_debug_data(self) -> dict:
+        data = {
+            "running": len(self._unsubscribers) > 0,
+            "last_sent": self._last_sent,
+            "stalls": self._stalls,
+        }
+
+        return data
+
+    def start(self):
+        self.stop()
+
+        heartbeats = {
+            TASK_WS_HEARTBEAT: (self._on_ws_heartbeat_timer, WS_HEARTBEAT_INTERVAL),
+            TASK_API_HEARTBEAT: (self._on_api_heartbeat_timer, API_HEARTBEAT_INTERVAL),
+        }
+
+        for name in heartbeats:
+            action, interval = heartbeats[name]
+
+            self._unsubscribers.append(
+                async_track_time_interval(
+                    self._hass, action, interval, name=f"{DOMAIN} {name}"
+                )
+            )
+
+        self._unsubscribers.append(
+            async_track_time_interval(
+                self._hass,
+                self._on_ws_watchdog_timer,
+                WS_WATCHDOG_INTERVAL,
+                name=f"{DOMAIN} websockets watchdog",
+            )
+        )
+
+    def stop(self):
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+
+        self._unsubscribers = []
+
+    @callback
+    def _on_ws_heartbeat_timer(self, _now: datetime):
+        if self._websockets.status == ConnectivityStatus.Connected:
+            self._create_task(TASK_WS_HEARTBEAT, self._websockets.send_heartbeat)
+
+    @callback
+    def _on_api_heartbeat_timer(self, _now: datetime):
+        if self._api.status == ConnectivityStatus.Connected:
+            self._create_task(TASK_API_HEARTBEAT, self._api.async_send_heartbeat)
+
+    @callback
+    def _on_ws_watchdog_timer(self, _now: datetime):
+        stalled_topics = self._websockets.get_stalled_topics()
+
+        if len(stalled_topics) == 0:
+            return
+
+        _LOGGER.warning(f"WS stalled, no data received for topics: {stalled_topics}")
+
+        for topic in stalled_topics:
+            self._stalls[topic] = self._stalls.get(topic, 0) + 1
+
+        self._on_websockets_stalled(stalled_topics)
+
+    def _create_task(self, name: str, action: Callable):
+        # Heartbeat still in flight, the next tick will try again
+        if self._task_manager.is_running(name):
+            return
+
+        self._last_sent[name] = datetime.now().isoformat()
+
+        self._task_manager.create_task(action(), name)
@@ -3,13 +3,11 @@ import sys
 
 from cryptography.fernet import Fernet, InvalidToken
 
-from homeassistant.config_entries import STORAGE_VERSION
 from homeassistant.const import CONF_PASSWORD
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.json import JSONEncoder
-from homeassistant.helpers.storage import Store
 
-from ..common.consts import CONFIGURATION_FILE, INVALID_TOKEN_SECTION, STORAGE_DATA_KEY
+from ..common.consts import INVALID_TOKEN_SECTION, STORAGE_DATA_KEY
+from .storage_manager import StorageManager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,13 +24,7 @@ class PasswordManager:
         self._encryption_key = None
         self._crypto = None
 
-        if hass is None:
-            self._store = None
-
-        else:
-            self._store = Store(
-                hass, STORAGE_VERSION, CONFIGURATION_FILE, encoder=JSONEncoder
-            )
+        self._storage_manager = StorageManager.get_instance(hass)
 
     async def initialize(self):
         try:
@@ -76,8 +68,8 @@ class PasswordManager:
     async def _load_encryption_key(self):
         store_data = None
 
-        if self._store is not None:
-            store_data = await self._store.async_load()
+        if self._storage_manager is not None:
+            store_data = await self._storage_manager.async_get_data()
 
         if store_data is not None:
             if STORAGE_DATA_KEY in store_data:
@@ -103,18 +95,16 @@ class PasswordManager:
         self._crypto = Fernet(self._encryption_key.encode())
 
     async def _save(self):
-        if self._store is None:
+        if self._storage_manager is None:
             return
 
-        store_data = await self._store.async_load()
-
-        if store_data is None:
-            store_data = {}
+        store_data = await self._storage_manager.async_get_data()
 
         if store_data.get(STORAGE_DATA_KEY) != self._encryption_key:
             store_data[STORAGE_DATA_KEY] = self._encryption_key
 
-            await self._store.async_save(store_data)
+            # Losing the key makes stored passwords unreadable, save it right away
+            await self._storage_manager.async_save()
 
     def _encrypt(self, data: str) -> str:
         if data is not None:
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 from asyncio import sleep
+from contextlib import suppress
 from datetime import datetime, timedelta
 import json
 import logging
 import sys
-from typing import Any
+from typing import Any, Callable
+from urllib.parse import urlparse
 
 from aiohttp import ClientSession, CookieJar
 
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
-from homeassistant.helpers.dispatcher import dispatcher_send
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from ..common.connectivity_status import ConnectivityStatus
 from ..common.consts import (
@@ -20,13 +23,17 @@ from ..common.consts import (
     API_DATA_COOKIES,
     API_DATA_INTERFACES,
     API_DATA_LAST_UPDATE,
+    API_DATA_PAYLOAD_SIZES,
     API_DATA_PRODUCT,
     API_DATA_SAVE,
     API_DATA_SESSION_ID,
     API_DATA_SYSTEM,
+    API_DATA_SYSTEM_RESPONSE_PATHS,
     API_DELETE,
     API_GET,
+    API_REACHABILITY_TIMEOUT,
     API_SET,
+    API_STREAM_CHUNK_SIZE,
     API_URL_DATA,
     API_URL_DATA_SUBSET,
     API_URL_HEARTBEAT,
@@ -34,6 +41,7 @@ from ..common.consts import (
     API_URL_PARAMETER_BASE_URL,
     API_URL_PARAMETER_SUBSET,
     API_URL_PARAMETER_TIMESTAMP,
+    API_VALIDATION_TIMEOUT,
     COOKIE_BEAKER_SESSION_ID,
     COOKIE_CSRF_TOKEN,
     COOKIE_PHPSESSID,
@@ -41,6 +49,7 @@ from ..common.consts import (
     EMPTY_STRING,
     HEADER_CSRF_TOKEN,
     HEARTBEAT_MAX_AGE,
+    HEARTBEAT_SESSION_LOST_STATUSES,
     MAXIMUM_RECONNECT,
     RESPONSE_ERROR_KEY,
     RESPONSE_FAILURE_CODE,
@@ -54,6 +63,8 @@ from ..common.consts import (
     TRUE_STR,
     UPDATE_DATE_ENDPOINTS,
 )
+from ..common.enums import CaptureSources
+from ..common.json_paths import JsonPathExtractor, extract_paths
 from ..models.config_data import ConfigData
 from ..models.edge_os_interface_data import EdgeOSInterfaceData
 from ..models.exceptions import SessionTerminatedException
@@ -87,6 +98,7 @@ class RestAPI:
             self._config_data = config_data
 
             self._local_async_dispatcher_send = None
+            self._capture_callback = None
 
             self._status = None
 
@@ -156,10 +168,54 @@ class RestAPI:
 
         await self.login()
 
-    async def validate(self):
-        await self.initialize()
+    async def validate(self, timeout: timedelta = API_VALIDATION_TIMEOUT):
+        """Single login within the timeout, the session is closed afterwards."""
+        try:
+            async with asyncio.timeout(timeout.total_seconds()):
+                # Unknown or unreachable hosts fail fast instead of a long HTTP timeout
+                if not await self._async_is_reachable():
+                    self._set_status(ConnectivityStatus.NotFound)
+                    return
 
-        await self.login()
+                self._set_status(ConnectivityStatus.Connecting)
+
+                await self._initialize_session(CookieJar(unsafe=True))
+
+                await self.login()
+
+        except TimeoutError:
+            _LOGGER.warning(f"Failed to validate, Timeout: {timeout.total_seconds()}s")
+
+            self._set_status(ConnectivityStatus.NotFound)
+
+        finally:
+            if self._session is not None and not self._session.closed:
+                await self._session.close()
+
+            self._session = None
+
+    async def _async_is_reachable(self) -> bool:
+        url = urlparse(self._config_data.api_url)
+        port = url.port or (443 if url.scheme == "https" else 80)
+
+        try:
+            _reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(url.hostname, port),
+                API_REACHABILITY_TIMEOUT.total_seconds(),
+            )
+
+            writer.close()
+
+            # Closing may fail on a half open connection, reachability is known
+            with suppress(Exception):
+                await writer.wait_closed()
+
+            return True
+
+        except (OSError, TimeoutError) as ex:
+            _LOGGER.warning(f"{url.hostname}:{port} is not reachable, Error: {ex}")
+
+            return False
 
     def _get_cookie_data(self, cookie_key):
         cookie_data = None
@@ -193,6 +249,8 @@ class RestAPI:
         timestamp: str | None = None,
         action: str | None = None,
         subset: str | None = None,
+        capture_name: str | None = None,
+        paths: list[list[str]] | None = None,
     ):
         result = None
         message = None
@@ -217,7 +275,33 @@ class RestAPI:
                         )
 
                         if status < 400:
-                            result = await response.json()
+                            # Capturing requires the whole response as is
+                            if paths is not None and self._capture_callback is None:
+                                result, size = await self._async_read_paths(
+                                    response, paths
+                                )
+
+                            else:
+                                content = await response.read()
+                                result = json.loads(content)
+                                size = len(content)
+
+                                if paths is not None:
+                                    result = extract_paths(result, paths)
+
+                                if (
+                                    self._capture_callback is not None
+                                    and capture_name is not None
+                                ):
+                                    self._capture_callback(
+                                        CaptureSources.API,
+                                        capture_name,
+                                        content.decode(),
+                                    )
+
+                            if capture_name is not None:
+                                self._set_payload_size(capture_name, "received", size)
+
                             break
                         elif status == 403:
                             self._session = None
@@ -241,6 +325,34 @@ class RestAPI:
 
         return result
 
+    @staticmethod
+    async def _async_read_paths(response, paths: list[list[str]]) -> tuple[dict, int]:
+        extractor = JsonPathExtractor(paths)
+
+        async for chunk in response.content.iter_chunked(API_STREAM_CHUNK_SIZE):
+            extractor.feed(chunk)
+
+        result = extractor.close()
+
+        return result, extractor.size
+
+    def get_debug_data(self) -> dict:
+        system_data = self.data.get(API_DATA_SYSTEM)
+
+        # Kept size is measured on request rather than on every poll
+        if system_data is not None:
+            self._set_payload_size(
+                API_DATA_SYSTEM, "kept", len(json.dumps(system_data))
+            )
+
+        return self.data
+
+    def _set_payload_size(self, name: str, key: str, size: int):
+        payload_sizes = self.data.setdefault(API_DATA_PAYLOAD_SIZES, {})
+        payload_size = payload_sizes.setdefault(name, {})
+
+        payload_size[key] = size
+
     def _get_post_headers(self):
         headers = {}
         for header_key in self._session.headers:
@@ -282,9 +394,7 @@ class RestAPI:
     async def update(self):
         _LOGGER.debug(f"Updating data from device ({self._config_data.hostname})")
 
-        if self.status == ConnectivityStatus.Failed:
-            await self.initialize()
-
+        # Reconnecting is owned by the connection supervisor
         if self.status == ConnectivityStatus.Connected:
             await self._load_system_data()
 
@@ -333,6 +443,8 @@ class RestAPI:
                             self.data[API_DATA_SESSION_ID] = self.session_id
                             self.data[API_DATA_COOKIES] = self._cookies
 
+                            self._last_valid = datetime.now()
+
                             self._set_status(ConnectivityStatus.Connected)
 
                             break
@@ -392,6 +504,11 @@ class RestAPI:
 
             self._async_dispatcher_send(SIGNAL_API_STATUS, status)
 
+    def set_capture_callback(
+        self, capture_callback: Callable[[CaptureSources, str | None, str], None]
+    ):
+        self._capture_callback = capture_callback
+
     def set_local_async_dispatcher_send(self, callback):
         self._local_async_dispatcher_send = callback
 
@@ -400,30 +517,41 @@ class RestAPI:
             self._local_async_dispatcher_send(signal, None, *args)
 
         else:
-            dispatcher_send(self._hass, signal, self._entry_id, *args)
+            async_dispatcher_send(self._hass, signal.format(self._entry_id), *args)
 
     async def async_send_heartbeat(self, max_age=HEARTBEAT_MAX_AGE):
-        ts = None
+        """Checks the session, only the status is used as the page is HTML."""
+        if self.status != ConnectivityStatus.Connected or self._session is None:
+            _LOGGER.debug("Ignoring request to send heartbeat, Reason: closed session")
+            return
+
+        ts = datetime.now()
+
+        # No heartbeat since login, send one right away
+        is_due = self._last_valid is None or ts - self._last_valid > timedelta(
+            seconds=max_age
+        )
+
+        if not is_due:
+            return
+
+        url = self._build_endpoint(API_URL_HEARTBEAT, str(int(ts.timestamp())))
 
         try:
-            if self.status == ConnectivityStatus.Connected:
-                ts = datetime.now()
-                current_invocation = datetime.now() - self._last_valid
-                if current_invocation > timedelta(seconds=max_age):
-                    current_ts = str(int(ts.timestamp()))
+            async with self._session.get(url, ssl=False) as response:
+                status = response.status
 
-                    response = await self._async_get(
-                        API_URL_HEARTBEAT, timestamp=current_ts
-                    )
+            if status < 300:
+                self._last_valid = ts
 
-                    if response is not None:
-                        _LOGGER.debug(f"Heartbeat response: {response}")
+            elif status in HEARTBEAT_SESSION_LOST_STATUSES:
+                _LOGGER.warning(f"Heartbeat failed, session lost, Status: {status}")
+
+                self._set_status(ConnectivityStatus.Disconnected)
 
-                        self._last_valid = ts
             else:
-                _LOGGER.debug(
-                    "Ignoring request to send heartbeat, Reason: closed session"
-                )
+                _LOGGER.warning(f"Heartbeat failed, Status: {status}")
+
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
@@ -432,15 +560,16 @@ class RestAPI:
                 f"Failed to perform heartbeat, Error: {ex}, Line: {line_number}"
             )
 
-        is_valid = ts is not None and self._last_valid == ts
-
-        if not is_valid:
-            self._set_status(ConnectivityStatus.Disconnected)
-
     async def _load_system_data(self):
         try:
             if self.status == ConnectivityStatus.Connected:
-                result_json = await self._async_get(API_URL_DATA, action=API_GET)
+                # Firewall and NAT rules may be huge, keep only what is used
+                result_json = await self._async_get(
+                    API_URL_DATA,
+                    action=API_GET,
+                    capture_name=API_DATA_SYSTEM,
+                    paths=API_DATA_SYSTEM_RESPONSE_PATHS,
+                )
 
                 if result_json is not None:
                     if RESPONSE_SUCCESS_KEY in result_json:
@@ -450,9 +579,9 @@ class RestAPI:
 
                         if success_key == TRUE_STR:
                             if API_GET.upper() in result_json:
-                                self.data[API_DATA_SYSTEM] = result_json.get(
-                                    API_GET.upper(), {}
-                                )
+                                system_data = result_json.get(API_GET.upper(), {})
+
+                                self.data[API_DATA_SYSTEM] = system_data
                         else:
                             error_message = result_json[RESPONSE_ERROR_KEY]
                             _LOGGER.error(f"Failed, Error: {error_message}")
@@ -478,7 +607,10 @@ class RestAPI:
                 clean_item = key.replace(STRING_DASH, STRING_UNDERSCORE)
 
                 data = await self._async_get(
-                    API_URL_DATA_SUBSET, action=API_DATA, subset=clean_item
+                    API_URL_DATA_SUBSET,
+                    action=API_DATA,
+                    subset=clean_item,
+                    capture_name=key,
                 )
 
                 if data is not None:
@@ -500,33 +632,56 @@ class RestAPI:
 
             _LOGGER.error(f"Failed to load {key}, Error: {ex}, Line: {line_number}")
 
-    async def set_interface_state(
-        self, interface: EdgeOSInterfaceData, is_enabled: bool
-    ):
-        _LOGGER.info(f"Set state of interface {interface.name} to {is_enabled}")
+    async def set_interfaces_state(
+        self, changes: dict[EdgeOSInterfaceData, bool]
+    ) -> bool:
+        """Applies all changes with one commit per action (set / delete)."""
+        is_modified = True
 
-        modified = False
-        action = API_DELETE if is_enabled else API_SET
+        for action in [API_DELETE, API_SET]:
+            # Enabling an interface deletes its disable flag, disabling sets it
+            is_enabled = action == API_DELETE
 
-        data = {
-            API_DATA_INTERFACES: {
-                interface.interface_type: {interface.name: {SYSTEM_DATA_DISABLE: None}}
-            }
-        }
+            interfaces = [
+                interface for interface in changes if changes[interface] == is_enabled
+            ]
 
-        result_json = await self._async_post(API_URL_DATA, data, action=action)
+            if len(interfaces) == 0:
+                continue
 
-        if result_json is not None:
-            set_response = result_json.get(API_DATA_SAVE.upper(), {})
+            names = [interface.name for interface in interfaces]
 
-            if RESPONSE_SUCCESS_KEY in set_response:
-                success_key = str(
-                    set_response.get(RESPONSE_SUCCESS_KEY, RESPONSE_FAILURE_CODE)
-                ).lower()
+            _LOGGER.info(f"Set state of interfaces {names} to {is_enabled}")
 
-                modified = success_key != RESPONSE_FAILURE_CODE
+            data = {API_DATA_INTERFACES: {}}
 
-        if not modified:
-            _LOGGER.error(
-                f"Failed to set state of interface {interface.name} to {is_enabled}"
-            )
+            for interface in interfaces:
+                interface_types = data[API_DATA_INTERFACES]
+                interface_type = interface_types.setdefault(
+                    interface.interface_type, {}
+                )
+
+                interface_type[interface.name] = {SYSTEM_DATA_DISABLE: None}
+
+            result_json = await self._async_post(API_URL_DATA, data, action=action)
+
+            modified = False
+
+            if result_json is not None:
+                set_response = result_json.get(API_DATA_SAVE.upper(), {})
+
+                if RESPONSE_SUCCESS_KEY in set_response:
+                    success_key = str(
+                        set_response.get(RESPONSE_SUCCESS_KEY, RESPONSE_FAILURE_CODE)
+                    ).lower()
+
+                    modified = success_key != RESPONSE_FAILURE_CODE
+
+            if not modified:
+                _LOGGER.error(
+                    f"Failed to set state of interfaces {names} to {is_enabled}"
+                )
+
+                is_modified = False
+
+        return is_modified
@@ -0,0 +1,67 @@
+from datetime import datetime
+import logging
+import sys
+from typing import Callable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.storage import Store
+
+from ..common.consts import (
+    SNAPSHOT_FILE,
+    SNAPSHOT_SAVE_INTERVAL,
+    SNAPSHOT_STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SnapshotManager:
+    """Last known inventory of a config entry, used to create entities on startup."""
+
+    _store: Store
+    _last_saved: float
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self._hass = hass
+
+        self._last_saved = 0
+
+        self._store = Store(
+            hass,
+            SNAPSHOT_STORAGE_VERSION,
+            SNAPSHOT_FILE.format(entry_id),
+            encoder=JSONEncoder,
+        )
+
+    async def async_load(self) -> dict | None:
+        snapshot = None
+
+        try:
+            snapshot = await self._store.async_load()
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(f"Failed to load snapshot, Error: {ex}, Line: {line_number}")
+
+        return snapshot
+
+    def async_schedule_save(self, data_func: Callable[[], dict]):
+        now = datetime.now().timestamp()
+
+        if now - self._last_saved < SNAPSHOT_SAVE_INTERVAL.total_seconds():
+            return
+
+        self._last_saved = now
+
+        self._store.async_delay_save(data_func)
+
+    async def async_save(self, data: dict):
+        self._last_saved = datetime.now().timestamp()
+
+        await self._store.async_save(data)
+
+    async def async_remove(self):
+        await self._store.async_remove()
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+
+from homeassistant.config_entries import STORAGE_VERSION
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.storage import Store
+
+from ..common.consts import (
+    CONFIGURATION_FILE,
+    CONFIGURATION_SAVE_DELAY,
+    DATA_STORAGE_MANAGER,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StorageManager:
+    """In memory copy of the configuration file, shared by all config entries."""
+
+    _data: dict | None
+    _store: Store
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass = hass
+
+        self._data = None
+        self._lock = asyncio.Lock()
+
+        self._store = Store(
+            hass, STORAGE_VERSION, CONFIGURATION_FILE, encoder=JSONEncoder
+        )
+
+    @property
+    def data(self) -> dict | None:
+        return self._data
+
+    @staticmethod
+    def get_instance(hass: HomeAssistant | None) -> "StorageManager | None":
+        if hass is None:
+            return None
+
+        storage_manager = hass.data.get(DATA_STORAGE_MANAGER)
+
+        if storage_manager is None:
+            storage_manager = StorageManager(hass)
+
+            hass.data[DATA_STORAGE_MANAGER] = storage_manager
+
+        return storage_manager
+
+    async def async_get_data(self) -> dict:
+        async with self._lock:
+            if self._data is None:
+                store_data = await self._store.async_load()
+
+                self._data = {} if store_data is None else store_data
+
+        return self._data
+
+    def async_delay_save(self):
+        _LOGGER.debug(f"Scheduling save of {CONFIGURATION_FILE}")
+
+        self._store.async_delay_save(self._get_data_to_save, CONFIGURATION_SAVE_DELAY)
+
+    async def async_save(self):
+        _LOGGER.debug(f"Saving {CONFIGURATION_FILE}")
+
+        await self._store.async_save(self._get_data_to_save())
+
+    def _get_data_to_save(self) -> dict:
+        return self._data
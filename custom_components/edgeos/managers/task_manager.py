@@ -0,0 +1,75 @@
+from asyncio import Task, gather
+from collections.abc import Coroutine
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from ..common.consts import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TaskManager:
+    """Owns the background tasks of a config entry, cancels them on unload."""
+
+    _tasks: dict[Task, str]
+    _created: dict[str, int]
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self._hass = hass
+        self._entry_id = entry_id
+
+        self._tasks = {}
+        self._created = {}
+
+    def is_running(self, name: str) -> bool:
+        return name in self._tasks.values()
+
+    def create_task(
+        self, target: Coroutine[Any, Any, Any], name: str, is_background: bool = False
+    ) -> Task:
+        task_name = f"{DOMAIN} {self._entry_id} {name}"
+
+        # Background tasks are not awaited by Home Assistant on shutdown
+        if is_background:
+            task = self._hass.async_create_background_task(target, task_name)
+
+        else:
+            task = self._hass.async_create_task(target, task_name)
+
+        self._tasks[task] = name
+        self._created[name] = self._created.get(name, 0) + 1
+
+        task.add_done_callback(self._on_task_done)
+
+        return task
+
+    async def async_cancel_all(self):
+        tasks = list(self._tasks.keys())
+
+        if len(tasks) == 0:
+            return
+
+        _LOGGER.debug(f"Cancelling {len(tasks)} tasks of entry {self._entry_id}")
+
+        for task in tasks:
+            task.cancel()
+
+        await gather(*tasks, return_exceptions=True)
+
+    def get_debug_data(self) -> dict:
+        running: dict[str, int] = {}
+
+        for name in self._tasks.values():
+            running[name] = running.get(name, 0) + 1
+
+        data = {
+            "running": running,
+            "created": self._created,
+        }
+
+        return data
+
+    def _on_task_done(self, task: Task):
+        self._tasks.pop(task, None)
@@ -13,8 +13,7 @@ import aiohttp
 from aiohttp import ClientSession
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
-from homeassistant.helpers.dispatcher import dispatcher_send
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from ..common.connectivity_status import ConnectivityStatus
 from ..common.consts import (
@@ -36,25 +35,36 @@ from ..common.consts import (
     SIGNAL_WS_STATUS,
     STRING_COLON,
     STRING_COMMA,
+    TASK_WS_CONSUMER,
     TRAFFIC_DATA_DEVICE_ITEMS,
     TRAFFIC_DATA_DIRECTIONS,
     TRAFFIC_DATA_INTERFACE_ITEMS,
     WS_CLOSING_MESSAGE,
     WS_COMPRESSION_DEFLATE,
     WS_DISCOVER_KEY,
+    WS_DROPPED_MESSAGES,
     WS_EXPORT_KEY,
     WS_IGNORED_MESSAGES,
     WS_INTERFACES_KEY,
+    WS_LOSSLESS_TOPICS,
+    WS_MAILBOX_DEPTH,
+    WS_MAILBOX_MAX_DEPTH,
     WS_MAX_MSG_SIZE,
+    WS_OPTIONAL_TOPICS,
     WS_RECEIVED_MESSAGES,
     WS_SESSION_ID,
+    WS_SESSION_REJECTED_STATUSES,
+    WS_STALL_TIMEOUTS,
     WS_SYSTEM_STATS_KEY,
     WS_TIMEOUT,
     WS_TOPIC_NAME,
     WS_TOPIC_SUBSCRIBE,
     WS_TOPIC_UNSUBSCRIBE,
 )
+from ..common.enums import CaptureSources
 from ..models.config_data import ConfigData
+from .hub import Hub
+from .task_manager import TaskManager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,18 +76,28 @@ class WebSockets:
     _api_data: dict
     _config_data: ConfigData
     _entry_id: str | None
+    _task_manager: TaskManager | None
 
     _status: ConnectivityStatus | None
     _on_status_changed: Callable[[ConnectivityStatus], Awaitable[None]]
     _previous_message: dict | None
+    _mailbox: dict[str, list]
+    _connected_at: float | None
+    _topic_updated_at: dict[str, float]
+    _has_received_frames: bool
 
     def __init__(
-        self, hass: HomeAssistant, config_data: ConfigData, entry_id: str | None = None
+        self,
+        hass: HomeAssistant,
+        config_data: ConfigData,
+        entry_id: str | None = None,
+        task_manager: TaskManager | None = None,
     ):
         try:
             self._hass = hass
             self._config_data = config_data
             self._entry_id = entry_id
+            self._task_manager = task_manager
 
             self._status = None
             self._session = None
@@ -94,6 +114,14 @@ class WebSockets:
             self._remove_async_track_time = None
 
             self._local_async_dispatcher_send = None
+            self._capture_callback = None
+
+            self._mailbox = {}
+            self._mailbox_event = asyncio.Event()
+
+            self._connected_at = None
+            self._topic_updated_at = {}
+            self._has_received_frames = False
 
             self._messages_handler: dict = self._get_ws_handlers()
 
@@ -138,6 +166,29 @@ class WebSockets:
 
         return api_cookies
 
+    def get_stalled_topics(self) -> list[str]:
+        """Topics without a frame for longer than their expected cadence."""
+        stalled_topics = []
+
+        if self.status != ConnectivityStatus.Connected or self._connected_at is None:
+            return stalled_topics
+
+        now = datetime.now().timestamp()
+
+        for topic in WS_STALL_TIMEOUTS:
+            updated_at = self._topic_updated_at.get(topic)
+
+            if updated_at is None:
+                if topic in WS_OPTIONAL_TOPICS:
+                    continue
+
+                updated_at = self._connected_at
+
+            if now - updated_at > WS_STALL_TIMEOUTS[topic].total_seconds():
+                stalled_topics.append(topic)
+
+        return stalled_topics
+
     def update_api_data(self, api_data: dict, can_log_messages: bool):
         self._api_data = api_data
         self._can_log_messages = can_log_messages
@@ -157,7 +208,29 @@ class WebSockets:
                 compress=WS_COMPRESSION_DEFLATE,
             ) as ws:
                 self._ws = ws
-                await self._listen()
+
+                self._mailbox = {}
+
+                consumer_task = self._task_manager.create_task(
+                    self._consume_messages(), TASK_WS_CONSUMER, is_background=True
+                )
+
+                try:
+                    await self._listen()
+
+                finally:
+                    consumer_task.cancel()
+
+        except aiohttp.WSServerHandshakeError as hsex:
+            if hsex.status in WS_SESSION_REJECTED_STATUSES:
+                _LOGGER.warning(f"WS session rejected, Status: {hsex.status}")
+
+                self._set_status(ConnectivityStatus.InvalidCredentials)
+
+            else:
+                _LOGGER.warning(f"Failed to connect WS, Error: {hsex}")
+
+                self._set_status(ConnectivityStatus.Failed)
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -182,18 +255,20 @@ class WebSockets:
             self._remove_async_track_time()
             self._remove_async_track_time = None
 
-        if self._ws is not None:
+        # Socket dropped by the network or the router, nothing to wait for
+        if self._ws is not None and not self._ws.closed:
             await self._ws.close()
 
             await asyncio.sleep(DISCONNECT_INTERVAL)
 
         self._set_status(ConnectivityStatus.Disconnected)
         self._ws = None
+        self._connected_at = None
 
     async def _initialize_session(self):
         try:
             if self._is_home_assistant:
-                self._session = async_create_clientsession(hass=self._hass)
+                self._session = Hub.get_instance(self._hass).get_websockets_session()
 
             else:
                 self._session = ClientSession()
@@ -239,6 +314,10 @@ class WebSockets:
         subscription_data = self._get_subscription_data()
         await self._ws.send_str(subscription_data)
 
+        self._connected_at = datetime.now().timestamp()
+        self._topic_updated_at = {}
+        self._has_received_frames = False
+
         self._set_status(ConnectivityStatus.Connected)
 
         async for msg in self._ws:
@@ -271,18 +350,98 @@ class WebSockets:
                     f"Exception: {self._ws.exception()}"
                 )
 
-                self._set_status(ConnectivityStatus.NotConnected)
+                if is_closing_type or is_closing_data:
+                    self._set_closed_status()
+
+                else:
+                    self._set_status(ConnectivityStatus.NotConnected)
+
                 return
 
             elif can_try_parse_message:
+                self._has_received_frames = True
+
                 if self._can_log_messages:
                     _LOGGER.debug(f"Message received: {str(msg)}")
 
                 self.data[API_DATA_LAST_UPDATE] = datetime.now().isoformat()
 
-                await self._parse_message(msg.data)
+                if self._capture_callback is not None:
+                    self._capture_callback(CaptureSources.WEBSOCKETS, None, msg.data)
+
+                self._post_message(msg.data)
+
+        # Iteration ends without a closing message once the socket was closed
+        self._set_closed_status()
+
+    def _set_closed_status(self):
+        # Router closes the socket right after subscribing with a stale session
+        if self._has_received_frames:
+            self._set_status(ConnectivityStatus.NotConnected)
+
+        else:
+            self._set_status(ConnectivityStatus.InvalidCredentials)
 
     async def _parse_message(self, message: str):
+        payload_json = self._read_message(message)
+
+        if payload_json is not None:
+            await self._message_handler(payload_json)
+
+            self._async_dispatcher_send(SIGNAL_DATA_CHANGED)
+
+    def _post_message(self, message: str):
+        """Reader side, queues the message per topic for the consumer."""
+        payload_json = self._read_message(message)
+
+        if payload_json is None:
+            return
+
+        dropped_messages = self.data.setdefault(WS_DROPPED_MESSAGES, {})
+        now = datetime.now().timestamp()
+
+        for topic in payload_json:
+            self._topic_updated_at[topic] = now
+
+            topic_messages = self._mailbox.setdefault(topic, [])
+
+            if len(topic_messages) > 0 and topic not in WS_LOSSLESS_TOPICS:
+                topic_messages.clear()
+
+                dropped_messages[topic] = dropped_messages.get(topic, 0) + 1
+
+            topic_messages.append(payload_json.get(topic))
+
+        depth = sum(len(topic_messages) for topic_messages in self._mailbox.values())
+
+        self.data[WS_MAILBOX_DEPTH] = depth
+        self.data[WS_MAILBOX_MAX_DEPTH] = max(
+            depth, self.data.get(WS_MAILBOX_MAX_DEPTH, 0)
+        )
+
+        self._mailbox_event.set()
+
+    async def _consume_messages(self):
+        """Consumer side, handles the latest message of each topic."""
+        while True:
+            await self._mailbox_event.wait()
+
+            self._mailbox_event.clear()
+
+            mailbox = self._mailbox
+
+            self._mailbox = {}
+            self.data[WS_MAILBOX_DEPTH] = 0
+
+            for topic in mailbox:
+                for data in mailbox[topic]:
+                    await self._message_handler({topic: data})
+
+            self._async_dispatcher_send(SIGNAL_DATA_CHANGED)
+
+    def _read_message(self, message: str) -> dict | None:
+        payload_json = None
+
         try:
             self._increase_counter(WS_RECEIVED_MESSAGES)
 
@@ -295,9 +454,6 @@ class WebSockets:
                 if len(message_json.strip()) > 0:
                     payload_json = json.loads(message_json)
 
-                    await self._message_handler(payload_json)
-
-                    self._async_dispatcher_send(SIGNAL_DATA_CHANGED)
             else:
                 self._increase_counter(WS_IGNORED_MESSAGES)
 
@@ -324,6 +480,8 @@ class WebSockets:
                 f"Parse message failed, Data: {message}, Error: {ex}, Line: {line_number}"
             )
 
+        return payload_json
+
     def _get_corrected_message(self, message):
         original_message = message
         previous_message = self._previous_message.get("Content")
@@ -395,6 +553,11 @@ class WebSockets:
                 status,
             )
 
+    def set_capture_callback(
+        self, capture_callback: Callable[[CaptureSources, str | None, str], None]
+    ):
+        self._capture_callback = capture_callback
+
     def set_local_async_dispatcher_send(self, callback):
         self._local_async_dispatcher_send = callback
 
@@ -403,7 +566,7 @@ class WebSockets:
             self._local_async_dispatcher_send(signal, self._entry_id, *args)
 
         else:
-            dispatcher_send(self._hass, signal, self._entry_id, *args)
+            async_dispatcher_send(self._hass, signal.format(self._entry_id), *args)
 
     def _increase_counter(self, key):
         counter = self.data.get(key, 0)
@@ -495,6 +658,8 @@ class WebSockets:
                 _LOGGER.debug(f"{WS_INTERFACES_KEY} is empty")
                 return
 
+            interfaces = {}
+
             for name in data:
                 interface_data = data.get(name)
 
@@ -521,7 +686,11 @@ class WebSockets:
                         if item in INTERFACES_MAIN_MAP:
                             interface[item] = item_data
 
-                self.data[WS_INTERFACES_KEY][name] = interface
+                interfaces[name] = interface
+
+            # Each message holds all interfaces, replacing the previous snapshot
+            # allows vanished interfaces to be removed by the processor
+            self.data[WS_INTERFACES_KEY] = interfaces
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
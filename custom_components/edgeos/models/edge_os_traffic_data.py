@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+from array import array
 from datetime import datetime, timedelta
 
 from ..common.consts import (
+    TRAFFIC_DATA_AVERAGE_RATE,
     TRAFFIC_DATA_DIRECTION,
     TRAFFIC_DATA_DROPPED,
     TRAFFIC_DATA_ERRORS,
     TRAFFIC_DATA_LAST_ACTIVITY,
     TRAFFIC_DATA_LAST_ACTIVITY_IN_SECONDS,
     TRAFFIC_DATA_PACKETS,
+    TRAFFIC_DATA_PEAK_RATE,
     TRAFFIC_DATA_RATE,
+    TRAFFIC_DATA_SMOOTHED_RATE,
     TRAFFIC_DATA_TOTAL,
+    TRAFFIC_RATE_HISTORY_SIZE,
+    TRAFFIC_RATE_SMOOTHING_FACTOR,
 )
 
 
@@ -22,6 +28,10 @@ class EdgeOSTrafficData:
     errors: float | None
     packets: float | None
     last_activity: float
+    smoothed_rate: float
+    _rate_history: array
+    _rate_history_index: int
+    _rate_history_count: int
 
     def __init__(self, direction: str):
         self.direction = direction
@@ -31,8 +41,30 @@ class EdgeOSTrafficData:
         self.errors = None
         self.packets = None
         self.last_activity = 0
+        self.smoothed_rate = 0
 
-    def update(self, data: dict):
+        # Fixed size ring buffer, memory per direction stays constant
+        self._rate_history = array("d", [0.0] * TRAFFIC_RATE_HISTORY_SIZE)
+        self._rate_history_index = 0
+        self._rate_history_count = 0
+
+    @property
+    def average_rate(self) -> float:
+        if self._rate_history_count == 0:
+            return 0
+
+        total_rate = sum(self._rate_history[: self._rate_history_count])
+
+        return total_rate / self._rate_history_count
+
+    @property
+    def peak_rate(self) -> float:
+        if self._rate_history_count == 0:
+            return 0
+
+        return max(self._rate_history[: self._rate_history_count])
+
+    def update(self, data: dict, is_new_sample: bool = True):
         self.rate = data.get(TRAFFIC_DATA_RATE, 0)
         self.total = data.get(TRAFFIC_DATA_TOTAL, 0)
         self.dropped = data.get(TRAFFIC_DATA_DROPPED)
@@ -43,6 +75,26 @@ class EdgeOSTrafficData:
             now = datetime.now().timestamp()
             self.last_activity = float(now)
 
+        if is_new_sample:
+            self._add_rate_sample(self.rate)
+
+    def _add_rate_sample(self, rate: float):
+        if self._rate_history_count == 0:
+            self.smoothed_rate = rate
+
+        else:
+            self.smoothed_rate += TRAFFIC_RATE_SMOOTHING_FACTOR * (
+                rate - self.smoothed_rate
+            )
+
+        self._rate_history[self._rate_history_index] = rate
+        self._rate_history_index = (
+            self._rate_history_index + 1
+        ) % TRAFFIC_RATE_HISTORY_SIZE
+
+        if self._rate_history_count < TRAFFIC_RATE_HISTORY_SIZE:
+            self._rate_history_count += 1
+
     def to_dict(self):
         now = datetime.now().timestamp()
         diff = (
@@ -54,6 +106,9 @@ class EdgeOSTrafficData:
         obj = {
             TRAFFIC_DATA_DIRECTION: self.direction,
             TRAFFIC_DATA_RATE: self.rate,
+            TRAFFIC_DATA_SMOOTHED_RATE: self.smoothed_rate,
+            TRAFFIC_DATA_AVERAGE_RATE: self.average_rate,
+            TRAFFIC_DATA_PEAK_RATE: self.peak_rate,
             TRAFFIC_DATA_TOTAL: self.total,
             TRAFFIC_DATA_LAST_ACTIVITY: self.last_activity,
             TRAFFIC_DATA_LAST_ACTIVITY_IN_SECONDS: diff,
@@ -0,0 +1,54 @@
+from typing import Callable
+
+from homeassistant.const import UnitOfDataRate, UnitOfInformation
+
+from ..common.consts import (
+    ATTR_UNIT_CONVERTOR,
+    ATTR_UNIT_INFORMATION,
+    ATTR_UNIT_RATE,
+    UNIT_MAPPING,
+)
+
+
+class UnitContext:
+    unit: str | None
+    information: UnitOfInformation
+    rate: UnitOfDataRate
+    convertor: Callable[[float], float]
+    format_digits: int
+    version: int
+
+    def __init__(self, unit: str):
+        self.unit = None
+        self.version = 0
+
+        self.update(unit)
+
+    def update(self, unit: str):
+        unit_settings = UNIT_MAPPING.get(unit, {})
+
+        self.unit = unit
+        self.information = unit_settings.get(
+            ATTR_UNIT_INFORMATION, UnitOfInformation.BYTES
+        )
+        self.rate = unit_settings.get(ATTR_UNIT_RATE, UnitOfDataRate.BYTES_PER_SECOND)
+        self.convertor = unit_settings.get(ATTR_UNIT_CONVERTOR, lambda v: v)
+        self.format_digits = 0 if self.information == UnitOfInformation.BYTES else 3
+
+        # Sensors compare the version to apply a unit change in place
+        self.version += 1
+
+    def to_dict(self):
+        obj = {
+            "unit": self.unit,
+            "information": self.information,
+            "rate": self.rate,
+            "version": self.version,
+        }
+
+        return obj
+
+    def __repr__(self):
+        to_string = f"{self.to_dict()}"
+
+        return to_string
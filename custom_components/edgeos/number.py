@@ -1,5 +1,8 @@
+from __future__ import annotations
+
 from abc import ABC
 import logging
+from typing import TYPE_CHECKING
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
@@ -10,7 +13,9 @@ from .common.base_entity import IntegrationBaseEntity, async_setup_base_entry
 from .common.consts import ACTION_ENTITY_SET_NATIVE_VALUE, ATTR_ATTRIBUTES
 from .common.entity_descriptions import IntegrationNumberEntityDescription
 from .common.enums import DeviceTypes
-from .managers.coordinator import Coordinator
+
+if TYPE_CHECKING:
+    from .managers.coordinator import Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
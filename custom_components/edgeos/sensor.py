@@ -1,29 +1,25 @@
+from __future__ import annotations
+
 import logging
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    ATTR_ICON,
-    ATTR_STATE,
-    Platform,
-    UnitOfDataRate,
-    UnitOfInformation,
-)
+from homeassistant.const import ATTR_ICON, ATTR_STATE, Platform
 from homeassistant.core import HomeAssistant
 
 from .common.base_entity import IntegrationBaseEntity, async_setup_base_entry
 from .common.consts import (
     ALL_EDGE_OS_UNITS,
     ATTR_ATTRIBUTES,
-    ATTR_UNIT_CONVERTOR,
-    ATTR_UNIT_INFORMATION,
-    ATTR_UNIT_RATE,
-    UNIT_MAPPING,
+    TRAFFIC_DATA_AVERAGE_RATE,
+    TRAFFIC_DATA_PEAK_RATE,
 )
 from .common.entity_descriptions import IntegrationSensorEntityDescription
 from .common.enums import DeviceTypes
-from .managers.coordinator import Coordinator
+
+if TYPE_CHECKING:
+    from .managers.coordinator import Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,6 +39,10 @@ async def async_setup_entry(
 class IntegrationSensorEntity(IntegrationBaseEntity, SensorEntity):
     """Representation of a sensor."""
 
+    _unrecorded_attributes = frozenset(
+        {TRAFFIC_DATA_AVERAGE_RATE, TRAFFIC_DATA_PEAK_RATE}
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -60,6 +60,7 @@ class IntegrationSensorEntity(IntegrationBaseEntity, SensorEntity):
 
         self._format_digits: int | None = None
         self._unit_convertor: Callable[[float], float] | None = None
+        self._unit_version: int | None = None
 
         if self._attr_native_unit_of_measurement in ALL_EDGE_OS_UNITS:
             self._format_digits = 0
@@ -68,30 +69,36 @@ class IntegrationSensorEntity(IntegrationBaseEntity, SensorEntity):
             SensorDeviceClass.DATA_SIZE,
             SensorDeviceClass.DATA_RATE,
         ]:
-            self._unit = coordinator.config_manager.unit
+            self._apply_unit_context()
+
+    def _apply_unit_context(self):
+        unit_context = self._local_coordinator.unit_context
+
+        self._unit_convertor = unit_context.convertor
+        self._format_digits = unit_context.format_digits
+        self._unit_version = unit_context.version
+
+        if self._attr_device_class == SensorDeviceClass.DATA_SIZE:
+            self._attr_native_unit_of_measurement = unit_context.information
+
+        if self._attr_device_class == SensorDeviceClass.DATA_RATE:
+            self._attr_native_unit_of_measurement = unit_context.rate
 
-            unit_settings = UNIT_MAPPING.get(self._unit, {})
-            unit_settings_information = unit_settings.get(
-                ATTR_UNIT_INFORMATION, UnitOfInformation.BYTES
-            )
-            unit_settings_rate = unit_settings.get(
-                ATTR_UNIT_RATE, UnitOfDataRate.BYTES_PER_SECOND
-            )
-            unit_convertor = unit_settings.get(ATTR_UNIT_CONVERTOR, lambda v: v)
+    def _is_refresh_required(self) -> bool:
+        if self._unit_version is None:
+            return False
 
-            self._unit_convertor = unit_convertor
-            self._format_digits = (
-                0 if unit_settings_information == UnitOfInformation.BYTES else 3
-            )
+        unit_context = self._local_coordinator.unit_context
 
-            if self._attr_device_class == SensorDeviceClass.DATA_SIZE:
-                self._attr_native_unit_of_measurement = unit_settings_information
+        is_refresh_required = self._unit_version != unit_context.version
 
-            if self._attr_device_class == SensorDeviceClass.DATA_RATE:
-                self._attr_native_unit_of_measurement = unit_settings_rate
+        return is_refresh_required
 
     def update_component(self, data):
         """Fetch new state parameters for the sensor."""
+        if self._is_refresh_required():
+            self._apply_unit_context()
+
         if data is not None:
             state = data.get(ATTR_STATE)
             attributes = data.get(ATTR_ATTRIBUTES)
@@ -104,6 +111,9 @@ class IntegrationSensorEntity(IntegrationBaseEntity, SensorEntity):
                 if self._format_digits is not None:
                     state = self._format_number(state, self._format_digits)
 
+            if attributes is not None and self._unit_convertor is not None:
+                attributes = self._convert_rate_attributes(attributes)
+
             self._attr_native_value = state
             self._attr_extra_state_attributes = attributes
 
@@ -113,6 +123,19 @@ class IntegrationSensorEntity(IntegrationBaseEntity, SensorEntity):
         else:
             self._attr_native_value = None
 
+    def _convert_rate_attributes(self, attributes: dict) -> dict:
+        result = dict(attributes)
+
+        for key in [TRAFFIC_DATA_AVERAGE_RATE, TRAFFIC_DATA_PEAK_RATE]:
+            value = result.get(key)
+
+            if value is not None:
+                value = self._unit_convertor(value)
+
+                result[key] = self._format_number(value, self._format_digits)
+
+        return result
+
     @staticmethod
     def _format_number(value: int | float | None, digits: int = 0) -> int | float:
         if value is None:
@@ -1,6 +1,8 @@
+from __future__ import annotations
+
 from abc import ABC
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
@@ -16,7 +18,9 @@ from .common.consts import (
 )
 from .common.entity_descriptions import IntegrationSwitchEntityDescription
 from .common.enums import DeviceTypes
-from .managers.coordinator import Coordinator
+
+if TYPE_CHECKING:
+    from .managers.coordinator import Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
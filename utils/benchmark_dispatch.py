@@ -0,0 +1,248 @@
+"""
+Benchmarks the per message overhead of the WS data dispatch at 50 frames/s.
+
+Home Assistant sets up the integration against a stub router sending
+`system-stats` and `interfaces` frames at the given rate, once connected the
+process CPU time (stub router included), thread safe callbacks scheduled on
+the event loop, data changed tasks and processing passes are counted for the
+measured duration and reported per received frame.
+
+Frames are paused at the end, the last processed system statistics must be
+the ones of the last frame sent. The run fails (exit code 1) when a frame
+schedules a thread safe callback or more than one data changed task, when
+processing passes exceed the data changes, when the latest frame is not the
+one processed last or when a frame costs more CPU time than its interval.
+
+Usage: python -m utils.benchmark_dispatch [--rate 50] [--duration 10]
+"""
+import argparse
+import asyncio
+from datetime import datetime
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from custom_components.edgeos.common.consts import (
+    DOMAIN,
+    TASK_DATA_CHANGED,
+    WS_RECEIVED_MESSAGES,
+)
+from custom_components.edgeos.managers.coordinator import Coordinator
+from homeassistant.core import HomeAssistant
+from utils.local_home_assistant import (
+    async_add_config_entry,
+    async_start_home_assistant,
+)
+from utils.stub_router import StubRouter
+
+DEBUG = str(os.environ.get("DEBUG", False)).lower() == str(True).lower()
+
+log_level = logging.DEBUG if DEBUG else logging.INFO
+
+root = logging.getLogger()
+root.setLevel(log_level)
+
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setLevel(log_level)
+formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+stream_handler.setFormatter(formatter)
+root.addHandler(stream_handler)
+
+# Keep the output to the results
+if not DEBUG:
+    logging.getLogger("homeassistant").setLevel(logging.WARNING)
+    logging.getLogger("custom_components").setLevel(logging.WARNING)
+    logging.getLogger("aiohttp.access").setLevel(logging.WARNING)
+
+_LOGGER = logging.getLogger(__name__)
+
+ENTRY_ID = "benchmark"
+
+INTERFACES = 4
+DEVICES = 8
+
+CONNECT_TIMEOUT = 30
+WARM_UP_DURATION = 2
+DRAIN_DURATION = 1
+
+
+class DispatchBenchmark:
+    def __init__(self, rate: int, duration: int):
+        self._rate = rate
+        self._duration = duration
+
+        self._router = StubRouter(
+            frame_interval=1 / rate, interfaces=INTERFACES, devices=DEVICES
+        )
+
+        self._thread_safe_callbacks = 0
+
+    async def initialize(self) -> bool:
+        with tempfile.TemporaryDirectory() as directory:
+            await self._router.start(directory)
+
+            hass = await async_start_home_assistant(directory)
+
+            try:
+                is_passed = await self._run(hass)
+
+            finally:
+                await hass.async_stop()
+                await self._router.stop()
+
+        return is_passed
+
+    async def _run(self, hass: HomeAssistant) -> bool:
+        await async_add_config_entry(hass, f"127.0.0.1:{self._router.port}", ENTRY_ID)
+
+        coordinator: Coordinator = hass.data[DOMAIN][ENTRY_ID]
+
+        is_connected = await self._wait_for_connection(coordinator)
+
+        if not is_connected:
+            _LOGGER.error("FAIL: WebSockets did not connect")
+
+            return False
+
+        await asyncio.sleep(WARM_UP_DURATION)
+
+        _LOGGER.info(f"Measuring {self._rate} frames/s for {self._duration} seconds")
+
+        started = self._get_counters(coordinator)
+
+        loop = hass.loop
+        call_soon_threadsafe = loop.call_soon_threadsafe
+
+        def _count_call_soon_threadsafe(*args, **kwargs):
+            self._thread_safe_callbacks += 1
+
+            return call_soon_threadsafe(*args, **kwargs)
+
+        loop.call_soon_threadsafe = _count_call_soon_threadsafe
+
+        try:
+            await asyncio.sleep(self._duration)
+
+        finally:
+            loop.call_soon_threadsafe = call_soon_threadsafe
+
+        ended = self._get_counters(coordinator)
+
+        self._router.is_paused = True
+
+        await asyncio.sleep(DRAIN_DURATION)
+
+        last_sequence = self._router.statistics["last_sequence"]
+        processed_sequence = coordinator.system.uptime
+
+        measured = {key: ended[key] - started[key] for key in started}
+
+        return self._report(measured, last_sequence, processed_sequence)
+
+    async def _wait_for_connection(self, coordinator: Coordinator) -> bool:
+        started_at = datetime.now().timestamp()
+
+        while datetime.now().timestamp() - started_at < CONNECT_TIMEOUT:
+            # Diagnostics are available once the system was processed
+            is_processed = coordinator.is_live and coordinator.system is not None
+
+            if is_processed and self._get_counters(coordinator)["frames"] > 0:
+                return True
+
+            await asyncio.sleep(0.1)
+
+        return False
+
+    @staticmethod
+    def _get_counters(coordinator: Coordinator) -> dict:
+        debug_data = coordinator.get_debug_data()
+        statistics = debug_data.get("statistics", {})
+
+        data_changed = statistics.get("data_changed", {})
+        created_tasks = statistics.get("tasks", {}).get("created", {})
+        websockets_data = debug_data.get("data", {}).get("websockets", {})
+
+        counters = {
+            "time": time.perf_counter(),
+            "cpu_time": time.process_time(),
+            "frames": websockets_data.get(WS_RECEIVED_MESSAGES, 0),
+            "data_changes": data_changed.get("received", 0),
+            "processing_passes": data_changed.get("processed", 0),
+            "data_changed_tasks": created_tasks.get(TASK_DATA_CHANGED, 0),
+        }
+
+        return counters
+
+    def _report(
+        self, measured: dict, last_sequence: int, processed_sequence: float | None
+    ) -> bool:
+        frames = measured["frames"]
+        per_frame = {key: measured[key] / max(frames, 1) for key in measured}
+
+        cpu_per_frame = per_frame["cpu_time"] * 1000
+        thread_safe_callbacks_per_frame = self._thread_safe_callbacks / max(frames, 1)
+
+        _LOGGER.info(
+            f"Frames: {frames}, "
+            f"Rate: {frames / measured['time']:.1f} frames/s, "
+            f"CPU time: {measured['cpu_time']:.3f} seconds "
+            f"({measured['cpu_time'] / measured['time'] * 100:.1f}%)"
+        )
+        _LOGGER.info(
+            f"Per frame: "
+            f"CPU time: {cpu_per_frame:.3f}ms, "
+            f"Thread safe callbacks: {thread_safe_callbacks_per_frame:.3f}, "
+            f"Data changes: {per_frame['data_changes']:.3f}, "
+            f"Processing passes: {per_frame['processing_passes']:.3f}, "
+            f"Data changed tasks: {per_frame['data_changed_tasks']:.3f}"
+        )
+        _LOGGER.info(
+            f"Last frame sent: {last_sequence}, Last frame processed: "
+            f"{None if processed_sequence is None else int(processed_sequence)}"
+        )
+
+        checks = {
+            "frames received": frames > 0,
+            "no thread safe callback per frame": (self._thread_safe_callbacks < frames),
+            "at most one data changed task per frame": (
+                measured["data_changed_tasks"] <= frames
+            ),
+            "processing passes do not exceed data changes": (
+                measured["processing_passes"] <= measured["data_changes"]
+            ),
+            "latest frame processed last": processed_sequence == last_sequence,
+            "frame CPU time below the frame interval": (
+                cpu_per_frame < 1000 / self._rate
+            ),
+        }
+
+        for check, is_passed in checks.items():
+            _LOGGER.info(f"{'PASS' if is_passed else 'FAIL'}: {check}")
+
+        is_passed = False not in checks.values()
+
+        return is_passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark per message overhead of the WS data dispatch"
+    )
+    parser.add_argument("--rate", type=int, default=50, help="Frames per second")
+    parser.add_argument(
+        "--duration", type=int, default=10, help="Seconds of measurement"
+    )
+
+    arguments = parser.parse_args()
+
+    instance = DispatchBenchmark(arguments.rate, arguments.duration)
+
+    try:
+        passed = asyncio.run(instance.initialize())
+
+        sys.exit(0 if passed else 1)
+
+    except KeyboardInterrupt:
+        _LOGGER.info("Aborted")
@@ -0,0 +1,171 @@
+"""
+Benchmarks the import time of the integration using `python -X importtime`.
+
+Each import is measured in a new interpreter, modules Home Assistant already
+loaded when it imports the integration (`homeassistant.bootstrap`) and the
+previous steps are imported first, so only the modules added by the step are
+counted:
+
+- Integration package, imported by Home Assistant on startup
+- Coordinator and managers, imported lazily on entry setup
+- Platforms, imported when the first entity of a platform is discovered
+
+The median of the runs is reported, the run fails (exit code 1) when the
+package imports the coordinator or a Home Assistant platform component, or
+when it is not faster to import than the coordinator.
+
+Usage: python -m utils.benchmark_imports [--runs 5]
+"""
+import argparse
+import logging
+import os
+import statistics
+import subprocess
+import sys
+
+from custom_components.edgeos.common.entity_descriptions import PLATFORMS
+
+DEBUG = str(os.environ.get("DEBUG", False)).lower() == str(True).lower()
+
+log_level = logging.DEBUG if DEBUG else logging.INFO
+
+root = logging.getLogger()
+root.setLevel(log_level)
+
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setLevel(log_level)
+formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+stream_handler.setFormatter(formatter)
+root.addHandler(stream_handler)
+
+_LOGGER = logging.getLogger(__name__)
+
+BASELINE_MODULE = "homeassistant.bootstrap"
+PACKAGE_MODULE = "custom_components.edgeos"
+COORDINATOR_MODULE = f"{PACKAGE_MODULE}.managers.coordinator"
+PLATFORM_MODULES = [f"{PACKAGE_MODULE}.{platform}" for platform in PLATFORMS]
+
+MEASURED_MARKER = "--- measured imports ---"
+
+MEASURE_CODE = """
+import sys
+{preloaded_imports}
+sys.stderr.write("{marker}\\n")
+sys.stderr.flush()
+{measured_imports}
+print("\\n".join(sys.modules))
+"""
+
+
+def measure_import(preloaded_modules: list[str], modules: list[str]) -> dict:
+    code = MEASURE_CODE.format(
+        preloaded_imports="\n".join(f"import {name}" for name in preloaded_modules),
+        marker=MEASURED_MARKER,
+        measured_imports="\n".join(f"import {name}" for name in modules),
+    )
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    import_lines = process.stderr.split(MEASURED_MARKER)[-1].splitlines()
+
+    duration = 0
+    imported_modules = []
+
+    for line in import_lines:
+        if not line.startswith("import time:"):
+            continue
+
+        _self_time, cumulative_time, name = line.split("|")
+
+        # Top level imports hold the time of the modules they import
+        if not name[1:].startswith(" "):
+            duration += int(cumulative_time)
+
+        imported_modules.append(name.strip())
+
+    result = {
+        "duration": duration / 1000,
+        "imported_modules": imported_modules,
+        "loaded_modules": process.stdout.splitlines(),
+    }
+
+    return result
+
+
+def measure_step(
+    name: str, preloaded_modules: list[str], modules: list[str], runs: int
+) -> dict:
+    results = [measure_import(preloaded_modules, modules) for _ in range(runs)]
+
+    result = results[-1]
+    result["duration"] = statistics.median(item["duration"] for item in results)
+
+    _LOGGER.info(
+        f"{name}: "
+        f"Duration: {result['duration']:.1f}ms, "
+        f"Modules: {len(result['imported_modules'])}"
+    )
+
+    _LOGGER.debug(f"{name} modules: {result['imported_modules']}")
+
+    return result
+
+
+def run(runs: int) -> bool:
+    package = measure_step(
+        "Integration package", [BASELINE_MODULE], [PACKAGE_MODULE], runs
+    )
+
+    coordinator = measure_step(
+        "Coordinator", [BASELINE_MODULE, PACKAGE_MODULE], [COORDINATOR_MODULE], runs
+    )
+
+    measure_step(
+        "Platforms",
+        [BASELINE_MODULE, PACKAGE_MODULE, COORDINATOR_MODULE],
+        PLATFORM_MODULES,
+        runs,
+    )
+
+    loaded_modules = package["loaded_modules"]
+
+    platform_components = [
+        f"homeassistant.components.{platform}" for platform in PLATFORMS
+    ]
+
+    checks = {
+        "package does not import the coordinator": (
+            COORDINATOR_MODULE not in loaded_modules
+        ),
+        "package does not import platform components": not any(
+            name in loaded_modules for name in platform_components
+        ),
+        "package imports faster than the coordinator": (
+            package["duration"] < coordinator["duration"]
+        ),
+    }
+
+    for check, is_passed in checks.items():
+        _LOGGER.info(f"{'PASS' if is_passed else 'FAIL'}: {check}")
+
+    is_passed = False not in checks.values()
+
+    return is_passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark import time")
+    parser.add_argument(
+        "--runs", type=int, default=5, help="Interpreters per measured step"
+    )
+
+    arguments = parser.parse_args()
+
+    passed = run(arguments.runs)
+
+    sys.exit(0 if passed else 1)
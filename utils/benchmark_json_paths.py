@@ -0,0 +1,231 @@
+"""
+Benchmarks the streamed extraction of the router configuration.
+
+A router configuration of the given size (large firewall and NAT rule sets)
+is extracted using the buffered read (json.loads + extract_paths, used while
+capturing) and the streamed read (JsonPathExtractor fed with response sized
+chunks), peak memory and duration of both are reported.
+
+Both helpers must build the same tree, parity is checked on the generated
+configuration and on edge cases (null / missing paths, escaped strings,
+values split across chunks), the run fails (exit code 1) on any difference.
+
+Usage: python -m utils.benchmark_json_paths [--size 5]
+"""
+import argparse
+from datetime import datetime
+import json
+import logging
+import os
+import sys
+import tracemalloc
+
+from custom_components.edgeos.common.consts import (
+    API_DATA_SYSTEM_RESPONSE_PATHS,
+    API_STREAM_CHUNK_SIZE,
+)
+from custom_components.edgeos.common.json_paths import JsonPathExtractor, extract_paths
+
+DEBUG = str(os.environ.get("DEBUG", False)).lower() == str(True).lower()
+
+log_level = logging.DEBUG if DEBUG else logging.INFO
+
+root = logging.getLogger()
+root.setLevel(log_level)
+
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setLevel(log_level)
+formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+stream_handler.setFormatter(formatter)
+root.addHandler(stream_handler)
+
+_LOGGER = logging.getLogger(__name__)
+
+PARITY_CHUNK_SIZES = [1, 7, API_STREAM_CHUNK_SIZE]
+
+PARITY_CASES = {
+    "null leaf": {"success": True, "error": None, "GET": {"system": None}},
+    "null prefix": {"success": True, "GET": {"service": None, "interfaces": {}}},
+    "missing paths": {"success": False, "error": "Unauthorized"},
+    "escaped strings": {
+        "success": True,
+        "GET": {
+            "system": {"host-name": 'quote " brace } bracket ] \\ é'},
+            "firewall": {"description": '{"not": ["a", "tree"]}'},
+        },
+    },
+    "scalars and arrays": {
+        "success": 1,
+        "GET": {
+            "system": {"ntp": [1.5e3, -2, True, False, None, []]},
+            "interfaces": {"ethernet": {"eth0": {"address": ["dhcp", {"x": {}}]}}},
+            "service": {"dhcp-server": {"disabled": False}, "nat": [1, [2, [3]]]},
+        },
+    },
+}
+
+
+def generate_configuration(size: int) -> bytes:
+    configuration = {
+        "success": True,
+        "error": None,
+        "GET": {
+            "system": {"host-name": "router", "domain-name": None},
+            "interfaces": {
+                "ethernet": {
+                    f"eth{index}": {"address": [f"10.0.{index}.1/24"]}
+                    for index in range(8)
+                }
+            },
+            "service": {
+                "dhcp-server": {
+                    "shared-network-name": {
+                        "LAN": {
+                            "subnet": {
+                                "10.0.0.0/24": {
+                                    "static-mapping": {
+                                        f"host-{index}": {
+                                            "ip-address": f"10.0.0.{index}",
+                                            "mac-address": f"00:00:00:00:00:{index:02x}",
+                                        }
+                                        for index in range(100)
+                                    }
+                                }
+                            }
+                        }
+                    }
+                },
+                "nat": {"rule": {}},
+            },
+            "firewall": {"name": {}},
+        },
+    }
+
+    rule_sets = configuration["GET"]["firewall"]["name"]
+    nat_rules = configuration["GET"]["service"]["nat"]["rule"]
+
+    rule = {
+        "action": "accept",
+        "description": "Allow established / related",
+        "destination": {"address": "10.0.0.0/8", "port": "80,443"},
+        "protocol": "tcp",
+        "state": {"established": "enable", "related": "enable"},
+    }
+
+    rule_size = len(json.dumps(rule))
+    rules_count = max(1, size // (rule_size * 2))
+
+    for index in range(rules_count):
+        rule_set = rule_sets.setdefault(f"rule-set-{index // 100}", {"rule": {}})
+        rule_set["rule"][str(index % 100)] = rule
+        nat_rules[str(index)] = rule
+
+    payload = json.dumps(configuration).encode()
+
+    return payload
+
+
+def extract_buffered(payload: bytes) -> dict:
+    result = extract_paths(json.loads(payload), API_DATA_SYSTEM_RESPONSE_PATHS)
+
+    return result
+
+
+def extract_streamed(payload: bytes, chunk_size: int) -> dict:
+    extractor = JsonPathExtractor(API_DATA_SYSTEM_RESPONSE_PATHS)
+
+    for position in range(0, len(payload), chunk_size):
+        extractor.feed(payload[position : position + chunk_size])
+
+    result = extractor.close()
+
+    return result
+
+
+def measure(name: str, action, *args) -> dict:
+    tracemalloc.start()
+
+    started_at = datetime.now().timestamp()
+
+    result = action(*args)
+
+    duration = datetime.now().timestamp() - started_at
+    _current, peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    _LOGGER.info(
+        f"{name}: Peak memory: {peak / 1024 / 1024:.1f}MB, "
+        f"Duration: {duration:.3f} seconds"
+    )
+
+    return {"result": result, "peak": peak, "duration": duration}
+
+
+def check_parity(payloads: dict[str, bytes]) -> bool:
+    is_passed = True
+
+    for name, payload in payloads.items():
+        expected = extract_buffered(payload)
+
+        for chunk_size in PARITY_CHUNK_SIZES:
+            # Single byte chunks of the full configuration add nothing but time
+            if chunk_size == 1 and len(payload) > API_STREAM_CHUNK_SIZE:
+                continue
+
+            result = extract_streamed(payload, chunk_size)
+
+            if result != expected:
+                is_passed = False
+
+                _LOGGER.error(
+                    f"FAIL: Parity of {name}, Chunk size: {chunk_size}, "
+                    f"Buffered: {expected}, Streamed: {result}"
+                )
+
+    if is_passed:
+        _LOGGER.info(f"PASS: Parity of {len(payloads)} payloads")
+
+    return is_passed
+
+
+def run(size: int) -> bool:
+    payload = generate_configuration(size)
+
+    _LOGGER.info(f"Configuration size: {len(payload) / 1024 / 1024:.1f}MB")
+
+    payloads = {name: json.dumps(case).encode() for name, case in PARITY_CASES.items()}
+    payloads["configuration"] = payload
+
+    is_parity_passed = check_parity(payloads)
+
+    buffered = measure("Buffered", extract_buffered, payload)
+    streamed = measure("Streamed", extract_streamed, payload, API_STREAM_CHUNK_SIZE)
+
+    kept_size = len(json.dumps(streamed["result"]))
+
+    _LOGGER.info(f"Kept size: {kept_size / 1024:.1f}KB")
+
+    is_memory_passed = streamed["peak"] < buffered["peak"]
+
+    _LOGGER.info(
+        f"{'PASS' if is_memory_passed else 'FAIL'}: "
+        f"Streamed peak memory is below the buffered peak memory"
+    )
+
+    return is_parity_passed and is_memory_passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark streamed extraction of the router configuration"
+    )
+    parser.add_argument(
+        "--size", type=float, default=5, help="Configuration size in MB"
+    )
+
+    arguments = parser.parse_args()
+
+    passed = run(int(arguments.size * 1024 * 1024))
+
+    sys.exit(0 if passed else 1)
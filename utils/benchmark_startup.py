@@ -0,0 +1,227 @@
+"""
+Benchmarks the startup of the integration until its entities are registered.
+
+Home Assistant is started twice on the same configuration directory against
+a stub router with a slow login. The cold start has no snapshot, entities
+are registered once the login and the first REST API refresh completed. The
+second start restores the snapshot saved on unload of the first one, entities
+are registered as unavailable before the login completed.
+
+Registries and config entries are removed between both starts so entities are
+registered again, integration modules are imported before both starts (import
+time is measured by `utils/benchmark_imports.py`).
+
+The run fails (exit code 1) when the snapshot start is not faster, registers
+its entities after the login completed or registers other entities.
+
+Usage: python -m utils.benchmark_startup [--login-delay 2]
+"""
+import argparse
+import asyncio
+from datetime import datetime
+import importlib
+import logging
+import os
+import sys
+import tempfile
+
+from custom_components.edgeos.common.entity_descriptions import PLATFORMS
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from utils.local_home_assistant import (
+    async_add_config_entry,
+    async_start_home_assistant,
+)
+from utils.stub_router import StubRouter
+
+DEBUG = str(os.environ.get("DEBUG", False)).lower() == str(True).lower()
+
+log_level = logging.DEBUG if DEBUG else logging.INFO
+
+root = logging.getLogger()
+root.setLevel(log_level)
+
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setLevel(log_level)
+formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+stream_handler.setFormatter(formatter)
+root.addHandler(stream_handler)
+
+# Keep the output to the results
+if not DEBUG:
+    logging.getLogger("homeassistant").setLevel(logging.WARNING)
+    logging.getLogger("custom_components").setLevel(logging.WARNING)
+    logging.getLogger("aiohttp.access").setLevel(logging.WARNING)
+
+_LOGGER = logging.getLogger(__name__)
+
+ENTRY_ID = "benchmark"
+
+INTERFACES = 4
+DEVICES = 8
+
+SETTLE_DURATION = 3
+
+REMOVED_STORAGE_FILES = [
+    "core.config_entries",
+    "core.device_registry",
+    "core.entity_registry",
+    "core.restore_state",
+]
+
+
+class StartupBenchmark:
+    def __init__(self, login_delay: float):
+        self._login_delay = login_delay
+
+        self._router = StubRouter(
+            login_delay=login_delay, interfaces=INTERFACES, devices=DEVICES
+        )
+
+    async def initialize(self) -> bool:
+        self._import_modules()
+
+        with tempfile.TemporaryDirectory() as directory:
+            await self._router.start(directory)
+
+            try:
+                cold_start = await self._start(directory, "Cold start")
+
+                self._remove_registries(directory)
+
+                snapshot_start = await self._start(directory, "Snapshot start")
+
+            finally:
+                await self._router.stop()
+
+        return self._report(cold_start, snapshot_start)
+
+    @staticmethod
+    def _import_modules():
+        modules = ["custom_components.edgeos.managers.coordinator"]
+        modules.extend(
+            [f"custom_components.edgeos.{platform}" for platform in PLATFORMS]
+        )
+
+        for module in modules:
+            importlib.import_module(module)
+
+    async def _start(self, directory: str, name: str) -> dict:
+        hass = await async_start_home_assistant(directory)
+
+        result = {"first_entity": None, "logins_completed": None}
+
+        @callback
+        def _on_entity_registry_updated(event: Event):
+            if result["first_entity"] is not None:
+                return
+
+            if event.data.get("action") != "create":
+                return
+
+            statistics = self._router.statistics
+
+            result["first_entity"] = datetime.now().timestamp() - started_at
+            result["logins_completed"] = (
+                statistics["logins"] - statistics["concurrent_logins"] - logins
+            )
+
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, _on_entity_registry_updated
+        )
+
+        # Router statistics add up across both starts
+        logins = self._router.statistics["logins"]
+        started_at = datetime.now().timestamp()
+
+        try:
+            entry = await async_add_config_entry(
+                hass, f"127.0.0.1:{self._router.port}", ENTRY_ID
+            )
+
+            # Live data arrives after the login, all entities are registered
+            await asyncio.sleep(self._login_delay + SETTLE_DURATION)
+
+            result["unique_ids"] = self._get_unique_ids(hass, entry.entry_id)
+
+            await hass.config_entries.async_unload(entry.entry_id)
+
+        finally:
+            await hass.async_stop()
+
+        first_entity = result["first_entity"]
+
+        _LOGGER.info(
+            f"{name}: "
+            f"First entity registered after: "
+            f"{'-' if first_entity is None else f'{first_entity:.3f}'} seconds, "
+            f"Logins completed at the time: {result['logins_completed']}, "
+            f"Entities: {len(result['unique_ids'])}"
+        )
+
+        return result
+
+    @staticmethod
+    def _get_unique_ids(hass: HomeAssistant, entry_id: str) -> set[str]:
+        entity_registry = er.async_get(hass)
+        entries = er.async_entries_for_config_entry(entity_registry, entry_id)
+
+        unique_ids = {entry.unique_id for entry in entries}
+
+        return unique_ids
+
+    @staticmethod
+    def _remove_registries(directory: str):
+        for file_name in REMOVED_STORAGE_FILES:
+            file_path = os.path.join(directory, ".storage", file_name)
+
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+    @staticmethod
+    def _report(cold_start: dict, snapshot_start: dict) -> bool:
+        cold_first_entity = cold_start["first_entity"]
+        snapshot_first_entity = snapshot_start["first_entity"]
+
+        is_registered = None not in [cold_first_entity, snapshot_first_entity]
+
+        checks = {
+            "entities registered on both starts": is_registered,
+            "snapshot start registers entities faster": (
+                is_registered and snapshot_first_entity < cold_first_entity
+            ),
+            "snapshot start registers entities before the login": (
+                snapshot_start["logins_completed"] == 0
+            ),
+            "snapshot start registers the same entities": (
+                snapshot_start["unique_ids"] == cold_start["unique_ids"]
+            ),
+        }
+
+        for check, is_passed in checks.items():
+            _LOGGER.info(f"{'PASS' if is_passed else 'FAIL'}: {check}")
+
+        is_passed = False not in checks.values()
+
+        return is_passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark startup until entities are registered"
+    )
+    parser.add_argument(
+        "--login-delay", type=float, default=2, help="Seconds of router login"
+    )
+
+    arguments = parser.parse_args()
+
+    instance = StartupBenchmark(arguments.login_delay)
+
+    try:
+        passed = asyncio.run(instance.initialize())
+
+        sys.exit(0 if passed else 1)
+
+    except KeyboardInterrupt:
+        _LOGGER.info("Aborted")
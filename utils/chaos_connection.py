@@ -0,0 +1,235 @@
+"""
+Chaos test of the connection supervisor against a stub router.
+
+The stub router drops requests and WebSockets, delays logins and the API / WS
+statuses are flapped with overlapping reconnect requests. The run fails when
+a login or a WebSockets connection overlaps another one, when a cycle logs in
+more than once or when the connection does not recover once the chaos stops.
+
+Usage: python -m utils.chaos_connection [--duration 30] [--seed 1]
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+import logging
+import os
+import random
+import sys
+import tempfile
+
+from custom_components.edgeos.common.connectivity_status import ConnectivityStatus
+from custom_components.edgeos.common.consts import (
+    API_RECONNECT_STATUSES,
+    SIGNAL_API_STATUS,
+    SIGNAL_WS_STATUS,
+    WS_RECONNECT_STATUSES,
+)
+from custom_components.edgeos.managers.connection_supervisor import (
+    ConnectionSupervisor,
+)
+from custom_components.edgeos.managers.rest_api import RestAPI
+from custom_components.edgeos.managers.task_manager import TaskManager
+from custom_components.edgeos.managers.websockets import WebSockets
+from custom_components.edgeos.models.config_data import ConfigData
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from utils.stub_router import StubRouter
+
+DEBUG = str(os.environ.get("DEBUG", False)).lower() == str(True).lower()
+
+log_level = logging.DEBUG if DEBUG else logging.INFO
+
+root = logging.getLogger()
+root.setLevel(log_level)
+
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setLevel(log_level)
+formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+stream_handler.setFormatter(formatter)
+root.addHandler(stream_handler)
+
+# Integration logs every dropped request, keep the output to the results
+if not DEBUG:
+    logging.getLogger("custom_components").setLevel(logging.CRITICAL)
+    logging.getLogger("aiohttp.access").setLevel(logging.WARNING)
+
+_LOGGER = logging.getLogger(__name__)
+
+ENTRY_ID = "chaos"
+
+FLAP_MAX_INTERVAL = 0.5
+RECONNECT_DELAY = timedelta(milliseconds=200)
+RECOVERY_TIMEOUT = 30
+
+
+class ConnectionChaos:
+    def __init__(self, duration: int, seed: int):
+        self._duration = duration
+        self._random = random.Random(seed)
+
+        self._router = StubRouter(self._random)
+        self._router.is_chaos_enabled = True
+        self._supervisor = None
+        self._api = None
+        self._websockets = None
+        self._task_manager = None
+
+        self._flaps = 0
+
+    async def initialize(self) -> bool:
+        with tempfile.TemporaryDirectory() as directory:
+            await self._router.start(directory)
+
+            hass = HomeAssistant(directory)
+            await hass.async_start()
+
+            try:
+                is_passed = await self._run(hass)
+
+            finally:
+                await self._supervisor.async_stop()
+                await self._task_manager.async_cancel_all()
+
+                await hass.async_stop()
+                await self._router.stop()
+
+        return is_passed
+
+    async def _run(self, hass: HomeAssistant) -> bool:
+        config_data = ConfigData()
+        config_data.update(
+            {
+                CONF_HOST: f"127.0.0.1:{self._router.port}",
+                CONF_USERNAME: "chaos",
+                CONF_PASSWORD: "chaos",
+            }
+        )
+
+        self._task_manager = TaskManager(hass, ENTRY_ID)
+        self._api = RestAPI(hass, config_data, ENTRY_ID)
+        self._websockets = WebSockets(hass, config_data, ENTRY_ID, self._task_manager)
+
+        self._supervisor = ConnectionSupervisor(
+            hass, self._api, self._websockets, self._task_manager, lambda: False
+        )
+
+        # Same reactions as the coordinator, with short delays
+        async_dispatcher_connect(
+            hass, SIGNAL_API_STATUS.format(ENTRY_ID), self._on_api_status_changed
+        )
+        async_dispatcher_connect(
+            hass, SIGNAL_WS_STATUS.format(ENTRY_ID), self._on_ws_status_changed
+        )
+
+        self._supervisor.request_connect()
+
+        _LOGGER.info(f"Flapping statuses for {self._duration} seconds")
+
+        chaos_ends_at = datetime.now().timestamp() + self._duration
+
+        while datetime.now().timestamp() < chaos_ends_at:
+            await asyncio.sleep(self._random.uniform(0, FLAP_MAX_INTERVAL))
+
+            self._flap()
+
+        self._router.is_chaos_enabled = False
+
+        recovery_duration = await self._wait_for_recovery()
+
+        return self._report(recovery_duration)
+
+    def _flap(self):
+        # Overlapping API / WS flaps, several requests within the same tick
+        for _ in range(self._random.randint(1, 3)):
+            self._flaps += 1
+
+            if self._random.random() < 0.5:
+                self._supervisor.request_connect()
+
+            else:
+                self._supervisor.request_ws_reconnect()
+
+    async def _wait_for_recovery(self) -> float | None:
+        started_at = datetime.now().timestamp()
+
+        while datetime.now().timestamp() - started_at < RECOVERY_TIMEOUT:
+            is_api_connected = self._api.status == ConnectivityStatus.Connected
+            is_ws_connected = self._websockets.status == ConnectivityStatus.Connected
+
+            if is_api_connected and is_ws_connected and not self._supervisor.is_running:
+                return datetime.now().timestamp() - started_at
+
+            await asyncio.sleep(0.1)
+
+        return None
+
+    def _report(self, recovery_duration: float | None) -> bool:
+        router_statistics = self._router.statistics
+        supervisor_statistics = self._supervisor.get_debug_data()
+
+        checks = {
+            "single login at a time": router_statistics["max_concurrent_logins"] <= 1,
+            "single WebSockets at a time": (
+                router_statistics["max_concurrent_websockets"] <= 1
+            ),
+            "at most one login per cycle": (
+                supervisor_statistics["logins"] <= supervisor_statistics["cycles"]
+            ),
+            "logins reaching the router were requested by a cycle": (
+                router_statistics["logins"] <= supervisor_statistics["logins"]
+            ),
+            "reconnect requests coalesced": (
+                supervisor_statistics["coalesced_requests"] > 0
+                and supervisor_statistics["cycles"] < supervisor_statistics["requests"]
+            ),
+            "recovered after the chaos": recovery_duration is not None,
+        }
+
+        _LOGGER.info(f"Flaps: {self._flaps}")
+        _LOGGER.info(f"Router: {router_statistics}")
+        _LOGGER.info(f"Supervisor: {supervisor_statistics}")
+        _LOGGER.info(f"Tasks: {self._task_manager.get_debug_data()}")
+
+        if recovery_duration is not None:
+            _LOGGER.info(f"Recovered in {recovery_duration:.3f} seconds")
+
+        for check, is_passed in checks.items():
+            _LOGGER.info(f"{'PASS' if is_passed else 'FAIL'}: {check}")
+
+        is_passed = False not in checks.values()
+
+        return is_passed
+
+    def _on_api_status_changed(self, status: ConnectivityStatus):
+        if status in API_RECONNECT_STATUSES:
+            self._supervisor.request_connect(RECONNECT_DELAY)
+
+    def _on_ws_status_changed(self, status: ConnectivityStatus):
+        if status in WS_RECONNECT_STATUSES:
+            self._supervisor.request_ws_reconnect(RECONNECT_DELAY)
+
+        elif status == ConnectivityStatus.InvalidCredentials:
+            self._supervisor.request_connect(RECONNECT_DELAY)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Chaos test of the connection supervisor"
+    )
+    parser.add_argument(
+        "--duration", type=int, default=30, help="Seconds of status flapping"
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+
+    arguments = parser.parse_args()
+
+    instance = ConnectionChaos(arguments.duration, arguments.seed)
+
+    try:
+        passed = asyncio.run(instance.initialize())
+
+        sys.exit(0 if passed else 1)
+
+    except KeyboardInterrupt:
+        _LOGGER.info("Aborted")
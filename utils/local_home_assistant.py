@@ -0,0 +1,63 @@
+"""
+Home Assistant instance used by the scripts of utils.
+
+Starts Home Assistant with its registries on the given configuration
+directory (without the HTTP server and without installing requirements) and
+sets up an EdgeOS config entry pointing to the given host.
+"""
+from custom_components.edgeos.common.consts import DOMAIN
+from custom_components.edgeos.managers.password_manager import PasswordManager
+from homeassistant import loader
+from homeassistant.bootstrap import load_registries
+from homeassistant.config import async_process_ha_core_config
+from homeassistant.config_entries import SOURCE_USER, ConfigEntries, ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+USERNAME = "admin"
+PASSWORD = "admin"
+
+
+async def async_start_home_assistant(config_dir: str) -> HomeAssistant:
+    hass = HomeAssistant(config_dir)
+    hass.config.skip_pip = True
+
+    loader.async_setup(hass)
+
+    await load_registries(hass)
+    await async_process_ha_core_config(hass, {})
+
+    hass.config_entries = ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+
+    # Integration registers no views, the HTTP server is not required
+    hass.config.components.add("http")
+
+    await async_setup_component(hass, "homeassistant", {})
+    await hass.async_start()
+
+    return hass
+
+
+async def async_add_config_entry(
+    hass: HomeAssistant, host: str, entry_id: str
+) -> ConfigEntry:
+    data = {CONF_HOST: host, CONF_USERNAME: USERNAME, CONF_PASSWORD: PASSWORD}
+
+    await PasswordManager.encrypt(hass, data, entry_id)
+
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title=host,
+        data=data,
+        source=SOURCE_USER,
+        options={},
+        entry_id=entry_id,
+    )
+
+    await hass.config_entries.async_add(entry)
+
+    return entry
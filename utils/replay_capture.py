@@ -0,0 +1,166 @@
+"""
+Replays a capture file through the WS message parser and the data processors.
+
+Usage: python -m utils.replay_capture <capture file> [--speed original|max]
+"""
+import argparse
+import asyncio
+from datetime import datetime
+import json
+import logging
+import os
+import sys
+
+from custom_components.edgeos.common.consts import (
+    API_DATA_SYSTEM,
+    API_DATA_SYSTEM_PATHS,
+    API_GET,
+    RESPONSE_OUTPUT,
+)
+from custom_components.edgeos.common.enums import CaptureSources
+from custom_components.edgeos.common.json_paths import extract_paths
+from custom_components.edgeos.data_processors.device_processor import DeviceProcessor
+from custom_components.edgeos.data_processors.interface_processor import (
+    InterfaceProcessor,
+)
+from custom_components.edgeos.data_processors.system_processor import SystemProcessor
+from custom_components.edgeos.managers.capture_manager import read_capture
+from custom_components.edgeos.managers.websockets import WebSockets
+from custom_components.edgeos.models.config_data import ConfigData
+
+DEBUG = str(os.environ.get("DEBUG", False)).lower() == str(True).lower()
+
+log_level = logging.DEBUG if DEBUG else logging.INFO
+
+root = logging.getLogger()
+root.setLevel(log_level)
+
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setLevel(log_level)
+formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+stream_handler.setFormatter(formatter)
+root.addHandler(stream_handler)
+
+_LOGGER = logging.getLogger(__name__)
+
+SPEED_ORIGINAL = "original"
+SPEED_MAX = "max"
+
+
+class CaptureReplay:
+    def __init__(self, file_path: str, speed: str):
+        self._file_path = file_path
+        self._speed = speed
+
+        config_data = ConfigData()
+
+        self._api_data = {}
+        self._websockets = WebSockets(None, config_data, "replay")
+        self._websockets.set_local_async_dispatcher_send(self._on_dispatch)
+
+        self._processors = [
+            SystemProcessor(config_data),
+            DeviceProcessor(config_data),
+            InterfaceProcessor(config_data),
+        ]
+
+        self._statistics = {
+            CaptureSources.API: 0,
+            CaptureSources.WEBSOCKETS: 0,
+            "processor_updates": 0,
+        }
+        self._durations = {"parse": 0.0, "process": 0.0}
+
+    async def initialize(self):
+        started_at = datetime.now().timestamp()
+        first_record_at = None
+
+        for timestamp, source, name, payload in read_capture(self._file_path):
+            if first_record_at is None:
+                first_record_at = timestamp
+
+            if self._speed == SPEED_ORIGINAL:
+                delay = (timestamp - first_record_at) - (
+                    datetime.now().timestamp() - started_at
+                )
+
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            self._statistics[source] += 1
+
+            if source == CaptureSources.API:
+                self._handle_api_record(name, payload)
+
+            else:
+                parse_started_at = datetime.now().timestamp()
+
+                await self._websockets._parse_message(payload)
+
+                self._durations["parse"] += (
+                    datetime.now().timestamp() - parse_started_at
+                )
+
+            self._update_processors()
+
+        elapsed = datetime.now().timestamp() - started_at
+
+        _LOGGER.info(
+            f"Replay completed in {elapsed:.3f} seconds, "
+            f"API records: {self._statistics[CaptureSources.API]}, "
+            f"WS records: {self._statistics[CaptureSources.WEBSOCKETS]}, "
+            f"Processor updates: {self._statistics['processor_updates']}, "
+            f"WS parse time: {self._durations['parse']:.3f} seconds, "
+            f"Processing time: {self._durations['process']:.3f} seconds"
+        )
+
+    def _handle_api_record(self, name: str, payload: str):
+        result = json.loads(payload)
+
+        if name == API_DATA_SYSTEM:
+            self._api_data[API_DATA_SYSTEM] = extract_paths(
+                result.get(API_GET.upper(), {}), API_DATA_SYSTEM_PATHS
+            )
+
+        else:
+            self._api_data[name] = result.get(RESPONSE_OUTPUT)
+
+    def _update_processors(self):
+        # Processors require the system configuration to identify the router
+        if API_DATA_SYSTEM not in self._api_data:
+            return
+
+        process_started_at = datetime.now().timestamp()
+
+        for processor in self._processors:
+            processor.update(self._api_data, self._websockets.data)
+
+        self._durations["process"] += datetime.now().timestamp() - process_started_at
+        self._statistics["processor_updates"] += 1
+
+    def _on_dispatch(self, signal: str, *args):
+        _LOGGER.debug(f"Signal: {signal}, Arguments: {args}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay EdgeOS capture file")
+    parser.add_argument("file_path", help="Path of the capture file")
+    parser.add_argument(
+        "--speed",
+        choices=[SPEED_ORIGINAL, SPEED_MAX],
+        default=SPEED_MAX,
+        help="Replay at the original pace or as fast as possible",
+    )
+
+    arguments = parser.parse_args()
+
+    instance = CaptureReplay(arguments.file_path, arguments.speed)
+
+    try:
+        asyncio.run(instance.initialize())
+
+    except KeyboardInterrupt:
+        _LOGGER.info("Aborted")
+
+    except Exception as rex:
+        _LOGGER.error(f"Error: {rex}")
@@ -0,0 +1,318 @@
+"""
+EdgeOS look-alike router used by the scripts of utils.
+
+Serves the login, heartbeat, configuration, data and WebSockets endpoints
+over HTTPS with a self-signed certificate on a random local port, the
+configuration holds the given number of ethernet interfaces and DHCP static
+mappings. WebSockets sends alternating `system-stats` (uptime is the frame
+sequence) and `interfaces` frames at the given interval until paused.
+
+With chaos enabled, logins are delayed at random, requests and WebSockets are
+dropped, overlapping logins and WebSockets are counted in the statistics.
+"""
+import asyncio
+from datetime import datetime, timedelta
+import json
+import os
+import random
+import ssl
+
+from aiohttp import WSMsgType, web
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from custom_components.edgeos.common.consts import (
+    COOKIE_BEAKER_SESSION_ID,
+    COOKIE_CSRF_TOKEN,
+    COOKIE_PHPSESSID,
+    WS_INTERFACES_KEY,
+    WS_SYSTEM_STATS_KEY,
+)
+
+SESSION_ID = "stub-session"
+
+DROP_RATE = 0.2
+LOGIN_MAX_DELAY = 1.5
+WS_MAX_LIFETIME = 3
+WS_FRAME_INTERVAL = 0.2
+
+
+class StubRouter:
+    """EdgeOS look-alike, counts overlapping logins and WebSockets."""
+
+    def __init__(
+        self,
+        random_generator: random.Random | None = None,
+        login_delay: float = 0,
+        frame_interval: float = WS_FRAME_INTERVAL,
+        interfaces: int = 1,
+        devices: int = 0,
+    ):
+        self._random = random.Random() if random_generator is None else random_generator
+        self._login_delay = login_delay
+        self._frame_interval = frame_interval
+        self._interfaces = [f"eth{index}" for index in range(interfaces)]
+        self._devices = devices
+        self._runner = None
+
+        self.is_chaos_enabled = False
+        self.is_paused = False
+        self.port = None
+
+        self.statistics = {
+            "logins": 0,
+            "concurrent_logins": 0,
+            "max_concurrent_logins": 0,
+            "websockets": 0,
+            "concurrent_websockets": 0,
+            "max_concurrent_websockets": 0,
+            "dropped_requests": 0,
+            "dropped_websockets": 0,
+            "frames": 0,
+            "last_sequence": None,
+        }
+
+    async def start(self, directory: str):
+        app = web.Application()
+        app.router.add_post("/", self._login)
+        app.router.add_get("/", self._heartbeat)
+        app.router.add_get("/api/edge/get.json", self._get)
+        app.router.add_get("/api/edge/data.json", self._data)
+        app.router.add_get("/ws/stats", self._websockets)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+
+        site = web.TCPSite(
+            self._runner, "127.0.0.1", 0, ssl_context=self._get_ssl_context(directory)
+        )
+        await site.start()
+
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+    def _is_dropped(self) -> bool:
+        is_dropped = self.is_chaos_enabled and self._random.random() < DROP_RATE
+
+        if is_dropped:
+            self.statistics["dropped_requests"] += 1
+
+        return is_dropped
+
+    def _increase(self, key: str):
+        concurrent_key = f"concurrent_{key}"
+        max_concurrent_key = f"max_concurrent_{key}"
+
+        self.statistics[key] += 1
+        self.statistics[concurrent_key] += 1
+        self.statistics[max_concurrent_key] = max(
+            self.statistics[max_concurrent_key], self.statistics[concurrent_key]
+        )
+
+    def _decrease(self, key: str):
+        self.statistics[f"concurrent_{key}"] -= 1
+
+    async def _login(self, _request: web.Request):
+        self._increase("logins")
+
+        try:
+            delay = self._login_delay
+
+            if self.is_chaos_enabled:
+                delay += self._random.uniform(0, LOGIN_MAX_DELAY)
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if self._is_dropped():
+                raise web.HTTPServiceUnavailable()
+
+            response = web.Response(
+                text="<script>EDGE.DeviceModel = 'ER-X';</script>",
+                content_type="text/html",
+            )
+
+            for cookie in [COOKIE_PHPSESSID, COOKIE_BEAKER_SESSION_ID]:
+                response.set_cookie(cookie, SESSION_ID)
+
+            response.set_cookie(COOKIE_CSRF_TOKEN, SESSION_ID)
+
+            return response
+
+        finally:
+            self._decrease("logins")
+
+    async def _heartbeat(self, _request: web.Request):
+        return web.Response(text="<html></html>", content_type="text/html")
+
+    async def _get(self, _request: web.Request):
+        if self._is_dropped():
+            raise web.HTTPServiceUnavailable()
+
+        static_mappings = {
+            f"host-{index}": {
+                "ip-address": f"192.168.1.{index + 10}",
+                "mac-address": f"00:00:00:00:00:{index:02x}",
+            }
+            for index in range(self._devices)
+        }
+
+        data = {
+            "success": True,
+            "GET": {
+                "system": {"host-name": "stub"},
+                "interfaces": {
+                    "ethernet": {
+                        name: {"description": f"Port {name}"}
+                        for name in self._interfaces
+                    }
+                },
+                "service": {
+                    "dhcp-server": {
+                        "shared-network-name": {
+                            "LAN": {
+                                "subnet": {
+                                    "192.168.1.0/24": {
+                                        "static-mapping": static_mappings
+                                    }
+                                }
+                            }
+                        }
+                    }
+                },
+            },
+        }
+
+        return web.json_response(data)
+
+    async def _data(self, _request: web.Request):
+        if self._is_dropped():
+            raise web.HTTPServiceUnavailable()
+
+        return web.json_response({"success": "1", "output": {}})
+
+    async def _websockets(self, request: web.Request):
+        self._increase("websockets")
+
+        ws = web.WebSocketResponse()
+
+        try:
+            await ws.prepare(request)
+
+            # Subscription payload
+            await ws.receive()
+
+            lifetime = self._random.uniform(0, WS_MAX_LIFETIME)
+            closes_at = datetime.now().timestamp() + lifetime
+
+            # Receive with a timeout closes the socket, closing is awaited aside
+            # and ends the frames loop as soon as the client closes
+            reader_task = asyncio.create_task(self._wait_for_close(ws))
+
+            try:
+                while not ws.closed and not reader_task.done():
+                    is_expired = datetime.now().timestamp() > closes_at
+
+                    if self.is_chaos_enabled and is_expired:
+                        self.statistics["dropped_websockets"] += 1
+                        break
+
+                    if not self.is_paused:
+                        await ws.send_str(self._get_frame())
+
+                    await asyncio.wait([reader_task], timeout=self._frame_interval)
+
+            except ConnectionResetError:
+                pass
+
+            finally:
+                reader_task.cancel()
+
+        finally:
+            await ws.close()
+
+            self._decrease("websockets")
+
+        return ws
+
+    def _get_frame(self) -> str:
+        sequence = self.statistics["frames"]
+
+        self.statistics["frames"] += 1
+
+        if sequence % 2 == 0:
+            self.statistics["last_sequence"] = sequence
+
+            payload = {
+                WS_SYSTEM_STATS_KEY: {
+                    "cpu": str(sequence % 100),
+                    "mem": "10",
+                    "uptime": str(sequence),
+                }
+            }
+
+        else:
+            stats = {
+                f"{direction}_{key}": str(sequence)
+                for direction in ["rx", "tx"]
+                for key in ["bps", "bytes", "errors", "packets", "dropped"]
+            }
+            stats["multicast"] = "0"
+
+            payload = {
+                WS_INTERFACES_KEY: {
+                    name: {"up": "true", "l1up": "true", "stats": stats}
+                    for name in self._interfaces
+                }
+            }
+
+        frame = json.dumps(payload)
+
+        return frame
+
+    @staticmethod
+    async def _wait_for_close(ws: web.WebSocketResponse):
+        async for message in ws:
+            if message.type != WSMsgType.TEXT:
+                break
+
+    @staticmethod
+    def _get_ssl_context(directory: str) -> ssl.SSLContext:
+        key = ec.generate_private_key(ec.SECP256R1())
+        name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+        now = datetime.utcnow()
+
+        certificate = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now)
+            .not_valid_after(now + timedelta(days=1))
+            .sign(key, hashes.SHA256())
+        )
+
+        certificate_path = os.path.join(directory, "router.crt")
+        key_path = os.path.join(directory, "router.key")
+
+        with open(certificate_path, "wb") as file:
+            file.write(certificate.public_bytes(serialization.Encoding.PEM))
+
+        with open(key_path, "wb") as file:
+            file.write(
+                key.private_bytes(
+                    serialization.Encoding.PEM,
+                    serialization.PrivateFormat.TraditionalOpenSSL,
+                    serialization.NoEncryption(),
+                )
+            )
+
+        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        ssl_context.load_cert_chain(certificate_path, key_path)
+
+        return ssl_context